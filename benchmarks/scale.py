@@ -0,0 +1,262 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Times the tools themselves against synthetic repositories of many problems.
+# Run from the project root:  python benchmarks/scale.py --sizes 100,1000
+#
+# Each size gets a fresh repo in a temporary folder: a copy of tools/ and
+# templates/, a config with several languages, a second template, and N problems
+# with READMEs of realistic (varying) length and solutions in every language.
+# Every step then runs the real script in a subprocess, end to end.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+from bench_history import git_commit
+from benchmark import format_seconds
+
+DEFAULT_SIZES = [100, 1000, 10000]
+# Appended to by --save; each line is one step of one run at one size.
+HISTORY_PATH = os.path.join("benchmarks", "tools.jsonl")
+
+LANGUAGES = {
+    "python": {"ext": "py", "boilerplate": "# Write your Python solution here\n"},
+    "csharp": {"ext": "cs", "boilerplate": "// Write your C# solution here\n"},
+    "java": {"ext": "java", "boilerplate": "// Write your Java solution here\n"},
+    "cpp": {"ext": "cpp", "boilerplate": "// Write your C++ solution here\n"},
+}
+TEMPLATES = ["problem-view", "problem-view-compact"]
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+TAGS = ["array", "hash-table", "string", "dynamic-programming", "math", "sorting", "greedy",
+        "depth-first-search", "binary-search", "tree", "graph", "two-pointers", "stack", "heap"]
+WORDS = ("given an array of integers nums and an integer target return the number of distinct "
+         "ways such that every element appears at most once in the resulting sequence you may "
+         "assume each input has exactly one solution and the answer fits in a signed integer").split()
+
+# --- Synthetic repository ---
+
+def sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+def paragraph(rng: random.Random) -> str:
+    return " ".join(sentence(rng, rng.randint(8, 24)) for _ in range(rng.randint(2, 6)))
+
+def readme(rng: random.Random, number: int, title: str) -> str:
+    """A README shaped like the real ones, between roughly 1 and 8 KB."""
+    parts = [f"# {number}. {title}\n", "## Problem Description\n"]
+    parts += [paragraph(rng) + "\n" for _ in range(rng.randint(1, 4))]
+    parts.append("## Examples\n")
+    for example in range(1, rng.randint(2, 4) + 1):
+        values = ",".join(str(rng.randint(-100, 100)) for _ in range(rng.randint(3, 40)))
+        parts.append(f"**Example {example}:**\n\n```\nInput: nums = [{values}], target = {rng.randint(0, 50)}\n"
+                     f"Output: {rng.randint(0, 9)}\nExplanation: {sentence(rng, 12)}\n```\n")
+    parts.append("## Approach\n")
+    parts += [paragraph(rng) + "\n" for _ in range(rng.randint(1, 5))]
+    parts.append("## Complexity\n\n- **Time:** O(n)\n- **Space:** O(n)\n")
+    return "\n".join(parts)
+
+def solution(rng: random.Random, lang: str) -> str:
+    lines = rng.randint(10, 80)
+    if lang == "python":
+        body = "\n".join(f"        total += nums[{i % 7}] * {i}" for i in range(lines))
+        return f"class Solution:\n    def solve(self, nums: List[int]) -> int:\n        total = 0\n{body}\n        return total\n"
+    body = "\n".join(f"        total += nums[{i % 7}] * {i};" for i in range(lines))
+    return f"public class Solution {{\n    public int Solve(int[] nums) {{\n        int total = 0;\n{body}\n        return total;\n    }}\n}}\n"
+
+def write(path: str, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content if isinstance(content, bytes) else content.encode("utf-8"))
+
+def build_repo(root: str, size: int, seed: int = 0):
+    """Creates a synthetic repository with `size` problems in `root`."""
+    rng = random.Random(seed)
+    shutil.copytree(os.path.join(ROOT, "tools"), os.path.join(root, "tools"),
+                    ignore=shutil.ignore_patterns("__pycache__", ".*", "*.sqlite3*", "*.log", "config.json"))
+    write(os.path.join(root, "tools", "config.json"),
+          json.dumps({"languages": LANGUAGES, "default_template": TEMPLATES[0]}, indent=4))
+    for template in TEMPLATES:
+        shutil.copytree(os.path.join(ROOT, "templates", TEMPLATES[0]), os.path.join(root, "templates", template))
+    template_files = {}
+    for template in TEMPLATES:
+        src_dir = os.path.join(root, "templates", template)
+        for name in os.listdir(src_dir):
+            with open(os.path.join(src_dir, name), "rb") as f:
+                template_files[(template, name)] = f.read()
+
+    for number in range(1, size + 1):
+        title = f"Synthetic Problem {number}"
+        slug = title.lower().replace(" ", "-")
+        folder = os.path.join(root, "problems", f"{number:04d}_{slug}")
+        template = rng.choice(TEMPLATES)
+        write(os.path.join(folder, "README.md"), readme(rng, number, title))
+        for lang, details in LANGUAGES.items():
+            for solution_type in ("user_solution", "leetcode_solution"):
+                write(os.path.join(folder, lang, f"{solution_type}.{details['ext']}"), solution(rng, lang))
+        for (name, file_name), content in template_files.items():
+            if name == template:
+                write(os.path.join(folder, "ui", file_name), content)
+        write(os.path.join(folder, "meta.json"), json.dumps({
+            "problem_number": number, "title": title, "slug": slug, "template": template,
+            "languages": list(LANGUAGES), "created_at": "2024-01-01T00:00:00",
+            "solved": rng.random() < 0.6, "notes_complete": False,
+            "tags": rng.sample(TAGS, rng.randint(1, 4)), "difficulty": rng.choice(DIFFICULTIES),
+            "links": {"leetcode": "", "github": "", "discussion": ""}, "constraints": {},
+        }, indent=4))
+
+    catalogue = os.path.join(root, "catalogue.csv")
+    with open(catalogue, "w", encoding="utf-8") as f:
+        f.write("number,title,difficulty,tags\n")
+        for number in range(size + 2, size + 102):
+            f.write(f"{number},Imported Problem {number},{rng.choice(DIFFICULTIES)},{';'.join(rng.sample(TAGS, 2))}\n")
+    subprocess.run([sys.executable, os.path.join("tools", "problem_index.py"), "--rebuild"],
+                   cwd=root, check=True, capture_output=True)
+
+# --- Steps ---
+
+def steps(size: int) -> List[dict]:
+    """The timed commands, in order; later steps run on the state earlier ones left."""
+    return [
+        {"name": "update_all_cold", "argv": ["update_progress.py", "--all"], "trace": True},
+        {"name": "update_all_noop", "argv": ["update_progress.py", "--all"], "trace": True},
+        {"name": "update_one", "argv": ["update_progress.py", "1", "solved=true"], "trace": True},
+        {"name": "create_problem", "argv": ["create_problem.py", str(size + 1), "Scale Probe"]},
+        {"name": "create_bulk_100", "argv": ["create_problem.py", "--from", "catalogue.csv"]},
+        {"name": "update_template", "argv": ["update_template.py", TEMPLATES[0]]},
+        {"name": "add_language", "argv": ["add_language.py", "ruby", "rb", "--boilerplate", "# Ruby\n", "--existing"]},
+    ]
+
+def phase_totals(trace_path: str) -> Dict[str, list]:
+    """
+    [milliseconds, depth] per phase: the time of every span of that name (from
+    every worker) summed, and how deeply it nests. Parents include their children.
+    """
+    totals: Dict[str, list] = defaultdict(lambda: [0.0, None])
+    if os.path.exists(trace_path):
+        with open(trace_path, "r", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                total = totals[record["span"]]
+                total[0] = round(total[0] + record["ms"], 3)
+                total[1] = record["depth"] if total[1] is None else min(total[1], record["depth"])
+    return dict(totals)
+
+def run_step(root: str, step: dict, jobs: int) -> dict:
+    argv = [sys.executable, os.path.join("tools", step["argv"][0])] + step["argv"][1:]
+    if step["argv"][0] == "update_progress.py" and "--all" in argv and jobs > 1:
+        argv += ["-j", str(jobs)]
+    trace_path = os.path.join(root, f"trace-{step['name']}.jsonl")
+    if step.get("trace"):
+        argv.append(f"--trace={trace_path}")
+    start = time.perf_counter()
+    completed = subprocess.run(argv, cwd=root, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{step['name']} exited with {completed.returncode}:\n{completed.stdout}{completed.stderr}")
+    return {"step": step["name"], "seconds": seconds, "phases": phase_totals(trace_path)}
+
+def run_size(size: int, jobs: int, seed: int, keep: Optional[str]) -> List[dict]:
+    root = os.path.join(keep, f"repo-{size}") if keep else tempfile.mkdtemp(prefix=f"lc-scale-{size}-")
+    try:
+        start = time.perf_counter()
+        build_repo(root, size, seed)
+        print(f"🏗️  Generated {size:,} problems in {root} ({format_seconds(time.perf_counter() - start)})")
+        results = []
+        for step in steps(size):
+            result = run_step(root, step, jobs)
+            result["size"] = size
+            results.append(result)
+            print(f"   {result['step']:<16} {format_seconds(result['seconds']):>10}")
+        return results
+    finally:
+        if not keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+# --- History and reporting ---
+
+def load_history(path: str = HISTORY_PATH) -> List[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def previous_results(history: List[dict], host: str) -> Dict[tuple, dict]:
+    """The latest saved result of every (size, step) on this host."""
+    latest = {}
+    for record in history:
+        if record.get("host") == host:
+            latest[(record["size"], record["step"])] = record
+    return latest
+
+def save_results(results: List[dict], jobs: int, path: str = HISTORY_PATH):
+    common = {"run": datetime.now().isoformat(timespec="seconds"), "commit": git_commit(),
+              "host": platform.node(), "python": platform.python_version(), "jobs": jobs}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps(dict(common, **result), separators=(",", ":")) + "\n")
+
+def _change(seconds: float, previous: Optional[float]) -> str:
+    return f"x{seconds / previous:.2f}" if previous else ""
+
+def print_report(results: List[dict], previous: Dict[tuple, dict]):
+    print(f"\n{'problems':>9}  {'step':<16} {'time':>10} {'per problem':>12} {'vs last':>8}")
+    print("-" * 60)
+    for result in results:
+        last = previous.get((result["size"], result["step"]))
+        print(f"{result['size']:>9,}  {result['step']:<16} {format_seconds(result['seconds']):>10} "
+              f"{format_seconds(result['seconds'] / result['size']):>12} "
+              f"{_change(result['seconds'], last and last['seconds']):>8}")
+
+    # Phase breakdown of the traced steps, so a slowdown can be pinned on one phase.
+    for result in results:
+        if not result["phases"]:
+            continue
+        last = previous.get((result["size"], result["step"]))
+        last_phases = last.get("phases", {}) if last else {}
+        print(f"\n📊 {result['step']} at {result['size']:,} problems (ms summed over all spans)")
+        for phase, (ms, depth) in sorted(result["phases"].items(), key=lambda item: (item[1][1], -item[1][0])):
+            last_ms = last_phases.get(phase, [None])[0]
+            print(f"   {'  ' * depth}{phase:<{22 - 2 * depth}} {ms:>12,.1f} {_change(ms, last_ms):>8}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the tools end to end on synthetic repositories of many problems.",
+        epilog="Example: python benchmarks/scale.py --sizes 100,1000 --save",
+    )
+    parser.add_argument("--sizes", type=lambda text: [int(size) for size in text.split(",")], default=DEFAULT_SIZES,
+                        help="comma-separated problem counts (default: 100,1000,10000)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes for update_progress --all")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the generated repositories")
+    parser.add_argument("--keep", metavar="DIR", help="generate the repositories in DIR and keep them")
+    parser.add_argument("--save", action="store_true", help=f"append the results to {HISTORY_PATH}")
+    options = parser.parse_args()
+
+    if not os.path.isdir(os.path.join("tools")) or not os.path.isdir("templates"):
+        print("❌ Error: Run this from the project root.")
+        sys.exit(1)
+
+    previous = previous_results(load_history(), platform.node())
+    results = []
+    for size in options.sizes:
+        try:
+            results += run_size(size, options.jobs, options.seed, options.keep)
+        except RuntimeError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+    print_report(results, previous)
+    if options.save:
+        save_results(results, options.jobs)
+        print(f"\n💾 Saved {len(results)} result(s) to {HISTORY_PATH}")
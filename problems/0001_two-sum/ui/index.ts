@@ -1 +1,2 @@
-export { default as ProblemViewTemplate } from "./ProblemViewTemplate";
+export { default as ProblemViewTemplate, ProblemView } from "./ProblemViewTemplate";
+export type { ProblemData } from "./ProblemViewTemplate";
@@ -10,6 +10,7 @@ import {
   CheckCircle,
   XCircle,
   Clock,
+  TrendingUp,
 } from "lucide-react";
 
 /**
@@ -19,6 +20,12 @@ import {
  * This placeholder will be replaced by a real JSON object by the `update_progress.py` script.
  * The script reads `meta.json` and solution files, aggregates them into a single JSON,
  * and injects it here, making the template fully dynamic.
+ *
+ * With `"ui_output": "data"` in tools/config.json the script writes that JSON to
+ * `ui/data.json` instead, and the viewer renders it with the `ProblemView` export below.
+ *
+ * Test results are machine-local, so they are never injected: the viewer loads the
+ * problem's test_results.json when the page opens and passes it in as `tests`.
  */
 const problemDataJson = `__PROBLEM_DATA__`;
 
@@ -30,9 +37,59 @@ type SolutionSet = {
   leetcode_solution: string;
 };
 
+// Pass/fail per solution type for one README example, written by `test_solutions.py`.
+type ExampleResults = Partial<Record<"user_solution" | "leetcode_solution", boolean>>;
+
+// Latest test results saved by `test_solutions.py` (test_results.json, not committed).
+// `examples` lines up with the README examples when they were all run.
+type TestSummary = {
+  last_run?: string;
+  total: number;
+  solutions: Record<string, { passed: number; failed: number; seconds?: number }>;
+  examples?: ExampleResults[];
+};
+
+// One performance finding for a Python solution, written by `perflint.py`.
+type LintFinding = {
+  rule: string;
+  line: number;
+  severity: "warning" | "info" | "error";
+  message: string;
+  impact: string;
+};
+
+// Latest stored benchmark results of one Python solution (`benchmark.py --save`).
+// `seconds` and `peakBytes` line up with `Performance.sizes`; null where not measured.
+type PerformanceSeries = {
+  seconds: (number | null)[];
+  peakBytes: (number | null)[];
+  timeClass: string | null;
+  spaceClass: string | null;
+  run: string;
+  commit: string | null;
+};
+
+type Performance = {
+  method: string;
+  sizes: number[];
+  solutions: Record<string, PerformanceSeries>;
+};
+
+// Where one Python solution spends its time, saved by `profile_solution.py`.
+type ProfileReport = {
+  profiled_at: string;
+  method: string;
+  size: number;
+  repeat: number;
+  seconds: number;
+  hotspots: { function: string; location: string; calls: number; self_seconds: number; total_seconds: number }[];
+  lines?: { line: number; hits: number; seconds: number; source: string }[];
+  stacks: string;
+};
+
 // The main data structure for the entire problem.
 // This mirrors the JSON that will be injected.
-interface ProblemData {
+export interface ProblemData {
   problem_number: number;
   title: string;
   difficulty: "Easy" | "Medium" | "Hard" | string;
@@ -56,16 +113,110 @@ interface ProblemData {
   spaceComplexity: string;
   notes: string;
   examples: { input: string; output: string; explanation?: string }[];
+  perflint?: { solutions: Record<string, LintFinding[]> };
+  performance?: Performance;
+  profiles?: Record<string, ProfileReport>;
 }
 
 // Default boilerplate to show if a solution file is empty.
 const defaultBoilerplate = "// Your code solution will appear here.\n// Edit the corresponding file and run the update script.";
 
+// How each solution is drawn in the scaling chart.
+const SOLUTION_STYLES: Record<string, { label: string; color: string; dash?: string }> = {
+  user_solution: { label: "Your Solution", color: "#111827" },
+  leetcode_solution: { label: "LeetCode Solution", color: "#b45309", dash: "6 4" },
+};
+
+function formatSeconds(seconds: number): string {
+  if (seconds >= 1) return `${seconds.toPrecision(3)} s`;
+  if (seconds >= 1e-3) return `${(seconds * 1e3).toPrecision(3)} ms`;
+  if (seconds >= 1e-6) return `${(seconds * 1e6).toPrecision(3)} µs`;
+  return `${(seconds * 1e9).toPrecision(3)} ns`;
+}
+
+function formatBytes(bytes: number): string {
+  if (bytes >= 1024 ** 2) return `${(bytes / 1024 ** 2).toPrecision(3)} MiB`;
+  if (bytes >= 1024) return `${(bytes / 1024).toPrecision(3)} KiB`;
+  return `${bytes} B`;
+}
+
+// Time per call against input size on log-log axes, one line per solution.
+// A steeper line grows faster: slope 1 is O(n), slope 2 is O(n^2).
+function ScalingChart({ sizes, solutions }: { sizes: number[]; solutions: Record<string, PerformanceSeries> }) {
+  const width = 560;
+  const height = 260;
+  const pad = { left: 64, right: 16, top: 12, bottom: 40 };
+  const series = Object.entries(solutions).map(([type, result]) => ({
+    type,
+    points: sizes
+      .map((n, i) => [n, result.seconds[i]] as const)
+      .filter((point): point is readonly [number, number] => point[1] !== null && point[1] > 0),
+  }));
+  const values = series.flatMap((line) => line.points.map(([, seconds]) => seconds));
+  if (values.length === 0) return null;
+
+  const xMin = Math.log10(sizes[0]);
+  const xMax = Math.log10(sizes[sizes.length - 1]);
+  const yMin = Math.floor(Math.log10(Math.min(...values)));
+  const yMax = Math.max(yMin + 1, Math.ceil(Math.log10(Math.max(...values))));
+  const x = (n: number) => pad.left + ((Math.log10(n) - xMin) / (xMax - xMin || 1)) * (width - pad.left - pad.right);
+  const y = (seconds: number) =>
+    height - pad.bottom - ((Math.log10(seconds) - yMin) / (yMax - yMin)) * (height - pad.top - pad.bottom);
+  const decades = Array.from({ length: yMax - yMin + 1 }, (_, i) => 10 ** (yMin + i));
 
-export default function ProblemViewTemplate() {
+  return (
+    <svg viewBox={`0 0 ${width} ${height}`} className="w-full" role="img" aria-label="Time per call by input size">
+      {decades.map((seconds) => (
+        <g key={seconds}>
+          <line x1={pad.left} x2={width - pad.right} y1={y(seconds)} y2={y(seconds)} stroke="#e5e7eb" />
+          <text x={pad.left - 6} y={y(seconds)} textAnchor="end" dominantBaseline="middle" fontSize="10" fill="#374151">
+            {formatSeconds(seconds)}
+          </text>
+        </g>
+      ))}
+      {sizes.map((n) => (
+        <text key={n} x={x(n)} y={height - pad.bottom + 16} textAnchor="middle" fontSize="10" fill="#374151">
+          {n.toLocaleString()}
+        </text>
+      ))}
+      <text x={(pad.left + width - pad.right) / 2} y={height - 6} textAnchor="middle" fontSize="11" fill="#111827">
+        input size n
+      </text>
+      <line x1={pad.left} x2={pad.left} y1={pad.top} y2={height - pad.bottom} stroke="#111827" strokeWidth={2} />
+      <line x1={pad.left} x2={width - pad.right} y1={height - pad.bottom} y2={height - pad.bottom} stroke="#111827" strokeWidth={2} />
+      {series.map(({ type, points }) => {
+        const style = SOLUTION_STYLES[type] ?? { label: type, color: "#6b7280" };
+        return (
+          <g key={type}>
+            <polyline
+              fill="none"
+              stroke={style.color}
+              strokeWidth={2}
+              strokeDasharray={style.dash}
+              points={points.map(([n, seconds]) => `${x(n)},${y(seconds)}`).join(" ")}
+            />
+            {points.map(([n, seconds]) => (
+              <circle key={n} cx={x(n)} cy={y(seconds)} r={3} fill={style.color}>
+                <title>{`${style.label}: n = ${n.toLocaleString()}, ${formatSeconds(seconds)} per call`}</title>
+              </circle>
+            ))}
+          </g>
+        );
+      })}
+    </svg>
+  );
+}
+
+
+export default function ProblemViewTemplate({ tests }: { tests?: TestSummary }) {
   // Parse the injected JSON data.
   // In a real app, you would add error handling here.
   const data: ProblemData = JSON.parse(problemDataJson);
+  return <ProblemView data={data} tests={tests} />;
+}
+
+// Renders one problem from its data. Shared by every problem in data-only mode.
+export function ProblemView({ data, tests }: { data: ProblemData; tests?: TestSummary }) {
 
   const {
     problem_number,
@@ -82,14 +233,21 @@ export default function ProblemViewTemplate() {
     timeComplexity,
     spaceComplexity,
     notes,
-    examples
+    perflint,
+    performance,
+    profiles
   } = data;
   
+  // Per-example pass/fail only applies when the run covered the current README examples.
+  const exampleResults = tests?.examples?.length === data.examples.length ? tests.examples : undefined;
+  const examples = data.examples.map((example, i) => ({ ...example, results: exampleResults?.[i] }));
+
   // --- STATE MANAGEMENT ---
   // State to track the currently selected language. Defaults to the first available language.
   const [selectedLang, setSelectedLang] = React.useState<string>(Object.keys(code)[0] || "python");
   // State to toggle between the user's solution and the official LeetCode solution.
   const [solutionType, setSolutionType] = React.useState<"user" | "leetcode">("user");
+  const profile = selectedLang === "python" ? profiles?.[solutionType === "user" ? "user_solution" : "leetcode_solution"] : undefined;
 
   // Determine the color for the difficulty badge based on the value.
   const difficultyColor =
@@ -250,9 +408,173 @@ export default function ProblemViewTemplate() {
                     {code[selectedLang]?.[solutionType === "user" ? "user_solution" : "leetcode_solution"] || defaultBoilerplate}
                   </code>
                 </pre>
+
+                {/* Performance findings for the Python solution on display */}
+                {selectedLang === "python" &&
+                  (perflint?.solutions[solutionType === "user" ? "user_solution" : "leetcode_solution"] ?? []).length > 0 && (
+                    <ul className="mt-3 space-y-2 text-sm">
+                      {perflint!.solutions[solutionType === "user" ? "user_solution" : "leetcode_solution"].map((finding, i) => (
+                        <li
+                          key={i}
+                          className={`rounded border-2 p-2 ${
+                            finding.severity === "info" ? "border-gray-400 bg-gray-50" : "border-yellow-600 bg-yellow-50"
+                          }`}
+                        >
+                          <div className="font-semibold">
+                            Line {finding.line}: {finding.message}{" "}
+                            <span className="font-mono text-xs text-gray-600">[{finding.rule}]</span>
+                          </div>
+                          <div className="text-gray-700">{finding.impact}</div>
+                        </li>
+                      ))}
+                    </ul>
+                  )}
+
+                {/* Profile of the Python solution on display */}
+                {profile && (
+                  <div className="mt-3 rounded border-2 border-gray-900 p-3 text-sm">
+                    <div className="font-semibold">
+                      Where time goes at n = {profile.size.toLocaleString()} ({formatSeconds(profile.seconds / profile.repeat)} per call under cProfile)
+                    </div>
+                    <table className="mt-2 w-full text-xs">
+                      <thead className="text-left text-gray-600">
+                        <tr>
+                          <th className="pr-2">Own time</th>
+                          <th className="pr-2">Total</th>
+                          <th className="pr-2">Calls</th>
+                          <th>Function</th>
+                        </tr>
+                      </thead>
+                      <tbody className="font-mono">
+                        {profile.hotspots.slice(0, 5).map((hotspot, i) => (
+                          <tr key={i}>
+                            <td className="pr-2">{formatSeconds(hotspot.self_seconds)}</td>
+                            <td className="pr-2">{formatSeconds(hotspot.total_seconds)}</td>
+                            <td className="pr-2">{hotspot.calls.toLocaleString()}</td>
+                            <td>
+                              {hotspot.function} <span className="text-gray-500">({hotspot.location})</span>
+                            </td>
+                          </tr>
+                        ))}
+                      </tbody>
+                    </table>
+                    {profile.lines && profile.lines.length > 0 && (() => {
+                      const total = profile.lines.reduce((sum, line) => sum + line.seconds, 0) || 1;
+                      return (
+                        <div className="mt-3 font-mono text-xs">
+                          {profile.lines.map((line) => (
+                            <div key={line.line} className="relative flex gap-2 whitespace-pre">
+                              <div
+                                className="absolute inset-y-0 left-0 bg-red-100"
+                                style={{ width: `${(line.seconds / total) * 100}%` }}
+                              />
+                              <span className="relative w-10 text-right text-gray-500">{line.line}</span>
+                              <span className="relative w-20 text-right">{line.hits.toLocaleString()}×</span>
+                              <span className="relative w-12 text-right">{((line.seconds / total) * 100).toFixed(1)}%</span>
+                              <span className="relative">{line.source}</span>
+                            </div>
+                          ))}
+                        </div>
+                      );
+                    })()}
+                    <div className="mt-2 text-xs text-gray-600">
+                      Flame graph input: <code>{profile.stacks}</code>
+                    </div>
+                  </div>
+                )}
               </div>
             </article>
 
+            {/* EXAMPLES */}
+            {examples.length > 0 && (
+              <section className="mt-6 rounded-lg border-4 border-gray-900 bg-white p-6 shadow-lg">
+                <h3 className="font-bold text-lg">Examples</h3>
+                <div className="mt-3 space-y-3">
+                  {examples.map((example, i) => (
+                    <div key={i} className="rounded border-2 border-gray-900 p-3 bg-gray-50 text-sm">
+                      <div className="flex items-center justify-between gap-2">
+                        <h4 className="font-semibold">Example {i + 1}</h4>
+                        {example.results && (
+                          <div className="flex items-center gap-2 text-xs font-semibold">
+                            {Object.entries(example.results).map(([solution, passed]) => (
+                              <span
+                                key={solution}
+                                className={`flex items-center gap-1 ${passed ? "text-green-700" : "text-red-700"}`}
+                              >
+                                {passed ? <CheckCircle size={12} /> : <XCircle size={12} />}
+                                {solution === "user_solution" ? "Yours" : "LeetCode"}
+                              </span>
+                            ))}
+                          </div>
+                        )}
+                      </div>
+                      <p className="mt-2 font-mono"><strong>Input:</strong> {example.input}</p>
+                      <p className="font-mono"><strong>Output:</strong> {example.output}</p>
+                      {example.explanation && (
+                        <p className="mt-1 text-gray-700"><strong>Explanation:</strong> {example.explanation}</p>
+                      )}
+                    </div>
+                  ))}
+                </div>
+              </section>
+            )}
+
+            {/* MEASURED PERFORMANCE */}
+            {performance && (
+              <section className="mt-6 rounded-lg border-4 border-gray-900 bg-white p-6 shadow-lg">
+                <h3 className="font-bold text-lg flex items-center gap-2">
+                  <TrendingUp size={18} /> Performance
+                </h3>
+                <p className="mt-1 text-xs text-gray-600">
+                  Median time per call of <code>{performance.method}</code> (Python) by input size, both axes logarithmic.
+                </p>
+                <div className="mt-3">
+                  <ScalingChart sizes={performance.sizes} solutions={performance.solutions} />
+                </div>
+                <div className="mt-2 flex flex-wrap gap-4 text-xs font-semibold">
+                  {Object.keys(performance.solutions).map((type) => {
+                    const style = SOLUTION_STYLES[type] ?? { label: type, color: "#6b7280" };
+                    return (
+                      <span key={type} className="flex items-center gap-2">
+                        <svg width="24" height="8">
+                          <line x1="0" x2="24" y1="4" y2="4" stroke={style.color} strokeWidth={2} strokeDasharray={style.dash} />
+                        </svg>
+                        {style.label}
+                      </span>
+                    );
+                  })}
+                </div>
+                <table className="mt-4 w-full text-sm border-2 border-gray-900">
+                  <thead className="bg-gray-100 text-left">
+                    <tr>
+                      <th className="p-2">Solution</th>
+                      <th className="p-2">Fitted time</th>
+                      <th className="p-2">Fitted space</th>
+                      <th className="p-2">Peak memory (largest n)</th>
+                      <th className="p-2">Measured</th>
+                    </tr>
+                  </thead>
+                  <tbody>
+                    {Object.entries(performance.solutions).map(([type, result]) => {
+                      const peak = [...result.peakBytes].reverse().find((bytes) => bytes !== null);
+                      return (
+                        <tr key={type} className="border-t-2 border-gray-900">
+                          <td className="p-2 font-semibold">{SOLUTION_STYLES[type]?.label ?? type}</td>
+                          <td className="p-2 font-mono">{result.timeClass ?? "—"}</td>
+                          <td className="p-2 font-mono">{result.spaceClass ?? "—"}</td>
+                          <td className="p-2">{peak != null ? formatBytes(peak) : "—"}</td>
+                          <td className="p-2 text-gray-600">
+                            {new Date(result.run).toLocaleDateString("en-US")}
+                            {result.commit && <span className="font-mono"> @ {result.commit.slice(0, 7)}</span>}
+                          </td>
+                        </tr>
+                      );
+                    })}
+                  </tbody>
+                </table>
+              </section>
+            )}
+
             {/* NOTES */}
             <motion.section
               initial={{ y: 6, opacity: 0 }}
@@ -290,6 +612,26 @@ export default function ProblemViewTemplate() {
                   <strong>Created:</strong> {formattedDate}
                 </li>
               </ul>
+              {/* TEST RESULTS */}
+              {tests && (
+                <div className="mt-4 border-t-2 border-gray-900 pt-4">
+                  <h5 className="font-semibold text-base mb-3">Tests ({tests.total} cases)</h5>
+                  {tests.last_run && (
+                    <p className="-mt-2 mb-3 text-xs text-gray-600">
+                      Last run {new Date(tests.last_run).toLocaleString("en-US")}
+                    </p>
+                  )}
+                  <ul className="text-sm space-y-2">
+                    {Object.entries(tests.solutions).map(([solution, result]) => (
+                      <li key={solution} className={result.failed ? "text-red-700" : "text-green-700"}>
+                        <strong>{solution === "user_solution" ? "Your Solution" : "LeetCode Solution"}:</strong>{" "}
+                        {result.passed}/{result.passed + result.failed} passed
+                        {result.seconds !== undefined && <> in {(result.seconds * 1000).toFixed(2)} ms</>}
+                      </li>
+                    ))}
+                  </ul>
+                </div>
+              )}
               {/* DYNAMIC QUICK LINKS */}
               <div className="mt-4 border-t-2 border-gray-900 pt-4">
                  <h5 className="font-semibold text-base mb-3">Quick Links</h5>
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The tools are flat scripts that import each other by module name, as they do
+# when run as `python tools/<script>.py` from the repository root.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
@@ -0,0 +1,44 @@
+from perflint import lint_source
+
+def rules(source: str):
+    return [finding["rule"] for finding in lint_source(source)]
+
+def test_pop_front_on_a_list_is_reported():
+    source = (
+        "def drain(queue):\n"
+        "    items = [1, 2, 3]\n"
+        "    items.pop(0)\n"
+        "    queue.pop(0)\n"
+    )
+    assert rules(source) == ["pop-front", "pop-front"]
+
+def test_pop_front_on_a_dict_or_set_is_not_reported():
+    source = (
+        "from typing import Dict\n"
+        "def forget(counts: Dict[int, int]):\n"
+        "    seen = {}\n"
+        "    seen.pop(0)\n"
+        "    counts.pop(0)\n"
+        "    dict(a=1).pop(0)\n"
+    )
+    assert rules(source) == []
+
+def test_insert_front_on_a_list_is_reported():
+    source = (
+        "def push(stack):\n"
+        "    items = list(stack)\n"
+        "    items.insert(0, 1)\n"
+        "    stack.insert(0, 1)\n"
+    )
+    assert rules(source) == ["insert-front", "insert-front"]
+
+def test_insert_front_on_a_known_non_list_is_not_reported():
+    source = (
+        "from typing import Dict\n"
+        "def place(board: Dict[int, str], name: str):\n"
+        "    slots = {}\n"
+        "    slots.insert(0, 1)\n"
+        "    board.insert(0, 'x')\n"
+        "    name.insert(0, 'x')\n"
+    )
+    assert rules(source) == []
@@ -0,0 +1,33 @@
+from readme_parser import find_section, parse_text
+from update_progress import parse_readme
+
+DECORATED = """# 1. Two Sum
+
+## Problem Description
+Return the indices of the two numbers that add up to `target`.
+
+## approach: Hash Map
+One pass, remembering each number's index.
+
+## Complexity
+- **Time:** O(n)
+- **Space:** O(n)
+
+## Notes & Edge Cases
+Duplicates such as [3, 3] work because the lookup happens before the insert.
+"""
+
+def test_find_section_matches_decorated_titles_by_prefix():
+    sections = parse_text(DECORATED)["sections"]
+    assert find_section(sections, "Approach") == "One pass, remembering each number's index."
+    assert find_section(sections, "Notes").startswith("Duplicates such as [3, 3]")
+    assert find_section(sections, "Constraints") == ""
+
+def test_parse_readme_reads_decorated_headings(tmp_path):
+    readme = tmp_path / "README.md"
+    readme.write_text(DECORATED, encoding="utf-8")
+    data = parse_readme(str(readme))
+    assert data["statement"] == "Return the indices of the two numbers that add up to `target`."
+    assert data["approach"] == "One pass, remembering each number's index."
+    assert data["notes"].startswith("Duplicates such as [3, 3]")
+    assert (data["timeComplexity"], data["spaceComplexity"]) == ("O(n)", "O(n)")
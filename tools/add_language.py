@@ -1,75 +1,126 @@
 import os
-import sys
 import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
-CONFIG_PATH = os.path.join("tools", "config.json")
+import core
+from core import CONFIG_PATH
+from db import update_db_entries
+from fileio import Batch, locked, problem_lock, write_json
+from problem_index import problem_folders, update_index_entries
+
+# Fan-out to existing problems is small-file I/O, so threads overlap it well.
+DEFAULT_WRITERS = min(32, (os.cpu_count() or 1) * 4)
 
 def load_config():
     if not os.path.exists(CONFIG_PATH):
         print("⚙️ Config not found. Creating new one...")
         return {"languages": {}, "default_template": "problem-view"}
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return core.load_config()
 
 def save_config(config):
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=4)
+    write_json(CONFIG_PATH, config)
     print(f"✅ Saved config to {CONFIG_PATH}")
 
-def add_language(lang_name, ext, boilerplate):
-    config = load_config()
+def add_language(lang_name, ext, boilerplate, existing: Optional[bool] = None, writers: int = DEFAULT_WRITERS):
+    """
+    Registers a language in the config. `existing` says whether to also add it to
+    every existing problem; None asks interactively.
+    """
+    with locked("config"):
+        config = load_config()
 
-    if lang_name in config["languages"]:
-        print(f"⚠️ Language '{lang_name}' already exists in config.")
-        return
+        if lang_name in config["languages"]:
+            print(f"⚠️ Language '{lang_name}' already exists in config.")
+            return
 
-    config["languages"][lang_name] = {
-        "ext": ext,
-        "boilerplate": boilerplate
-    }
+        config["languages"][lang_name] = {
+            "ext": ext,
+            "boilerplate": boilerplate
+        }
 
-    save_config(config)
+        save_config(config)
     print(f"✨ Added new language: {lang_name} (.{ext})")
 
-    # Ask if user wants to add this language to existing problems
-    choice = input("Would you like to add this language to existing problems? (y/n): ").lower()
-    if choice == "y":
-        add_to_existing_problems(lang_name, ext, boilerplate)
-
-def add_to_existing_problems(lang_name, ext, boilerplate):
+    if existing is None:
+        # Ask if user wants to add this language to existing problems
+        existing = input("Would you like to add this language to existing problems? "
+                         "This also lists it in each meta.json. (y/n): ").lower() == "y"
+    if existing:
+        add_to_existing_problems(lang_name, ext, boilerplate, writers)
+
+def _add_to_problem(path, lang_name, ext, boilerplate) -> Tuple[int, Optional[dict]]:
+    """
+    Adds the language's solution files to one problem and lists the language in
+    its meta.json. Returns how many solution files were written, and the new
+    metadata if meta.json changed.
+    """
+    lang_dir = os.path.join(path, lang_name)
+    added = 0
+    updated = None
+    with problem_lock(path), Batch() as batch:
+        for solution_type in ["user_solution", "leetcode_solution"]:
+            file_path = os.path.join(lang_dir, f"{solution_type}.{ext}")
+            if not os.path.exists(file_path):
+                batch.write(file_path, boilerplate)
+                added += 1
+
+        # The UI only shows the languages listed in meta.json.
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+            if lang_name not in metadata.setdefault("languages", []):
+                metadata["languages"].append(lang_name)
+                batch.write_json(meta_path, metadata)
+                updated = metadata
+    return added, updated
+
+def add_to_existing_problems(lang_name, ext, boilerplate, writers: int = DEFAULT_WRITERS):
     problems_dir = "problems"
     if not os.path.exists(problems_dir):
         print("⚠️ No problems directory found. Skipping.")
         return
 
-    for problem_folder in os.listdir(problems_dir):
-        path = os.path.join(problems_dir, problem_folder)
-        if not os.path.isdir(path):
-            continue
-
-        lang_dir = os.path.join(path, lang_name)
-        os.makedirs(lang_dir, exist_ok=True)
-
-        for solution_type in ["user_solution", "leetcode_solution"]:
-            file_path = os.path.join(lang_dir, f"{solution_type}.{ext}")
-            if not os.path.exists(file_path):
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(boilerplate)
-                print(f"🧩 Added {file_path}")
+    folders = problem_folders()
+    with ThreadPoolExecutor(max_workers=max(1, writers)) as pool:
+        results = list(pool.map(lambda path: _add_to_problem(path, lang_name, ext, boilerplate), folders))
+    # meta.json "languages" is mirrored in the problem index and the database.
+    updates = [(path, metadata) for path, (_, metadata) in zip(folders, results) if metadata is not None]
+    update_index_entries(updates)
+    update_db_entries(updates)
+    print(f"🧩 Added {sum(added for added, _ in results)} file(s) across {len(folders)} problem(s).")
+    print(f"🗂️  Listed {lang_name} in {len(updates)} meta.json file(s); "
+          "rebuild the UIs with: python tools/update_progress.py --all")
     print("✅ Added new language to all existing problems.")
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python tools/add_language.py <language_name> <file_extension>")
-        print("Example: python tools/add_language.py typescript ts")
-        sys.exit(1)
-
-    lang_name = sys.argv[1].lower()
-    ext = sys.argv[2].lower()
+    parser = argparse.ArgumentParser(
+        description="Register a new solution language, optionally adding it to every existing problem.",
+        epilog="Example: python tools/add_language.py typescript ts --existing",
+    )
+    parser.add_argument("language_name")
+    parser.add_argument("file_extension")
+    parser.add_argument("--boilerplate", help="starter text for new solution files (skips the prompt)")
+    fan_out = parser.add_mutually_exclusive_group()
+    fan_out.add_argument("--existing", dest="existing", action="store_true", default=None,
+                         help="add the language to every existing problem without asking: creates its "
+                              "solution files and appends it to each meta.json \"languages\" list")
+    fan_out.add_argument("--no-existing", dest="existing", action="store_false",
+                         help="only register the language; don't touch existing problems")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_WRITERS,
+                        help="file-writing threads for the fan-out (default: %(default)s)")
+    options = parser.parse_args()
+
+    lang_name = options.language_name.lower()
+    ext = options.file_extension.lower()
     print(f"Adding new language: {lang_name} (.{ext})")
 
-    boilerplate = input("Enter boilerplate text for this language (press Enter for default): ").strip()
+    boilerplate = options.boilerplate
+    if boilerplate is None:
+        boilerplate = input("Enter boilerplate text for this language (press Enter for default): ").strip()
     if not boilerplate:
         boilerplate = f"// Write your {lang_name.capitalize()} solution here\n"
 
-    add_language(lang_name, ext, boilerplate)
+    add_language(lang_name, ext, boilerplate, options.existing, options.jobs)
@@ -0,0 +1,419 @@
+import os
+import sys
+import json
+import math
+import random
+import hashlib
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from benchmark import format_bytes, format_seconds, percentile
+from fileio import append_line
+
+# Append-only history of benchmark runs, one JSON object per (run, solution, size):
+#   {"run": "2024-05-01T12:00:00.123456", "problem": "0001_two-sum", "language": "python",
+#    "solution": "user_solution", "size": 1000, "file_hash": "3f2a...", "commit": "ab12...",
+#    "seed": 0, "host": "...", "python": "3.11.4", "metric": "time", "samples": [...], "median": ...}
+# Memory runs (`benchmark.py --memory --save`) have "metric": "memory" and store
+# "peak_bytes" and "retained_blocks" instead of samples. Records written before
+# memory runs existed have no "metric" and are timings.
+# It is committed, so every clone shares the history.
+RESULTS_PATH = os.path.join("benchmarks", "results.jsonl")
+
+# Versions are compared by the medians of separate runs: samples within one run
+# share that run's machine state, so they understate the noise between runs. A
+# change counts when the medians differ by more than THRESHOLD and the difference
+# is significant: Mann-Whitney p < ALPHA and a bootstrap confidence interval of the
+# median ratio that excludes 1. With fewer than MIN_RUNS runs of either version
+# no verdict is given (with 5 and 5, perfectly separated runs reach p ~ 0.01).
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_ALPHA = 0.05
+DEFAULT_MIN_RUNS = 5
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE = 95
+
+# --- The results store ---
+
+def git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def record_report(problem_folder: str, report: dict, paths: Dict[str, str], seed: int,
+                  metric: str = "time", results_path: str = RESULTS_PATH) -> int:
+    """
+    Appends one record per solution and size of a `benchmark_problem` report
+    (or, with metric="memory", a `memory_problem` report). `paths` maps solution
+    type -> solution file, whose hash keys the record. Returns the number of records written.
+    """
+    # Microseconds keep two runs saved within the same second apart.
+    run = datetime.now().isoformat(timespec="microseconds")
+    common = {
+        "run": run,
+        "problem": os.path.basename(problem_folder),
+        "language": "python",
+        "commit": git_commit(),
+        "seed": seed,
+        "host": platform.node(),
+        "python": platform.python_version(),
+    }
+    lines = []
+    for solution_type, records in report["results"].items():
+        hashed = file_hash(paths[solution_type])
+        for record in records:
+            if record.get("skipped"):
+                continue
+            entry = dict(common, solution=solution_type, method=report["method"], size=record["size"],
+                         file_hash=hashed, metric=metric)
+            if metric == "memory":
+                entry.update(peak_bytes=record["peak_bytes"], retained_blocks=record["retained_blocks"])
+            else:
+                entry.update(samples=record["samples"], median=record["median"])
+            lines.append(json.dumps(entry, separators=(",", ":")))
+
+    if lines:
+        # One O_APPEND write for the whole run, so concurrent saves never interleave records.
+        append_line(results_path, "\n".join(lines))
+    return len(lines)
+
+def load_results(problem: Optional[str] = None, results_path: str = RESULTS_PATH) -> List[dict]:
+    """
+    Every stored record, oldest first, optionally for one problem folder name.
+    Lines that are not records (a merge conflict marker, a truncated write) are
+    skipped with a warning rather than failing every tool that reads the store.
+    """
+    if not os.path.exists(results_path):
+        return []
+    records = []
+    skipped = []
+    with open(results_path, "r", encoding="utf-8", errors="replace") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict) or not isinstance(record.get("problem"), str):
+                skipped.append(number)
+                continue
+            if problem is None or record["problem"] == problem:
+                records.append(record)
+    if skipped:
+        lines = ", ".join(map(str, skipped[:5])) + (", ..." if len(skipped) > 5 else "")
+        print(f"⚠️ Warning: Skipped {len(skipped)} unreadable line(s) in {results_path} (line {lines})")
+    return records
+
+_results_cache: Tuple[Optional[tuple], Dict[str, List[dict]]] = (None, {})
+
+def results_by_problem(results_path: str = RESULTS_PATH) -> Dict[str, List[dict]]:
+    """Every stored record grouped by problem. Re-read only when the store changes."""
+    global _results_cache
+    try:
+        stat = os.stat(results_path)
+    except OSError:
+        return {}
+    key = (results_path, stat.st_mtime_ns, stat.st_size)
+    if _results_cache[0] != key:
+        grouped: Dict[str, List[dict]] = {}
+        for record in load_results(results_path=results_path):
+            grouped.setdefault(record["problem"], []).append(record)
+        _results_cache = (key, grouped)
+    return _results_cache[1]
+
+def results_fingerprint(problem: str) -> Optional[str]:
+    """Changes whenever a run of `problem` is recorded; stored in the build manifest."""
+    records = results_by_problem().get(problem)
+    return f"{len(records)}:{records[-1]['run']}" if records else None
+
+# --- The UI's performance section ---
+
+def _fitted_class(sizes: List[int], values: List[Optional[float]]) -> Optional[str]:
+    # complexity.py imports update_progress, which imports this module.
+    from complexity import fit_complexity
+
+    points = [(size, value) for size, value in zip(sizes, values) if value is not None]
+    if len(points) < 3:
+        return None
+    return fit_complexity([size for size, _ in points], [value for _, value in points])[0]["label"]
+
+def performance_section(problem_folder: str, paths: Dict[str, str]) -> Optional[dict]:
+    """
+    The latest stored timings and peak memory of each Python solution, for the
+    problem's UI payload:
+
+        {"method": "twoSum", "sizes": [100, 1000, ...],
+         "solutions": {"user_solution": {"seconds": [...], "peakBytes": [...],
+                                         "timeClass": "O(n^2)", "spaceClass": "O(1)",
+                                         "run": "...", "commit": "..."}, ...}}
+
+    `seconds` and `peakBytes` line up with `sizes` (null where a size was not
+    measured). Only runs of the solution file as it is now are used, so timings
+    of an old version never show up next to new code.
+    """
+    records = results_by_problem().get(os.path.basename(problem_folder))
+    if not records:
+        return None
+    latest: Dict[str, Dict[Tuple[str, int], dict]] = {}
+    for solution_type, path in paths.items():
+        if not os.path.exists(path):
+            continue
+        current = file_hash(path)
+        for record in records:
+            if record["solution"] == solution_type and record["file_hash"] == current:
+                latest.setdefault(solution_type, {})[(record.get("metric", "time"), record["size"])] = record
+    if not latest:
+        return None
+
+    sizes = sorted({size for measured in latest.values() for _, size in measured})
+    solutions = {}
+    for solution_type, measured in latest.items():
+        timings = [measured[("time", size)]["median"] if ("time", size) in measured else None for size in sizes]
+        memory = [measured[("memory", size)]["peak_bytes"] if ("memory", size) in measured else None
+                  for size in sizes]
+        newest = max(measured.values(), key=lambda record: record["run"])
+        solutions[solution_type] = {
+            "seconds": timings,
+            "peakBytes": memory,
+            "timeClass": _fitted_class(sizes, timings),
+            "spaceClass": _fitted_class(sizes, memory),
+            "run": newest["run"],
+            "commit": newest.get("commit"),
+        }
+    method = next(iter(next(iter(latest.values())).values())).get("method")
+    return {"method": method, "sizes": sizes, "solutions": solutions}
+
+# --- Statistics ---
+
+def mann_whitney(base: List[float], head: List[float]) -> float:
+    """
+    Two-sided p-value of the Mann-Whitney U test, from the normal approximation
+    with tie and continuity corrections. Makes no assumption about the shape of
+    the timing distributions, which are usually skewed by scheduler noise.
+    """
+    n1, n2 = len(base), len(head)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted([(value, 0) for value in base] + [(value, 1) for value in head])
+    rank_sum, ties, i = 0.0, 0, 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        group = j - i + 1
+        ties += group ** 3 - group
+        rank_sum += rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        i = j + 1
+
+    n = n1 + n2
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = max(0.0, abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return math.erfc(z / math.sqrt(2))
+
+def bootstrap_ratio(base: List[float], head: List[float], resamples: int = BOOTSTRAP_RESAMPLES,
+                    confidence: float = CONFIDENCE, seed: int = 0) -> Tuple[float, float]:
+    """Percentile bootstrap confidence interval of median(head) / median(base)."""
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(resamples):
+        base_median = statistics.median(rng.choices(base, k=len(base)))
+        head_median = statistics.median(rng.choices(head, k=len(head)))
+        ratios.append(head_median / base_median if base_median > 0 else float("inf"))
+    ratios.sort()
+    tail = (100 - confidence) / 2
+    return percentile(ratios, tail), percentile(ratios, 100 - tail)
+
+def compare_samples(base: List[float], head: List[float], threshold: float = DEFAULT_THRESHOLD,
+                    alpha: float = DEFAULT_ALPHA, min_runs: int = DEFAULT_MIN_RUNS) -> dict:
+    """
+    Classifies head against base as "regression", "improvement" or "unchanged",
+    or "too few runs" when either side has fewer than `min_runs` values. Each
+    value should be the median of one separate run (see run_medians).
+    """
+    base_median, head_median = statistics.median(base), statistics.median(head)
+    ratio = head_median / base_median if base_median > 0 else float("inf")
+    p_value = mann_whitney(base, head)
+    low, high = bootstrap_ratio(base, head)
+    verdict = "unchanged"
+    if min(len(base), len(head)) < min_runs:
+        verdict = "too few runs"
+    elif p_value < alpha and ratio > 1 + threshold and low > 1:
+        verdict = "regression"
+    elif p_value < alpha and ratio < 1 - threshold and high < 1:
+        verdict = "improvement"
+    return {"base": base_median, "head": head_median, "ratio": ratio, "p": p_value,
+            "ci": (low, high), "runs": (len(base), len(head)), "verdict": verdict}
+
+# --- Choosing what to compare ---
+
+def _matches(record: dict, ref: str) -> bool:
+    return any((record.get(key) or "").startswith(ref) for key in ("file_hash", "commit", "run"))
+
+def versions(records: List[dict]) -> List[str]:
+    """Distinct solution file hashes, ordered by when each was last benchmarked."""
+    last_seen = {record["file_hash"]: position for position, record in enumerate(records)}
+    return sorted(last_seen, key=last_seen.get)
+
+def select(records: List[dict], base_ref: Optional[str], head_ref: Optional[str]) -> Tuple[List[dict], List[dict]]:
+    """
+    Picks the base and head records of one solution. By default head is the newest
+    version of the solution file and base the version benchmarked before it.
+    A ref is a prefix of a file hash, a git commit or a run timestamp.
+    """
+    hashes = versions(records)
+    if head_ref:
+        head = [record for record in records if _matches(record, head_ref)]
+    else:
+        head = [record for record in records if hashes and record["file_hash"] == hashes[-1]]
+    if base_ref:
+        base = [record for record in records if _matches(record, base_ref)]
+    else:
+        head_hashes = {record["file_hash"] for record in head}
+        older = [h for h in hashes if h not in head_hashes]
+        base = [record for record in records if older and record["file_hash"] == older[-1]]
+    return base, head
+
+def run_medians(records: List[dict]) -> Dict[int, List[float]]:
+    """Size -> the median time of each separate run at that size."""
+    samples: Dict[Tuple[int, str], List[float]] = {}
+    for record in records:
+        samples.setdefault((record["size"], record["run"]), []).extend(record["samples"])
+    by_size: Dict[int, List[float]] = {}
+    for (size, _), values in samples.items():
+        by_size.setdefault(size, []).append(statistics.median(values))
+    return by_size
+
+def compare_problem(problem: str, solution: Optional[str] = None, base_ref: Optional[str] = None,
+                    head_ref: Optional[str] = None, threshold: float = DEFAULT_THRESHOLD,
+                    alpha: float = DEFAULT_ALPHA, host: Optional[str] = None,
+                    results_path: str = RESULTS_PATH, min_runs: int = DEFAULT_MIN_RUNS) -> List[dict]:
+    """
+    One comparison row per solution and shared size of a problem's history.
+    With `host`, only runs recorded on that machine are considered.
+    """
+    records = [record for record in load_results(problem, results_path)
+               if record.get("metric", "time") == "time" and (host is None or record.get("host") == host)]
+    rows = []
+    for solution_type in sorted({record["solution"] for record in records}):
+        if solution and solution_type != solution:
+            continue
+        base, head = select([r for r in records if r["solution"] == solution_type], base_ref, head_ref)
+        if not base or not head:
+            continue
+        base_runs, head_runs = run_medians(base), run_medians(head)
+        for size in sorted(set(base_runs) & set(head_runs)):
+            row = compare_samples(base_runs[size], head_runs[size], threshold, alpha, min_runs)
+            row.update(problem=problem, solution=solution_type, size=size,
+                       base_version=base[-1]["file_hash"][:10], head_version=head[-1]["file_hash"][:10])
+            rows.append(row)
+    return rows
+
+# --- Reports ---
+
+VERDICT_ICONS = {"regression": "❌", "improvement": "⚡", "unchanged": "  ", "too few runs": "⚠️"}
+
+def print_comparison(rows: List[dict]):
+    print(f"\n{'problem':<22} {'solution':<18} {'n':>8} {'runs':>7} {'base':>10} {'head':>10} {'change':>8} "
+          f"{'95% CI':>17} {'p':>7}")
+    print("-" * 116)
+    for row in rows:
+        low, high = row["ci"]
+        runs = "{}/{}".format(*row["runs"])
+        print(f"{row['problem']:<22} {row['solution']:<18} {row['size']:>8} {runs:>7} {format_seconds(row['base']):>10} "
+              f"{format_seconds(row['head']):>10} {(row['ratio'] - 1) * 100:>+7.1f}% "
+              f"{(low - 1) * 100:>+7.1f}..{(high - 1) * 100:+.1f}% {row['p']:>7.3f}  "
+              f"{VERDICT_ICONS[row['verdict']]} {row['verdict']}")
+    versions_compared = sorted({(row["problem"], row["solution"], row["base_version"], row["head_version"])
+                                for row in rows})
+    print()
+    for problem, solution_type, base_version, head_version in versions_compared:
+        print(f"   {problem} {solution_type}: {base_version} -> {head_version}")
+    print()
+
+def print_log(records: List[dict]):
+    runs: Dict[tuple, List[dict]] = {}
+    for record in records:
+        runs.setdefault((record["run"], record["solution"]), []).append(record)
+    print(f"\n{'run':<26} {'solution':<18} {'version':<11} {'commit':<11} median time or peak memory by n")
+    print("-" * 106)
+    for (run, solution_type), group in runs.items():
+        medians = ", ".join(
+            f"{record['size']}: {format_bytes(record['peak_bytes'])}" if record.get("metric") == "memory"
+            else f"{record['size']}: {format_seconds(record['median'])}"
+            for record in group
+        )
+        print(f"{run:<26} {solution_type:<18} {group[0]['file_hash'][:10]:<11} "
+              f"{(group[0].get('commit') or '-')[:10]:<11} {medians}")
+    print()
+
+if __name__ == "__main__":
+    from problem_index import problem_folders
+    from solution_loader import resolve_problem
+
+    parser = argparse.ArgumentParser(
+        description="Browse stored benchmark runs and detect regressions between solution versions.",
+        epilog="Example: python tools/benchmark.py 1 --save && python tools/bench_history.py compare 1",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    log = commands.add_parser("log", help="list the stored runs of a problem")
+    log.add_argument("problem_number")
+
+    compare = commands.add_parser("compare", help="compare two versions of each solution")
+    compare.add_argument("problem_number", nargs="?")
+    compare.add_argument("--all", action="store_true", help="compare every problem with stored runs")
+    compare.add_argument("--solution", help="only this solution type, e.g. user_solution")
+    compare.add_argument("--base", help="file hash, commit or run prefix (default: the previous version)")
+    compare.add_argument("--head", help="file hash, commit or run prefix (default: the newest version)")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="smallest median change that counts (default: %(default)s = 5%%)")
+    compare.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="significance level")
+    compare.add_argument("--min-runs", type=int, default=DEFAULT_MIN_RUNS,
+                         help="separate saved runs each version needs before a verdict (default: %(default)s)")
+    compare.add_argument("--any-host", action="store_true",
+                         help="also use runs recorded on other machines (timings rarely transfer)")
+    options = parser.parse_args()
+
+    if options.command == "log":
+        records = load_results(os.path.basename(resolve_problem(options.problem_number)))
+        if not records:
+            print(f"No stored runs. Record one with: python tools/benchmark.py {options.problem_number} --save")
+            sys.exit(1)
+        print_log(records)
+        sys.exit(0)
+
+    if not options.all and not options.problem_number:
+        parser.error("give a problem number or --all")
+    problems = ([os.path.basename(folder) for folder in problem_folders()] if options.all
+                else [os.path.basename(resolve_problem(options.problem_number))])
+    rows = []
+    for problem in problems:
+        rows.extend(compare_problem(problem, options.solution, options.base, options.head,
+                                    options.threshold, options.alpha,
+                                    None if options.any_host else platform.node(), min_runs=options.min_runs))
+    if not rows:
+        print("Nothing to compare: benchmark at least two versions of a solution with --save first.")
+        sys.exit(0)
+    print_comparison(rows)
+    if any(row["verdict"] == "too few runs" for row in rows):
+        print(f"⚠️ Some versions have fewer than {options.min_runs} saved runs; "
+              f"run benchmark.py --save again to compare them.")
+    regressions = [row for row in rows if row["verdict"] == "regression"]
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {options.threshold:.0%}.")
+        sys.exit(1)
+    print("✅ No regressions.")
@@ -0,0 +1,285 @@
+import gc
+import sys
+import copy
+import math
+import time
+import argparse
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from generators import generate_args
+from solution_loader import call_args, copy_plain, load_meta, load_problem_solutions, resolve_problem
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_REPEAT = 7
+DEFAULT_WARMUP = 1
+# Fast calls are batched until a single sample takes at least this long,
+# so timer resolution does not dominate small input sizes.
+MIN_SAMPLE_TIME = 0.002
+MAX_CALLS_PER_SAMPLE = 10000
+# Once one call of a solution takes longer than this, larger sizes are skipped for it.
+DEFAULT_MAX_CALL_TIME = 2.0
+# Memory samples are deterministic up to allocator noise, so a few are enough.
+DEFAULT_MEMORY_REPEAT = 3
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Linear-interpolated percentile of an already sorted list, q in [0, 100]."""
+    if not sorted_values:
+        return float("nan")
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def summarize(samples: List[float]) -> dict:
+    """Summary statistics for a list of per-call times in seconds."""
+    ordered = sorted(samples)
+    median = percentile(ordered, 50)
+    return {
+        "min": ordered[0],
+        "median": median,
+        "mean": sum(ordered) / len(ordered),
+        "p90": percentile(ordered, 90),
+        "p95": percentile(ordered, 95),
+        "max": ordered[-1],
+        "ops_per_sec": 1 / median if median > 0 else float("inf"),
+    }
+
+def time_call(func, args: dict, repeat: int = DEFAULT_REPEAT, warmup: int = DEFAULT_WARMUP,
+              prepare: Callable[[dict], dict] = copy.deepcopy) -> List[float]:
+    """
+    Times `func(**prepare(args))` and returns `repeat` samples of seconds per call.
+    Every call gets its own prepared copy of the arguments (made outside the timed
+    region) because solutions are free to mutate their input.
+    """
+    for _ in range(warmup):
+        func(**prepare(args))
+
+    # Calibrate how many calls make up one sample.
+    probe_args = prepare(args)
+    start = time.perf_counter()
+    func(**probe_args)
+    probe = time.perf_counter() - start
+    number = 1 if probe >= MIN_SAMPLE_TIME else min(MAX_CALLS_PER_SAMPLE, math.ceil(MIN_SAMPLE_TIME / max(probe, 1e-9)))
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            batch = [prepare(args) for _ in range(number)]
+            gc.disable()
+            start = time.perf_counter()
+            for call_args in batch:
+                func(**call_args)
+            elapsed = time.perf_counter() - start
+            if gc_was_enabled:
+                gc.enable()
+            samples.append(elapsed / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+def run_sizes(problem_folder: str, sizes: List[int], measure: Callable[[Callable, dict, Callable], dict],
+              seed: int = 0, max_call_time: float = DEFAULT_MAX_CALL_TIME) -> dict:
+    """
+    Runs `measure(method, plain_args, prepare)` for every Python Solution of a problem
+    on the same generated inputs at each size; `prepare(plain_args)` returns fresh
+    call arguments (linked lists and trees built) for one call. `measure` returns a
+    record with a "seconds" key (time per call), used to skip larger sizes for
+    solutions that became too slow.
+    Returns {"method": ..., "results": {solution_type: [per-size records]}}.
+    """
+    solutions = load_problem_solutions(problem_folder)
+    if not solutions:
+        raise ValueError(f"No Python Solution classes found in {problem_folder}")
+
+    # Inputs are generated from the reference signature when there is one.
+    reference_type = "leetcode_solution" if "leetcode_solution" in solutions else next(iter(solutions))
+    reference_class, method_name = solutions[reference_type]
+    reference_method = getattr(reference_class, method_name)
+
+    constraints = load_meta(problem_folder).get("constraints")
+    results: Dict[str, List[dict]] = {solution_type: [] for solution_type in solutions}
+    too_slow = set()
+    for size in sizes:
+        args = generate_args(reference_method, size, seed=seed, constraints=constraints)
+        for solution_type, (solution_class, name) in solutions.items():
+            if solution_type in too_slow:
+                results[solution_type].append({"size": size, "skipped": True})
+                continue
+            method = getattr(solution_class, name)
+            prepare = lambda plain, method=method: call_args(method, copy_plain(plain))
+            record = {"size": size}
+            record.update(measure(getattr(solution_class(), name), args, prepare))
+            results[solution_type].append(record)
+            if record["seconds"] > max_call_time:
+                too_slow.add(solution_type)
+
+    return {"method": method_name, "results": results}
+
+def benchmark_problem(problem_folder: str, sizes: List[int] = DEFAULT_SIZES, repeat: int = DEFAULT_REPEAT,
+                      warmup: int = DEFAULT_WARMUP, seed: int = 0,
+                      max_call_time: float = DEFAULT_MAX_CALL_TIME) -> dict:
+    """Times every Python Solution of a problem at each size (see run_sizes)."""
+    def measure(func, args, prepare):
+        samples = time_call(func, args, repeat=repeat, warmup=warmup, prepare=prepare)
+        record = {"samples": samples}
+        record.update(summarize(samples))
+        record["seconds"] = record["median"]
+        return record
+
+    return run_sizes(problem_folder, sizes, measure, seed, max_call_time)
+
+def measure_memory(func, args: dict, repeat: int = DEFAULT_MEMORY_REPEAT,
+                   prepare: Callable[[dict], dict] = copy.deepcopy) -> dict:
+    """
+    Runs `func(**args)` under tracemalloc and returns the median peak bytes allocated
+    during the call. The arguments are copied before tracing starts, so the input
+    itself is not counted. `retained_blocks` counts the memory blocks still alive
+    after the call returns (its result plus anything it cached).
+    """
+    peaks, blocks, elapsed = [], [], []
+    for _ in range(repeat):
+        fresh_args = prepare(args)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            result = func(**fresh_args)
+            elapsed.append(time.perf_counter() - start)
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        del result
+        peaks.append(peak)
+        blocks.append(sum(stat.count for stat in snapshot.statistics("filename")))
+    return {
+        "peak_bytes": percentile(sorted(peaks), 50),
+        "retained_blocks": percentile(sorted(blocks), 50),
+        "seconds": percentile(sorted(elapsed), 50),
+    }
+
+def memory_problem(problem_folder: str, sizes: List[int] = DEFAULT_SIZES,
+                   repeat: int = DEFAULT_MEMORY_REPEAT, seed: int = 0,
+                   max_call_time: float = DEFAULT_MAX_CALL_TIME) -> dict:
+    """Measures peak memory of every Python Solution of a problem at each size (see run_sizes)."""
+    return run_sizes(problem_folder, sizes,
+                     lambda func, args, prepare: measure_memory(func, args, repeat=repeat, prepare=prepare),
+                     seed, max_call_time)
+
+def format_bytes(size: float) -> str:
+    for unit, scale in (("MiB", 1024 ** 2), ("KiB", 1024)):
+        if size >= scale:
+            return f"{size / scale:.3g} {unit}"
+    return f"{size:.0f} B"
+
+def print_memory_report(meta_data: dict, report: dict):
+    results = report["results"]
+    print(f"\n🧠 Memory: #{meta_data['problem_number']} {meta_data['title']} ({report['method']})\n")
+    print(f"{'n':>8}  {'solution':<18} {'peak':>12} {'bytes/n':>10} {'retained blocks':>16}")
+    print("-" * 70)
+
+    sizes = [record["size"] for record in next(iter(results.values()))]
+    for index, size in enumerate(sizes):
+        for solution_type, records in results.items():
+            record = records[index]
+            if record.get("skipped"):
+                print(f"{size:>8}  {solution_type:<18} {'skipped (previous size too slow)':>40}")
+                continue
+            print(f"{size:>8}  {solution_type:<18} {format_bytes(record['peak_bytes']):>12} "
+                  f"{record['peak_bytes'] / size:>10.1f} {record['retained_blocks']:>16.0f}")
+    print()
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+def speedup(results: Dict[str, List[dict]], index: int) -> Optional[float]:
+    """How many times faster leetcode_solution is than user_solution at one size."""
+    user = results.get("user_solution", [])
+    leetcode = results.get("leetcode_solution", [])
+    if index >= len(user) or index >= len(leetcode):
+        return None
+    if user[index].get("skipped") or leetcode[index].get("skipped"):
+        return None
+    return user[index]["median"] / leetcode[index]["median"]
+
+def print_report(meta_data: dict, report: dict):
+    results = report["results"]
+    print(f"\n📊 Benchmark: #{meta_data['problem_number']} {meta_data['title']} ({report['method']})\n")
+    print(f"{'n':>8}  {'solution':<18} {'median':>10} {'p90':>10} {'p95':>10} {'ops/sec':>12}")
+    print("-" * 74)
+
+    sizes = [record["size"] for record in next(iter(results.values()))]
+    for index, size in enumerate(sizes):
+        for solution_type, records in results.items():
+            record = records[index]
+            if record.get("skipped"):
+                print(f"{size:>8}  {solution_type:<18} {'skipped (previous size too slow)':>45}")
+                continue
+            print(f"{size:>8}  {solution_type:<18} {format_seconds(record['median']):>10} "
+                  f"{format_seconds(record['p90']):>10} {format_seconds(record['p95']):>10} "
+                  f"{record['ops_per_sec']:>12,.0f}")
+        ratio = speedup(results, index)
+        if ratio is not None:
+            faster, slower = ("leetcode_solution", "user_solution") if ratio >= 1 else ("user_solution", "leetcode_solution")
+            print(f"{'':>8}  ⚡ {faster} is {max(ratio, 1 / ratio):.2f}x faster than {slower}")
+    print()
+
+def parse_sizes(value: str) -> List[int]:
+    return [int(float(size)) for size in value.split(",") if size.strip()]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark a problem's user_solution.py against its leetcode_solution.py.",
+        epilog="Example: python tools/benchmark.py 1 --sizes 100,1000,10000",
+    )
+    parser.add_argument("problem_number")
+    parser.add_argument("--sizes", type=parse_sizes, default=DEFAULT_SIZES,
+                        help="comma-separated input sizes (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed samples per size")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="untimed calls before sampling")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for generated inputs")
+    parser.add_argument("--max-time", type=float, default=DEFAULT_MAX_CALL_TIME,
+                        help="skip larger sizes once a call takes longer than this many seconds")
+    parser.add_argument("--memory", action="store_true",
+                        help="measure peak memory with tracemalloc instead of timing")
+    parser.add_argument("--save", action="store_true",
+                        help="append the results to benchmarks/results.jsonl (see bench_history.py) "
+                             "and rebuild the problem's UI")
+    options = parser.parse_args()
+
+    problem_folder = resolve_problem(options.problem_number)
+    try:
+        if options.memory:
+            report = memory_problem(problem_folder, options.sizes, min(options.repeat, DEFAULT_MEMORY_REPEAT),
+                                    options.seed, options.max_time)
+        else:
+            report = benchmark_problem(problem_folder, options.sizes, options.repeat, options.warmup,
+                                       options.seed, options.max_time)
+    except (ValueError, TypeError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if options.memory:
+        print_memory_report(load_meta(problem_folder), report)
+    else:
+        print_report(load_meta(problem_folder), report)
+
+    if options.save:
+        from bench_history import RESULTS_PATH, record_report
+        from solution_loader import python_solution_paths
+
+        from update_progress import rebuild_problems
+
+        saved = record_report(problem_folder, report, python_solution_paths(problem_folder), options.seed,
+                              metric="memory" if options.memory else "time")
+        print(f"💾 Saved {saved} result(s) to {RESULTS_PATH}. Compare versions with: "
+              f"python tools/bench_history.py compare {options.problem_number}")
+        rebuild_problems([problem_folder])
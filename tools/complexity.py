@@ -0,0 +1,194 @@
+import os
+import sys
+import math
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmark import benchmark_problem, memory_problem
+from problem_index import problem_folders
+from solution_loader import load_meta, python_solution_paths, resolve_problem
+from update_progress import parse_readme
+
+# Candidate growth classes, simplest first.
+COMPLEXITY_CLASSES: List[Tuple[str, Callable[[float], float]]] = [
+    ("O(1)", lambda n: 0.0),
+    ("O(log n)", lambda n: math.log2(n)),
+    ("O(n)", lambda n: n),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n^2)", lambda n: n ** 2),
+    ("O(n^2 log n)", lambda n: n ** 2 * math.log2(n)),
+    ("O(n^3)", lambda n: n ** 3),
+]
+
+# Spellings used in READMEs, normalised (lowercase, no spaces or '*') to a class label.
+_ALIASES = {
+    "o(1)": "O(1)",
+    "o(logn)": "O(log n)",
+    "o(n)": "O(n)",
+    "o(nlogn)": "O(n log n)",
+    "o(n^2)": "O(n^2)",
+    "o(n^2logn)": "O(n^2 log n)",
+    "o(n^3)": "O(n^3)",
+}
+
+DEFAULT_SIZES = [64 * 2 ** i for i in range(8)]
+DEFAULT_REPEAT = 3
+DEFAULT_MAX_CALL_TIME = 1.0
+# The declared class is accepted when it explains the measurements to within this
+# root-mean-square relative error, even if another class fits slightly better.
+# Neighbouring classes such as O(n) and O(n log n) are hard to tell apart on real
+# hardware (allocator growth, cache effects) and should not be flagged.
+MAX_RELATIVE_ERROR = 0.3
+
+def parse_complexity(text: str) -> Optional[str]:
+    """Maps a README complexity string such as 'O(n²)' to a class label, or None."""
+    key = text.strip().rstrip(".").lower()
+    key = key.replace("²", "^2").replace("³", "^3").replace("**", "^")
+    key = key.replace(" ", "").replace("*", "").replace("·", "").replace("log2", "log").replace("lg", "log")
+    key = key.replace("log(n)", "logn")
+    return _ALIASES.get(key)
+
+def _weighted_fit(xs: List[float], ys: List[float]) -> Tuple[float, float, float]:
+    """
+    Fits y = a + c*x with weights 1/y^2 (i.e. minimising relative error) and
+    non-negative a and c. Returns (a, c, weighted squared residual).
+    """
+    # Values near zero (e.g. an O(1) solution's peak memory) are floored so they
+    # don't get unbounded weight.
+    floor = max(max(ys) * 0.01, 1e-12)
+    weights = [1 / max(y, floor) ** 2 for y in ys]
+    sw = sum(weights)
+    sx = sum(w * x for w, x in zip(weights, xs))
+    sxx = sum(w * x * x for w, x in zip(weights, xs))
+    sy = sum(w * y for w, y in zip(weights, ys))
+    sxy = sum(w * x * y for w, x, y in zip(weights, xs, ys))
+
+    det = sw * sxx - sx * sx
+    if det > 0:
+        a = (sy * sxx - sx * sxy) / det
+        c = (sw * sxy - sx * sy) / det
+    else:
+        a, c = sy / sw, 0.0
+    if c < 0:
+        a, c = sy / sw, 0.0
+    elif a < 0:
+        a, c = 0.0, (sxy / sxx if sxx > 0 else 0.0)
+
+    residual = sum(w * (y - a - c * x) ** 2 for w, x, y in zip(weights, xs, ys))
+    return a, c, residual
+
+def fit_complexity(sizes: List[int], values: List[float]) -> List[Dict[str, float]]:
+    """
+    Fits measurements (time, memory, ...) against every candidate class.
+    Returns one {"label", "residual", "relative_error", "constant", "coefficient"}
+    per class, best first.
+    """
+    fits = []
+    for label, growth in COMPLEXITY_CLASSES:
+        xs = [growth(n) for n in sizes]
+        constant, coefficient, residual = _weighted_fit(xs, values)
+        fits.append({
+            "label": label,
+            "residual": residual,
+            "relative_error": math.sqrt(residual / len(sizes)),
+            "constant": constant,
+            "coefficient": coefficient,
+        })
+    # Stable sort keeps the simpler class first when residuals tie.
+    return sorted(fits, key=lambda fit: round(fit["residual"], 12))
+
+def assess(sizes: List[int], values: List[float], declared: str) -> dict:
+    """Compares the best-fitting class with the declared one."""
+    fits = fit_complexity(sizes, values)
+    best = fits[0]
+    declared_label = parse_complexity(declared)
+    declared_fit = next((fit for fit in fits if fit["label"] == declared_label), None)
+
+    mismatch = False
+    if declared_fit is not None and declared_label != best["label"]:
+        mismatch = declared_fit["relative_error"] > MAX_RELATIVE_ERROR
+    return {
+        "fitted": best["label"],
+        "declared": declared,
+        "declared_class": declared_label,
+        "mismatch": mismatch,
+        "fits": fits,
+    }
+
+def _assess_report(report: dict, key: str, declared: str) -> Dict[str, dict]:
+    assessments = {}
+    for solution_type, records in report["results"].items():
+        measured = [record for record in records if not record.get("skipped")]
+        if len(measured) < 3:
+            continue
+        assessments[solution_type] = assess(
+            [record["size"] for record in measured], [record[key] for record in measured], declared
+        )
+    return assessments
+
+def estimate_time_complexity(problem_folder: str, sizes: List[int] = DEFAULT_SIZES,
+                             repeat: int = DEFAULT_REPEAT,
+                             max_call_time: float = DEFAULT_MAX_CALL_TIME) -> Dict[str, dict]:
+    """Times each Python solution of a problem and fits its scaling curve."""
+    declared = parse_readme(os.path.join(problem_folder, "README.md"))["timeComplexity"]
+    report = benchmark_problem(problem_folder, sizes, repeat=repeat, max_call_time=max_call_time)
+    return _assess_report(report, "median", declared)
+
+def estimate_space_complexity(problem_folder: str, sizes: List[int] = DEFAULT_SIZES,
+                              max_call_time: float = DEFAULT_MAX_CALL_TIME) -> Dict[str, dict]:
+    """Measures each Python solution's peak memory under tracemalloc and fits its growth."""
+    declared = parse_readme(os.path.join(problem_folder, "README.md"))["spaceComplexity"]
+    report = memory_problem(problem_folder, sizes, max_call_time=max_call_time)
+    return _assess_report(report, "peak_bytes", declared)
+
+def print_assessments(meta_data: dict, assessments: Dict[str, dict], kind: str = "Time") -> int:
+    """Prints one line per solution and returns the number of mismatches."""
+    print(f"\n📈 #{meta_data['problem_number']} {meta_data['title']}")
+    mismatches = 0
+    for solution_type, result in assessments.items():
+        runner_up = result["fits"][1]["label"] if len(result["fits"]) > 1 else "-"
+        line = f"   - {solution_type:<18} fitted {result['fitted']:<12} (next: {runner_up:<12}) declared {result['declared']}"
+        if result["declared_class"] is None:
+            print(f"{line}  ❔ declared {kind.lower()} complexity not recognised")
+        elif result["mismatch"]:
+            mismatches += 1
+            print(f"{line}  ⚠️  {kind} complexity mismatch")
+        else:
+            print(f"{line}  ✅")
+    return mismatches
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Estimate each solution's time (or space) complexity empirically and check it against the README.",
+        epilog="Example: python tools/complexity.py 1    |    python tools/complexity.py --all",
+    )
+    parser.add_argument("problem_number", nargs="?")
+    parser.add_argument("--all", action="store_true", help="check every problem with Python solutions")
+    parser.add_argument("--space", action="store_true",
+                        help="fit peak memory (tracemalloc) against the declared space complexity")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed samples per size")
+    parser.add_argument("--max-time", type=float, default=DEFAULT_MAX_CALL_TIME,
+                        help="stop growing n once a call takes longer than this many seconds")
+    options = parser.parse_args()
+    if not options.all and not options.problem_number:
+        parser.error("give a problem number or --all")
+
+    folders = problem_folders() if options.all else [resolve_problem(options.problem_number)]
+    total_mismatches = 0
+    for problem_folder in folders:
+        if not python_solution_paths(problem_folder):
+            continue
+        try:
+            if options.space:
+                assessments = estimate_space_complexity(problem_folder, max_call_time=options.max_time)
+            else:
+                assessments = estimate_time_complexity(problem_folder, repeat=options.repeat,
+                                                       max_call_time=options.max_time)
+        except (ValueError, TypeError) as e:
+            print(f"\n❌ {os.path.basename(problem_folder)}: {e}")
+            continue
+        kind = "Space" if options.space else "Time"
+        total_mismatches += print_assessments(load_meta(problem_folder), assessments, kind)
+
+    print(f"\n{'⚠️' if total_mismatches else '✅'} {total_mismatches} complexity mismatch(es) found.")
+    sys.exit(1 if total_mismatches else 0)
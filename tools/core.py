@@ -0,0 +1,86 @@
+import os
+import copy
+import json
+from typing import Callable, Dict, Optional, Tuple
+
+# Shared, cached access to the files every tool reads: the language config, the
+# master templates and (through problem_index.py) the problem listing. Entries
+# are keyed by the file's stat, so an edit is picked up on the next call. In a
+# one-shot script each file is simply read once; under `lc.py serve` the cache
+# lives across commands.
+
+PROBLEMS_DIR = "problems"
+TEMPLATES_DIR = "templates"
+CONFIG_PATH = os.path.join("tools", "config.json")
+# Template files containing this are filled in per problem; the others are the
+# same for every problem and are linked, not copied, into each problem's ui/.
+PLACEHOLDER = "__PROBLEM_DATA__"
+
+_cache: Dict[str, Tuple[Tuple[int, int], object]] = {}
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def cached(path: str, loader: Callable[[str], object]):
+    """
+    Returns loader(path), reusing the previous result while the file's mtime and
+    size are unchanged. Raises FileNotFoundError if the file does not exist.
+    Results are shared: callers must not modify them.
+    """
+    key = _stat_key(path)
+    if key is None:
+        _cache.pop(path, None)
+        raise FileNotFoundError(path)
+    hit = _cache.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    value = loader(path)
+    _cache[path] = (key, value)
+    return value
+
+def prime(path: str, value):
+    """Records `value` as the loaded contents of a file that was just written."""
+    key = _stat_key(path)
+    if key is not None:
+        _cache[path] = (key, value)
+
+def read_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+def load_config() -> dict:
+    """The language configuration. A private copy, so callers may edit and save it."""
+    return copy.deepcopy(cached(CONFIG_PATH, read_json))
+
+def template_files(template_name: str) -> Dict[str, bytes]:
+    """Every file of a master template keyed by relative path; empty if it does not exist."""
+    src_dir = os.path.join(TEMPLATES_DIR, template_name)
+    files = {}
+    for root, _, names in os.walk(src_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            files[os.path.relpath(path, src_dir)] = cached(path, read_bytes)
+    return files
+
+def master_templates(file_name: str) -> Dict[str, str]:
+    """`file_name` from every template folder that has one, keyed by template name."""
+    templates = {}
+    if not os.path.isdir(TEMPLATES_DIR):
+        return templates
+    for template_name in sorted(os.listdir(TEMPLATES_DIR)):
+        path = os.path.join(TEMPLATES_DIR, template_name, file_name)
+        if os.path.isfile(path):
+            templates[template_name] = cached(path, read_text)
+    return templates
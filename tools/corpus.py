@@ -0,0 +1,405 @@
+import os
+import sys
+import json
+import mmap
+import time
+import struct
+import argparse
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# A corpus is a binary file of test cases for one problem, read through mmap so a
+# case is only decoded when it is run and the file never has to fit in memory.
+#
+#   header   magic, version, case count, index offset, schema length (32 bytes)
+#   schema   JSON: {"params": ["nums", "target"], ...how it was built}
+#   cases    one record per case, each starting on an 8-byte boundary:
+#              flags (1 = has an expected output), one value per param, the output
+#   index    count + 1 little-endian uint64 offsets; case i spans index[i]..index[i+1]
+#
+# Values are tagged. Lists of ints/floats are stored as packed, 8-byte aligned
+# int64/float64 segments that decode with a single memoryview cast; everything
+# else (strings, nested lists, trees with nulls) uses the generic encodings.
+MAGIC = b"LCCORPUS"
+VERSION = 1
+CORPUS_FILE = "stress.corpus"
+
+HEADER = struct.Struct("<8sIIQII")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+T_NONE, T_FALSE, T_TRUE, T_INT, T_FLOAT, T_STR, T_INTS, T_FLOATS, T_LIST, T_JSON = range(10)
+HAS_OUTPUT = 1
+INT64_MIN, INT64_MAX = -2**63, 2**63 - 1
+# memoryview.cast() reads native byte order; big-endian hosts take the byteswap path.
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# --- Encoding ---
+
+def _pad(out: bytearray):
+    out += bytes(-len(out) % 8)
+
+def _packed(values: list, typecode: str) -> Optional[bytes]:
+    try:
+        packed = array(typecode, values)
+    except OverflowError:
+        return None
+    if not _LITTLE_ENDIAN:
+        packed.byteswap()
+    return packed.tobytes()
+
+def _encode(value, out: bytearray):
+    if value is None:
+        out.append(T_NONE)
+    elif value is True or value is False:
+        out.append(T_TRUE if value else T_FALSE)
+    elif type(value) is int and INT64_MIN <= value <= INT64_MAX:
+        out.append(T_INT)
+        out += _I64.pack(value)
+    elif type(value) is float:
+        out.append(T_FLOAT)
+        out += _F64.pack(value)
+    elif type(value) is str:
+        data = value.encode("utf-8")
+        out.append(T_STR)
+        out += _U32.pack(len(data))
+        out += data
+    elif type(value) is list:
+        # `type(v) is int` rather than isinstance: bools must stay bools.
+        packed = None
+        if value and all(type(v) is int for v in value):
+            tag, packed = T_INTS, _packed(value, "q")
+        elif value and all(type(v) is float for v in value):
+            tag, packed = T_FLOATS, _packed(value, "d")
+        if packed is not None:
+            out.append(tag)
+            _pad(out)
+            out += _U64.pack(len(value))
+            out += packed
+        else:
+            out.append(T_LIST)
+            out += _U32.pack(len(value))
+            for item in value:
+                _encode(item, out)
+    else:
+        # Big integers, dicts and anything else LeetCode-shaped but unusual.
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        out.append(T_JSON)
+        out += _U32.pack(len(data))
+        out += data
+
+def encode_case(params: List[str], case: dict) -> bytearray:
+    """One case record ({"input": {...}, "output"?: ...}), padded to 8 bytes."""
+    out = bytearray([HAS_OUTPUT if "output" in case else 0])
+    for name in params:
+        try:
+            value = case["input"][name]
+        except KeyError:
+            raise ValueError(f"case has no value for parameter '{name}'")
+        _encode(value, out)
+    if "output" in case:
+        _encode(case["output"], out)
+    _pad(out)
+    return out
+
+def write_corpus(path: str, params: List[str], cases: Iterable[dict], info: Optional[dict] = None) -> int:
+    """
+    Streams `cases` into a corpus file and returns how many were written. Only the
+    offsets are kept in memory, so `cases` can be a generator of any length.
+    """
+    schema = json.dumps(dict(info or {}, params=params), separators=(",", ":")).encode("utf-8")
+    offsets = array("Q")
+    # Hidden and per process like fileio's temporary files, and removed if encoding fails.
+    temp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            head = bytearray(HEADER.size) + schema
+            _pad(head)
+            f.write(head)
+            position = len(head)
+            for case in cases:
+                record = encode_case(params, case)
+                offsets.append(position)
+                f.write(record)
+                position += len(record)
+            offsets.append(position)
+            if not _LITTLE_ENDIAN:
+                offsets.byteswap()
+            f.write(offsets.tobytes())
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, len(offsets) - 1, position, len(schema), 0))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return len(offsets) - 1
+
+# --- Decoding ---
+
+class Corpus:
+    """
+    Read-only, memory-mapped view of a corpus file. Cases are decoded lazily on
+    access; packed int/float lists come straight out of the mapping with one cast.
+
+    Only the byte range of cases start..stop is mapped, so a worker running one
+    shard of a huge corpus maps (and counts against its memory limit) just that shard.
+
+        with Corpus("problems/0001_two-sum/stress.corpus") as corpus:
+            for args in corpus.inputs():
+                ...
+    """
+
+    def __init__(self, path: str, start: int = 0, stop: Optional[int] = None):
+        self.path = path
+        self._mmap = None
+        self._view: Optional[memoryview] = None
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            try:
+                magic, version, count, index_offset, schema_length, _ = HEADER.unpack(header)
+            except struct.error:
+                magic, version = None, None
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} corpus file")
+            self.info = json.loads(f.read(schema_length))
+            self.params: List[str] = self.info["params"]
+            self.count = count
+            self.start = min(max(start, 0), count)
+            self.stop = count if stop is None else min(max(stop, self.start), count)
+
+            f.seek(index_offset + 8 * self.start)
+            self._offsets = array("Q")
+            self._offsets.frombytes(f.read(8 * (self.stop - self.start + 1)))
+            if not _LITTLE_ENDIAN:
+                self._offsets.byteswap()
+            if len(self._offsets) != self.stop - self.start + 1:
+                raise ValueError(f"{path} is truncated")
+
+            # mmap offsets must be multiples of the allocation granularity (which keeps
+            # the 8-byte alignment of packed segments intact).
+            self._base = self._offsets[0] - self._offsets[0] % mmap.ALLOCATIONGRANULARITY
+            length = self._offsets[-1] - self._base
+            if length:
+                self._mmap = mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=self._base)
+                self._view = memoryview(self._mmap)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # The view must be released before the mapping can close.
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _decode(self, position: int):
+        view = self._view
+        tag = view[position]
+        position += 1
+        if tag == T_NONE:
+            return None, position
+        if tag == T_FALSE or tag == T_TRUE:
+            return tag == T_TRUE, position
+        if tag == T_INT:
+            return _I64.unpack_from(view, position)[0], position + 8
+        if tag == T_FLOAT:
+            return _F64.unpack_from(view, position)[0], position + 8
+        if tag == T_STR or tag == T_JSON:
+            length = _U32.unpack_from(view, position)[0]
+            position += 4
+            text = str(view[position:position + length], "utf-8")
+            return (text if tag == T_STR else json.loads(text)), position + length
+        if tag == T_INTS or tag == T_FLOATS:
+            position += -position % 8
+            count = _U64.unpack_from(view, position)[0]
+            position += 8
+            segment = view[position:position + 8 * count]
+            typecode = "q" if tag == T_INTS else "d"
+            if _LITTLE_ENDIAN:
+                values = segment.cast(typecode).tolist()
+            else:
+                packed = array(typecode, segment.tobytes())
+                packed.byteswap()
+                values = packed.tolist()
+            segment.release()
+            return values, position + 8 * count
+        if tag == T_LIST:
+            count = _U32.unpack_from(view, position)[0]
+            position += 4
+            items = []
+            for _ in range(count):
+                item, position = self._decode(position)
+                items.append(item)
+            return items, position
+        raise ValueError(f"{self.path}: unknown value tag {tag} at byte {position - 1}")
+
+    def case(self, index: int) -> dict:
+        """Decodes case `index` (counted from the start of the file) as {"input": {...}, "output"?: ...}."""
+        if not self.start <= index < self.stop:
+            raise IndexError(f"case {index} is outside the mapped range {self.start}..{self.stop}")
+        position = self._offsets[index - self.start] - self._base
+        flags = self._view[position]
+        position += 1
+        args = {}
+        for name in self.params:
+            args[name], position = self._decode(position)
+        case = {"input": args}
+        if flags & HAS_OUTPUT:
+            case["output"], _ = self._decode(position)
+        return case
+
+    def __getitem__(self, index: int) -> dict:
+        return self.case(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        return (self.case(index) for index in range(self.start, self.stop))
+
+    def inputs(self) -> Iterator[Dict[str, object]]:
+        """Decodes only the arguments of each mapped case, one at a time."""
+        for index in range(self.start, self.stop):
+            yield self.case(index)["input"]
+
+# --- CLI ---
+
+def corpus_path(problem_folder: str) -> str:
+    return os.path.join(problem_folder, CORPUS_FILE)
+
+def _generated_cases(method, constraints, size: int, count: int, seed: int, grow: bool) -> Iterator[dict]:
+    from generators import Generator, generate_args
+
+    generator = Generator(seed)
+    for number in range(count):
+        case_size = max(1, size * (number + 1) // count) if grow else size
+        yield {"input": generate_args(method, case_size, constraints=constraints, generator=generator)}
+
+def _jsonl_cases(path: str) -> Iterator[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def _build(options) -> int:
+    from generators import method_parameters, problem_method
+    from solution_loader import load_meta, resolve_problem
+
+    problem_folder = resolve_problem(options.problem_number)
+    out = options.out or corpus_path(problem_folder)
+    try:
+        method = problem_method(problem_folder)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    params = method_parameters(method)
+
+    if options.from_jsonl:
+        cases = _jsonl_cases(options.from_jsonl)
+        info = {"source": options.from_jsonl}
+    else:
+        constraints = load_meta(problem_folder).get("constraints")
+        cases = _generated_cases(method, constraints, options.size, options.count, options.seed, options.grow)
+        info = {"size": options.size, "count": options.count, "seed": options.seed, "grow": options.grow}
+
+    start = time.perf_counter()
+    try:
+        count = write_corpus(out, params, cases, info)
+    except (ValueError, TypeError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(out) / (1024 * 1024)
+    print(f"✅ Wrote {count} case(s) to {out} ({size_mb:.1f} MiB) in {elapsed:.2f}s")
+    return 0
+
+def _info(options) -> int:
+    path = options.target
+    if not os.path.isfile(path):
+        from solution_loader import resolve_problem
+        path = corpus_path(resolve_problem(path))
+    try:
+        with Corpus(path) as corpus:
+            start = time.perf_counter()
+            decoded = sum(1 for _ in corpus)
+            elapsed = time.perf_counter() - start
+            print(f"📦 {path}")
+            print(f"   {len(corpus)} case(s), {os.path.getsize(path) / (1024 * 1024):.1f} MiB, "
+                  f"params: {', '.join(corpus.params)}")
+            print(f"   built with: {json.dumps({k: v for k, v in corpus.info.items() if k != 'params'})}")
+            print(f"   decoded every case in {elapsed * 1000:.1f} ms ({elapsed * 1e6 / max(1, decoded):.1f} µs per case)")
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+    return 0
+
+def _run(options) -> int:
+    from runner import SolutionRunner
+    from solution_loader import python_solution_paths, resolve_problem
+
+    problem_folder = resolve_problem(options.problem_number)
+    path = options.corpus or corpus_path(problem_folder)
+    if not os.path.isfile(path):
+        print(f"❌ Error: {path} not found. Build it with: python tools/corpus.py build {options.problem_number}")
+        return 1
+
+    failures = 0
+    with SolutionRunner(workers=options.jobs, timeout=options.timeout) as runner:
+        for solution_type, solution_path in python_solution_paths(problem_folder).items():
+            start = time.perf_counter()
+            result = runner.run_corpus(solution_path, path, outputs=False)
+            wall = time.perf_counter() - start
+            if not result["ok"]:
+                failures += 1
+                print(f"❌ {solution_type}: {result['error']}")
+                continue
+            cases = result["results"]
+            errors = [case["error"] for case in cases if not case["ok"]]
+            solving = sum(case["seconds"] or 0 for case in cases)
+            failures += bool(errors)
+            print(f"{'❌' if errors else '✅'} {solution_type}: {len(cases)} case(s), "
+                  f"solution {solving * 1000:.1f} ms, decoding {result['decode_seconds'] * 1000:.1f} ms, "
+                  f"wall {wall * 1000:.1f} ms")
+            if errors:
+                print(f"   first error: {errors[0]}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build, inspect and run memory-mapped binary test corpora.",
+        epilog="Example: python tools/corpus.py build 1 --size 100000 --count 1000 && python tools/corpus.py run 1",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="generate cases (or convert a tests.jsonl file) into a corpus")
+    build.add_argument("problem_number")
+    build.add_argument("--size", type=int, default=1000, help="input size of each generated case")
+    build.add_argument("--count", type=int, default=100, help="number of generated cases")
+    build.add_argument("--seed", type=int, default=0)
+    build.add_argument("--grow", action="store_true", help="grow sizes from 1 up to --size instead")
+    build.add_argument("--from-jsonl", metavar="PATH", help="convert tests.jsonl-style lines instead of generating")
+    build.add_argument("--out", help=f"corpus path (default: problems/<problem>/{CORPUS_FILE})")
+
+    info = commands.add_parser("info", help="describe a corpus and time a full decode")
+    info.add_argument("target", help="problem number or corpus path")
+
+    run = commands.add_parser("run", help="run the problem's Python solutions over its corpus")
+    run.add_argument("problem_number")
+    run.add_argument("--corpus", help=f"corpus path (default: problems/<problem>/{CORPUS_FILE})")
+    run.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    run.add_argument("--timeout", type=float, default=60.0, help="seconds per shard")
+
+    options = parser.parse_args()
+    handlers = {"build": _build, "info": _info, "run": _run}
+    sys.exit(handlers[options.command](options))
@@ -1,11 +1,26 @@
 import os
 import sys
+import csv
 import json
-import shutil
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-# Path to the configuration file, located in the 'tools' directory.
-CONFIG_PATH = os.path.join("tools", "config.json")
+import core
+from core import CONFIG_PATH, PLACEHOLDER, PROBLEMS_DIR, TEMPLATES_DIR
+from db import update_db_entries, update_db_entry
+from fileio import Batch, problem_lock
+from problem_index import INDEX_PATH, load_index, update_index_entries, update_index_entry
+
+DEFAULT_TEMPLATE = "problem-view"
+SOLUTION_TYPES = ("user_solution", "leetcode_solution")
+# Bulk imports are almost all small-file syscalls, so threads overlap them well.
+DEFAULT_WRITERS = min(32, (os.cpu_count() or 1) * 4)
+# meta.json fields a catalogue row may set or refresh; everything else is left alone.
+CATALOGUE_FIELDS = ("title", "difficulty", "tags")
+LINK_NAMES = ("leetcode", "github", "discussion")
 
 def load_config():
     """Loads the language configuration from config.json."""
@@ -13,71 +28,32 @@ def load_config():
         print(f"❌ Error: Config file not found at {CONFIG_PATH}")
         print("Please run 'python tools/add_language.py' to create one.")
         sys.exit(1)
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return core.load_config()
 
 def normalize_title(title: str) -> str:
     """Converts a problem title into a URL-friendly and filesystem-safe slug."""
     return title.lower().replace(" ", "-").strip()
 
-def create_problem_folder(problem_number, problem_title, template_name="problem-view"):
-    """
-    Scaffolds the complete directory and file structure for a new coding problem.
-    """
-    safe_title = normalize_title(problem_title)
+def folder_name_for(problem_number, slug: str) -> str:
     # Pad the problem number to four digits for consistent sorting.
-    folder_name = f"{int(problem_number):04d}_{safe_title}"
-
-    base_path = os.path.join("problems", folder_name)
-    os.makedirs(base_path, exist_ok=True)
-
-    print(f"📂 Creating problem folder: {base_path}")
-
-    # --- 1. Create README.md with basic structure ---
-    readme_path = os.path.join(base_path, "README.md")
-    if not os.path.exists(readme_path):
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write(f"# {problem_number}. {problem_title}\n\n")
-            f.write("## Problem Description\n\n(Add the problem statement here.)\n\n")
-            f.write("## Approach\n\n(Describe your thought process.)\n\n")
-            f.write("## Complexity\n\n- **Time:** O(...)\n- **Space:** O(...)\n")
-        print("📝 Created README.md")
-
-    # --- 2. Create language-specific folders and solution files ---
-    config = load_config()
-    supported_languages = config["languages"]
-    for lang, details in supported_languages.items():
-        lang_dir = os.path.join(base_path, lang)
-        os.makedirs(lang_dir, exist_ok=True)
+    return f"{int(problem_number):04d}_{slug}"
 
-        # Create both user and LeetCode solution files with boilerplate.
-        for solution_type in ["user_solution", "leetcode_solution"]:
-            file_path = os.path.join(lang_dir, f"{solution_type}.{details['ext']}")
-            if not os.path.exists(file_path):
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(details["boilerplate"])
-                print(f"   - 💻 Created {file_path}")
-
-    # --- 3. Copy the UI template from the main /templates directory ---
-    templates_dir = os.path.join("templates", template_name)
-    if os.path.exists(templates_dir):
-        ui_folder = os.path.join(base_path, "ui")
-        # Ensure a clean copy by removing the old one if it exists.
-        if os.path.exists(ui_folder):
-            shutil.rmtree(ui_folder)
-        shutil.copytree(templates_dir, ui_folder)
-        print(f"🎨 Copied UI template '{template_name}' to {ui_folder}")
-    else:
-        print(f"⚠️ Warning: Template '{template_name}' not found, skipping UI files.")
+def readme_text(problem_number, problem_title) -> str:
+    return (
+        f"# {problem_number}. {problem_title}\n\n"
+        "## Problem Description\n\n(Add the problem statement here.)\n\n"
+        "## Examples\n\n(Paste the examples here as `**Example 1:**` followed by `Input:` and `Output:` lines.)\n\n"
+        "## Approach\n\n(Describe your thought process.)\n\n"
+        "## Complexity\n\n- **Time:** O(...)\n- **Space:** O(...)\n"
+    )
 
-    # --- 4. Create a complete meta.json file ---
-    meta_path = os.path.join(base_path, "meta.json")
-    metadata = {
+def new_metadata(problem_number, problem_title, slug: str, template_name: str, languages: List[str]) -> dict:
+    return {
         "problem_number": int(problem_number),
         "title": problem_title,
-        "slug": safe_title,
+        "slug": slug,
         "template": template_name,
-        "languages": list(supported_languages.keys()),
+        "languages": languages,
         "created_at": datetime.now().isoformat(timespec="seconds"),
         "solved": False,
         "notes_complete": False,
@@ -87,26 +63,284 @@ def create_problem_folder(problem_number, problem_title, template_name="problem-
             "leetcode": "",
             "github": "",
             "discussion": ""
-        }
+        },
+        "constraints": {}
     }
 
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=4)
+def create_problem_folder(problem_number, problem_title, template_name=DEFAULT_TEMPLATE):
+    """
+    Scaffolds the complete directory and file structure for a new coding problem.
+    """
+    safe_title = normalize_title(problem_title)
+    folder_name = folder_name_for(problem_number, safe_title)
+
+    base_path = os.path.join(PROBLEMS_DIR, folder_name)
+    print(f"📂 Creating problem folder: {base_path}")
+    config = load_config()
+    supported_languages = config["languages"]
+
+    # Everything is staged and committed together, holding the problem's lock.
+    with problem_lock(base_path), Batch() as batch:
+        # --- 1. Create README.md with basic structure ---
+        readme_path = os.path.join(base_path, "README.md")
+        if not os.path.exists(readme_path):
+            batch.write(readme_path, readme_text(problem_number, problem_title))
+            print("📝 Created README.md")
+
+        # --- 2. Create language-specific folders and solution files ---
+        for lang, details in supported_languages.items():
+            # Create both user and LeetCode solution files with boilerplate.
+            for solution_type in SOLUTION_TYPES:
+                file_path = os.path.join(base_path, lang, f"{solution_type}.{details['ext']}")
+                if not os.path.exists(file_path):
+                    batch.write(file_path, details["boilerplate"])
+                    print(f"   - 💻 Created {file_path}")
+
+        # --- 3. Copy the UI template from the main /templates directory ---
+        template_files = load_template_files(template_name)
+        if template_files:
+            ui_folder = os.path.join(base_path, "ui")
+            # Make ui/ match the template: unchanged files are left alone, files the
+            # template doesn't have are removed. Only the file with the placeholder is
+            # per problem; the others are hardlinked to the master template.
+            for rel_path, content in template_files.items():
+                if PLACEHOLDER.encode() in content:
+                    batch.write(os.path.join(ui_folder, rel_path), content)
+                else:
+                    batch.link(os.path.join(ui_folder, rel_path), os.path.join(TEMPLATES_DIR, template_name, rel_path))
+            for root, _, names in os.walk(ui_folder):
+                for name in names:
+                    path = os.path.join(root, name)
+                    if os.path.relpath(path, ui_folder) not in template_files:
+                        batch.remove(path)
+            print(f"🎨 Copied UI template '{template_name}' to {ui_folder}")
+        else:
+            print(f"⚠️ Warning: Template '{template_name}' not found, skipping UI files.")
+
+        # --- 4. Create a complete meta.json file ---
+        meta_path = os.path.join(base_path, "meta.json")
+        metadata = new_metadata(problem_number, problem_title, safe_title, template_name, list(supported_languages.keys()))
+        batch.write_json(meta_path, metadata)
 
     print(f"🗂️  Created metadata file: {meta_path}")
+
+    update_index_entry(base_path, metadata)
+    update_db_entry(base_path, metadata)
+    print(f"📇 Added problem to {INDEX_PATH}")
     print(f"\n✅ Problem setup complete for: #{problem_number} - {problem_title}")
 
 
+# --- BULK IMPORT ---
+
+def _split_tags(value) -> List[str]:
+    if isinstance(value, list):
+        return [str(tag).strip() for tag in value if str(tag).strip()]
+    for separator in (";", "|", ","):
+        if separator in (value or ""):
+            return [tag.strip() for tag in value.split(separator) if tag.strip()]
+    return [value.strip()] if value and value.strip() else []
+
+def catalogue_row(raw: dict, source: str) -> dict:
+    """
+    Normalizes one CSV/JSONL record. Accepted keys: number (or problem_number),
+    title, optional slug, difficulty, tags (a list, or separated by ';', '|' or ','),
+    and links as a "links" object or flat leetcode/github/discussion columns.
+    """
+    try:
+        number = int(str(raw.get("number", raw.get("problem_number", ""))).strip())
+    except ValueError:
+        raise ValueError(f"{source}: missing or invalid problem number")
+    title = str(raw.get("title") or "").strip()
+    if not title:
+        raise ValueError(f"{source}: missing title")
+    links = raw.get("links") if isinstance(raw.get("links"), dict) else {}
+    return {
+        "number": number,
+        "title": title,
+        "slug": str(raw.get("slug") or "").strip() or normalize_title(title),
+        "difficulty": str(raw.get("difficulty") or "").strip(),
+        "tags": _split_tags(raw.get("tags")),
+        "links": {name: str(links.get(name) or raw.get(name) or "").strip() for name in LINK_NAMES},
+    }
+
+def read_catalogue(path: str) -> Iterator[Union[dict, ValueError]]:
+    """
+    Yields normalized rows from a .csv (with a header row) or .jsonl file. A row
+    that can't be used is yielded as its ValueError, so the rows after it still load.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            records = ((f"{path}:{line_number}", line) for line_number, line in enumerate(f, start=1) if line.strip())
+        else:
+            records = ((f"{path}:{line_number}", {key.strip().lower(): value for key, value in raw.items() if key})
+                       for line_number, raw in enumerate(csv.DictReader(f), start=2))
+        for source, record in records:
+            try:
+                yield catalogue_row(json.loads(record) if isinstance(record, str) else record, source)
+            except ValueError as e:  # Also covers malformed JSON lines.
+                yield ValueError(f"{source}: {e}" if isinstance(e, json.JSONDecodeError) else str(e))
+
+def load_template_files(template_name: str) -> Dict[str, bytes]:
+    """Every file of a master template, read once for the whole import."""
+    return core.template_files(template_name)
+
+def merge_catalogue(metadata: dict, row: dict) -> bool:
+    """Refreshes catalogue fields of an existing meta.json from a row. Returns whether anything changed."""
+    changed = False
+    for field in CATALOGUE_FIELDS:
+        if row[field] and metadata.get(field) != row[field]:
+            metadata[field] = row[field]
+            changed = True
+    links = metadata.setdefault("links", {})
+    for name, url in row["links"].items():
+        if url and links.get(name) != url:
+            links[name] = url
+            changed = True
+    return changed
+
+def plan_problem(row: dict, base_path: str, config: dict, template_name: str,
+                 template_files: Dict[str, bytes]) -> Tuple[dict, List[Tuple[str, bytes]], List[Tuple[str, str]]]:
+    """
+    Works out which files a catalogue row needs without touching the disk beyond
+    existence checks. Returns (metadata, [(path, content)], [(path, link source)]).
+    Files that already exist are never overwritten, except meta.json when the row
+    brings new catalogue data; an existing ui/ folder is left alone.
+    """
+    writes: List[Tuple[str, bytes]] = []
+    links: List[Tuple[str, str]] = []
+
+    readme_path = os.path.join(base_path, "README.md")
+    if not os.path.exists(readme_path):
+        writes.append((readme_path, readme_text(row["number"], row["title"]).encode("utf-8")))
+
+    for lang, details in config["languages"].items():
+        for solution_type in SOLUTION_TYPES:
+            file_path = os.path.join(base_path, lang, f"{solution_type}.{details['ext']}")
+            if not os.path.exists(file_path):
+                writes.append((file_path, details["boilerplate"].encode("utf-8")))
+
+    ui_folder = os.path.join(base_path, "ui")
+    if not os.path.isdir(ui_folder):
+        for rel_path, content in template_files.items():
+            if PLACEHOLDER.encode() in content:
+                writes.append((os.path.join(ui_folder, rel_path), content))
+            else:
+                links.append((os.path.join(ui_folder, rel_path), os.path.join(TEMPLATES_DIR, template_name, rel_path)))
+
+    meta_path = os.path.join(base_path, "meta.json")
+    if os.path.exists(meta_path):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        changed = merge_catalogue(metadata, row)
+    else:
+        metadata = new_metadata(row["number"], row["title"], row["slug"], template_name, list(config["languages"]))
+        merge_catalogue(metadata, row)
+        changed = True
+    if changed:
+        writes.append((meta_path, json.dumps(metadata, indent=4).encode("utf-8")))
+    return metadata, writes, links
+
+def import_problem(row: dict, existing_folder: Optional[str], config: dict, template_name: str,
+                   template_files: Dict[str, bytes]) -> Tuple[str, dict, int]:
+    """
+    Plans and writes one catalogue row, holding the problem's lock so a concurrent
+    tool can't change meta.json in between. Returns (problem folder, metadata,
+    number of files written).
+    """
+    base_path = existing_folder or os.path.join(PROBLEMS_DIR, folder_name_for(row["number"], row["slug"]))
+    with problem_lock(base_path), Batch() as batch:
+        metadata, writes, links = plan_problem(row, base_path, config, template_name, template_files)
+        for file_path, content in writes:
+            batch.write(file_path, content)
+        for file_path, source in links:
+            batch.link(file_path, source)
+    return base_path, metadata, len(batch.changed)
+
+def import_catalogue(path: str, template_name: str = DEFAULT_TEMPLATE, writers: int = DEFAULT_WRITERS) -> Dict[str, int]:
+    """
+    Scaffolds every problem listed in a CSV/JSONL catalogue in one process: config,
+    template and problem index are loaded once, files are written by a thread pool,
+    and the index and database are updated in one batch. Re-running the same
+    catalogue changes nothing.
+    """
+    config = load_config()
+    template_files = load_template_files(template_name)
+    if not template_files:
+        print(f"⚠️ Warning: Template '{template_name}' not found, skipping UI files.")
+    known = {
+        int(number): os.path.join(PROBLEMS_DIR, entry["folder"])
+        for number, entry in load_index().items()
+        if os.path.isdir(os.path.join(PROBLEMS_DIR, entry["folder"]))
+    }
+
+    counts = {"created": 0, "updated": 0, "unchanged": 0, "failed": 0, "files": 0}
+    rows = []
+    seen = set()
+    for row in read_catalogue(path):
+        if isinstance(row, ValueError):
+            print(f"❌ {row}")
+            counts["failed"] += 1
+            continue
+        if row["number"] in seen:
+            print(f"⚠️ Problem {row['number']} is listed more than once; using the first row.")
+            continue
+        seen.add(row["number"])
+        rows.append(row)
+
+    def run(row: dict) -> Tuple[str, dict, int]:
+        return import_problem(row, known.get(row["number"]), config, template_name, template_files)
+
+    index_updates = []
+    with ThreadPoolExecutor(max_workers=max(1, writers)) as pool:
+        for row, (problem_folder, metadata, written) in zip(rows, pool.map(run, rows)):
+            if not written:
+                counts["unchanged"] += 1
+                continue
+            counts["updated" if row["number"] in known else "created"] += 1
+            counts["files"] += written
+            index_updates.append((problem_folder, metadata))
+
+    update_index_entries(index_updates)
+    update_db_entries(index_updates)
+    return counts
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("\nUsage: python tools/create_problem.py <problem_number> \"<problem_title>\" [template_name]")
+    parser = argparse.ArgumentParser(
+        description="Scaffold a new problem, or every problem in a CSV/JSONL catalogue.",
+        epilog='Example: python tools/create_problem.py 1 "Two Sum"    |    '
+               'python tools/create_problem.py --from catalogue.csv',
+    )
+    parser.add_argument("problem_number", nargs="?")
+    parser.add_argument("problem_title", nargs="?", help="wrap it in quotes if it contains spaces")
+    parser.add_argument("template_name", nargs="?", default=DEFAULT_TEMPLATE)
+    parser.add_argument("--from", dest="catalogue", metavar="FILE",
+                        help="a .csv or .jsonl of number, title, difficulty, tags and links")
+    parser.add_argument("--template", help=f"template for --from imports (default: {DEFAULT_TEMPLATE})")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_WRITERS,
+                        help="file-writing threads for --from (default: %(default)s)")
+    options = parser.parse_args()
+
+    if options.catalogue:
+        if options.problem_number:
+            parser.error("give either a problem number and title or --from, not both")
+        start = time.perf_counter()
+        try:
+            counts = import_catalogue(options.catalogue, options.template or DEFAULT_TEMPLATE, options.jobs)
+        except OSError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        elapsed = time.perf_counter() - start
+        print(f"\n✅ {counts['created']} created, {counts['updated']} updated, {counts['unchanged']} unchanged, "
+              f"{counts['failed']} failed ({counts['files']} files written in {elapsed:.2f}s).")
+        if counts["created"] or counts["updated"]:
+            print("Render their UIs with: python tools/update_progress.py --all -j 4")
+        sys.exit(1 if counts["failed"] else 0)
+
+    if not options.problem_number or not options.problem_title:
+        parser.print_usage()
         print("Example: python tools/create_problem.py 1 \"Two Sum\"")
         print("Note: Remember to wrap the problem title in quotes if it contains spaces.")
         sys.exit(1)
-    
-    problem_number = sys.argv[1]
-    problem_title = sys.argv[2]
-    # The template name is optional and defaults to 'problem-view'.
-    template_name = sys.argv[3] if len(sys.argv) > 3 else "problem-view"
-    
-    create_problem_folder(problem_number, problem_title, template_name)
\ No newline at end of file
+
+    create_problem_folder(options.problem_number, options.problem_title, options.template or options.template_name)
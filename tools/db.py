@@ -0,0 +1,324 @@
+import os
+import sys
+import csv
+import json
+import sqlite3
+import argparse
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
+
+from problem_index import PROBLEMS_DIR, file_signature, problem_folders
+from readme_parser import find_section, parse_file
+
+# A queryable mirror of every meta.json plus the parsed README fields. The JSON
+# files stay the source of truth; this database is rebuilt from them at any time.
+DB_PATH = os.path.join("tools", "problems.sqlite3")
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS problems (
+    number            INTEGER PRIMARY KEY,
+    folder            TEXT NOT NULL UNIQUE,
+    slug              TEXT,
+    title             TEXT,
+    difficulty        TEXT,
+    solved            INTEGER,
+    notes_complete    INTEGER,
+    template          TEXT,
+    created_at        TEXT,
+    time_complexity   TEXT,
+    space_complexity  TEXT,
+    statement         TEXT,
+    approach          TEXT,
+    notes             TEXT,
+    meta              TEXT,
+    meta_signature    TEXT,
+    readme_signature  TEXT
+);
+CREATE TABLE IF NOT EXISTS tags (
+    number  INTEGER NOT NULL REFERENCES problems(number) ON DELETE CASCADE,
+    tag     TEXT NOT NULL,
+    PRIMARY KEY (number, tag)
+);
+CREATE TABLE IF NOT EXISTS languages (
+    number    INTEGER NOT NULL REFERENCES problems(number) ON DELETE CASCADE,
+    language  TEXT NOT NULL,
+    PRIMARY KEY (number, language)
+);
+CREATE INDEX IF NOT EXISTS problems_difficulty ON problems(difficulty, solved);
+CREATE INDEX IF NOT EXISTS problems_notes ON problems(notes_complete);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags(tag);
+CREATE INDEX IF NOT EXISTS languages_language ON languages(language);
+"""
+
+# Columns shown by `list` and written by `export`.
+LIST_COLUMNS = ("number", "title", "difficulty", "solved", "notes_complete", "time_complexity",
+                "space_complexity", "tags")
+
+def connect(path: str = DB_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        # The database is only a cache of the JSON files, so an old schema is simply dropped.
+        conn.executescript("DROP TABLE IF EXISTS tags; DROP TABLE IF EXISTS languages; DROP TABLE IF EXISTS problems;")
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+def upsert_problem(conn: sqlite3.Connection, problem_folder: str, meta_data: dict,
+                   meta_signature: Optional[list] = None, readme_signature: Optional[list] = None):
+    """Writes one problem's row, tags and languages. The README is parsed here."""
+    number = meta_data.get("problem_number")
+    if number is None:
+        return
+    readme_path = os.path.join(problem_folder, "README.md")
+    document = parse_file(readme_path) if os.path.exists(readme_path) else {"sections": {}, "time": None, "space": None}
+    sections = document["sections"]
+
+    conn.execute("DELETE FROM problems WHERE number = ? OR folder = ?", (number, os.path.basename(problem_folder)))
+    conn.execute(
+        "INSERT INTO problems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            number,
+            os.path.basename(problem_folder),
+            meta_data.get("slug", ""),
+            meta_data.get("title", ""),
+            meta_data.get("difficulty", ""),
+            int(bool(meta_data.get("solved", False))),
+            int(bool(meta_data.get("notes_complete", False))),
+            meta_data.get("template", ""),
+            meta_data.get("created_at", ""),
+            document["time"],
+            document["space"],
+            find_section(sections, "Problem Description"),
+            find_section(sections, "Approach"),
+            find_section(sections, "Notes"),
+            json.dumps(meta_data),
+            json.dumps(meta_signature or file_signature(os.path.join(problem_folder, "meta.json"))),
+            json.dumps(readme_signature or file_signature(readme_path)),
+        ),
+    )
+    conn.executemany("INSERT OR IGNORE INTO tags VALUES (?, ?)", [(number, tag) for tag in meta_data.get("tags", [])])
+    conn.executemany("INSERT OR IGNORE INTO languages VALUES (?, ?)",
+                     [(number, language) for language in meta_data.get("languages", [])])
+
+def update_db_entries(updates: List[Tuple[str, dict]]):
+    """
+    Refreshes the rows of freshly written problems in one transaction. Called next
+    to the index updates by create_problem.py and update_progress.py. Does nothing
+    until the database has been created with `python tools/db.py sync`.
+    """
+    if not updates or not os.path.exists(DB_PATH):
+        return
+    try:
+        with closing(connect()) as conn, conn:
+            for problem_folder, meta_data in updates:
+                upsert_problem(conn, problem_folder, meta_data)
+    except sqlite3.Error as e:
+        print(f"⚠️ Warning: Could not update {DB_PATH}: {e} (run 'python tools/db.py sync --force')")
+
+def update_db_entry(problem_folder: str, meta_data: dict):
+    update_db_entries([(problem_folder, meta_data)])
+
+def sync(force: bool = False) -> Dict[str, int]:
+    """
+    Brings the database in line with every problem folder. A problem is only
+    re-read when the stat (then the hash) of its meta.json or README.md changed.
+    """
+    counts = {"updated": 0, "unchanged": 0, "removed": 0}
+    with closing(connect()) as conn, conn:
+        stored = {
+            row["folder"]: (json.loads(row["meta_signature"] or "null"), json.loads(row["readme_signature"] or "null"))
+            for row in conn.execute("SELECT folder, meta_signature, readme_signature FROM problems")
+        }
+        seen = set()
+        for problem_folder in problem_folders():
+            folder_name = os.path.basename(problem_folder)
+            meta_path = os.path.join(problem_folder, "meta.json")
+            previous_meta, previous_readme = stored.get(folder_name, (None, None))
+            meta_signature = file_signature(meta_path, previous_meta)
+            if meta_signature is None:
+                continue
+            seen.add(folder_name)
+            readme_signature = file_signature(os.path.join(problem_folder, "README.md"), previous_readme)
+            if (not force and previous_meta and meta_signature[2] == previous_meta[2]
+                    and (readme_signature or [None] * 3)[2] == (previous_readme or [None] * 3)[2]):
+                counts["unchanged"] += 1
+                if meta_signature != previous_meta or readme_signature != previous_readme:
+                    # Touched but identical: remember the new stat so the next sync skips hashing.
+                    conn.execute("UPDATE problems SET meta_signature = ?, readme_signature = ? WHERE folder = ?",
+                                 (json.dumps(meta_signature), json.dumps(readme_signature), folder_name))
+                continue
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta_data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Warning: Could not read {meta_path}: {e}")
+                continue
+            upsert_problem(conn, problem_folder, meta_data, meta_signature, readme_signature)
+            counts["updated"] += 1
+
+        for folder_name in set(stored) - seen:
+            conn.execute("DELETE FROM problems WHERE folder = ?", (folder_name,))
+            counts["removed"] += 1
+    return counts
+
+def ensure_db():
+    """Builds the database on first use so queries never need a separate step."""
+    if not os.path.exists(DB_PATH):
+        counts = sync()
+        print(f"🗄️  Created {DB_PATH} with {counts['updated']} problem(s).\n", file=sys.stderr)
+
+def query_problems(difficulty: Optional[str] = None, tag: Optional[str] = None, solved: Optional[bool] = None,
+                   notes_complete: Optional[bool] = None, language: Optional[str] = None,
+                   template: Optional[str] = None, text: Optional[str] = None) -> List[dict]:
+    """Filters problems through the indexes. Every argument is optional."""
+    where, params = [], []
+    if difficulty:
+        where.append("p.difficulty = ? COLLATE NOCASE")
+        params.append(difficulty)
+    if tag:
+        where.append("p.number IN (SELECT number FROM tags WHERE tag = ?)")
+        params.append(tag)
+    if language:
+        where.append("p.number IN (SELECT number FROM languages WHERE language = ?)")
+        params.append(language)
+    if solved is not None:
+        where.append("p.solved = ?")
+        params.append(int(solved))
+    if notes_complete is not None:
+        where.append("p.notes_complete = ?")
+        params.append(int(notes_complete))
+    if template:
+        where.append("p.template = ?")
+        params.append(template)
+    if text:
+        where.append("(p.title LIKE ? OR p.statement LIKE ? OR p.approach LIKE ? OR p.notes LIKE ?)")
+        params.extend([f"%{text}%"] * 4)
+
+    sql = ("SELECT p.*, (SELECT group_concat(tag, ',') FROM tags t WHERE t.number = p.number) AS tags "
+           "FROM problems p" + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY p.number")
+    with closing(connect()) as conn:
+        return [dict(row) for row in conn.execute(sql, params)]
+
+def run_sql(sql: str) -> Tuple[List[str], List[tuple]]:
+    """Runs a read-only statement (the connection is opened in read-only mode)."""
+    with closing(sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)) as conn:
+        cursor = conn.execute(sql)
+        columns = [description[0] for description in cursor.description or []]
+        return columns, cursor.fetchall()
+
+def stats() -> Dict[str, list]:
+    with closing(connect()) as conn:
+        return {
+            "difficulty": [tuple(row) for row in conn.execute(
+                "SELECT difficulty, count(*), sum(solved) FROM problems GROUP BY difficulty ORDER BY difficulty")],
+            "tags": [tuple(row) for row in conn.execute(
+                "SELECT t.tag, count(*), sum(p.solved) FROM tags t JOIN problems p USING (number) "
+                "GROUP BY t.tag ORDER BY count(*) DESC, t.tag LIMIT 20")],
+        }
+
+def export(rows: List[dict], fmt: str, out) -> int:
+    """Writes rows as json, jsonl or csv (the csv omits the long text columns)."""
+    for row in rows:
+        row["meta"] = json.loads(row["meta"])
+        row.pop("meta_signature", None)
+        row.pop("readme_signature", None)
+        row["tags"] = row["tags"].split(",") if row.get("tags") else []
+    if fmt == "json":
+        json.dump(rows, out, indent=2, ensure_ascii=False)
+        out.write("\n")
+    elif fmt == "jsonl":
+        for row in rows:
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    else:
+        writer = csv.writer(out)
+        writer.writerow(LIST_COLUMNS)
+        for row in rows:
+            writer.writerow([",".join(row[column]) if column == "tags" else row[column] for column in LIST_COLUMNS])
+    return len(rows)
+
+def print_table(columns: List[str], rows: List[tuple]):
+    if not columns:
+        return
+    cells = [[("" if value is None else str(value)).replace("\n", " ")[:60] for value in row] for row in rows]
+    widths = [max([len(column)] + [len(row[i]) for row in cells]) for i, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in cells:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+
+def _tristate(yes: bool, no: bool) -> Optional[bool]:
+    return True if yes else False if no else None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Query a SQLite mirror of every problem's meta.json and README.",
+        epilog='Example: python tools/db.py list --difficulty Medium --tag hash-table --unsolved',
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = commands.add_parser("sync", help="update the database from the problem folders")
+    sync_parser.add_argument("--force", action="store_true", help="re-read every problem")
+
+    def add_filters(subparser):
+        subparser.add_argument("--difficulty")
+        subparser.add_argument("--tag")
+        subparser.add_argument("--language")
+        subparser.add_argument("--template")
+        subparser.add_argument("--text", help="substring of the title, statement, approach or notes")
+        subparser.add_argument("--solved", action="store_true")
+        subparser.add_argument("--unsolved", action="store_true")
+        subparser.add_argument("--notes-complete", action="store_true")
+        subparser.add_argument("--notes-incomplete", action="store_true")
+
+    add_filters(commands.add_parser("list", help="list problems matching the filters"))
+    export_parser = commands.add_parser("export", help="export matching problems")
+    add_filters(export_parser)
+    export_parser.add_argument("--format", choices=("json", "jsonl", "csv"), default="json")
+    export_parser.add_argument("--out", help="output file (default: stdout)")
+    sql_parser = commands.add_parser("sql", help="run a read-only SQL query")
+    sql_parser.add_argument("query")
+    commands.add_parser("stats", help="counts per difficulty and tag")
+    options = parser.parse_args()
+
+    if options.command == "sync":
+        counts = sync(force=options.force)
+        print(f"✅ Synced {DB_PATH}: {counts['updated']} updated, {counts['unchanged']} unchanged, "
+              f"{counts['removed']} removed.")
+        sys.exit(0)
+
+    if not os.path.isdir(PROBLEMS_DIR):
+        print(f"❌ Error: '{PROBLEMS_DIR}/' not found. Run this from the repository root.")
+        sys.exit(1)
+    ensure_db()
+
+    try:
+        if options.command in ("list", "export"):
+            rows = query_problems(
+                difficulty=options.difficulty, tag=options.tag, language=options.language,
+                template=options.template, text=options.text,
+                solved=_tristate(options.solved, options.unsolved),
+                notes_complete=_tristate(options.notes_complete, options.notes_incomplete),
+            )
+            if options.command == "list":
+                print_table(list(LIST_COLUMNS), [tuple(row[column] for column in LIST_COLUMNS) for row in rows])
+                print(f"\n{len(rows)} problem(s).")
+            elif options.out:
+                with open(options.out, "w", encoding="utf-8", newline="") as f:
+                    count = export(rows, options.format, f)
+                print(f"✅ Exported {count} problem(s) to {options.out}")
+            else:
+                export(rows, options.format, sys.stdout)
+        elif options.command == "sql":
+            print_table(*run_sql(options.query))
+        elif options.command == "stats":
+            summary = stats()
+            print_table(["difficulty", "problems", "solved"], summary["difficulty"])
+            print()
+            print_table(["tag", "problems", "solved"], summary["tags"])
+    except sqlite3.Error as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,564 @@
+import os
+import sys
+import gzip
+import html
+import json
+import hashlib
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # Optional: .br copies are only written when it is installed.
+    brotli = None
+
+try:
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name, get_lexer_for_filename
+    from pygments.util import ClassNotFound
+except ImportError:  # Optional: without it code is exported as plain, escaped text.
+    highlight = None
+
+from bench_history import results_fingerprint
+from fileio import Batch, locked, problem_lock, write_json
+from problem_index import file_signature, find_problem_folder, load_index
+from spans import span, take_trace_option
+from update_progress import (
+    aggregate_problem_data,
+    attach_test_results,
+    list_problem_folders,
+    load_config,
+    load_test_results,
+    master_template_path,
+    problem_input_paths,
+    test_results_path,
+)
+
+# Exports every problem as a self-contained static HTML page: the same data
+# update_progress.py aggregates, rendered and syntax-highlighted here at build
+# time, so a plain static file server can show it with no JavaScript at all.
+#
+#   site/index.html                      the problem list (the stable entry point)
+#   site/problems/<folder>.<hash>.html   one page per problem
+#   site/assets/style.<hash>.css         shared stylesheet, including code colours
+#
+# Every file also gets a .gz copy (and .br with brotli installed). Pages and the
+# stylesheet are named by their content hash, so they can be served with
+# far-future cache headers; only index.html must be revalidated.
+
+OUTPUT_DIR = "site"
+# Inside the output folder: what each page was built from (see is_up_to_date).
+MANIFEST_FILE = ".export_manifest.json"
+# Bumped whenever the page markup changes, forcing one full re-export.
+EXPORT_VERSION = 1
+PAGES_DIR = "problems"
+ASSETS_DIR = "assets"
+HASH_LENGTH = 10
+CODE_STYLE = "default"  # Pygments colour scheme.
+DEFAULT_JOBS = os.cpu_count() or 1
+
+SOLUTION_LABELS = {"user_solution": "Your Solution", "leetcode_solution": "LeetCode Solution"}
+DEFAULT_BOILERPLATE = "// Your code solution will appear here.\n// Edit the corresponding file and run the update script."
+
+BASE_CSS = """\
+*{box-sizing:border-box}
+body{margin:0;padding:2rem;background:#fafafa;color:#111827;font:16px/1.5 system-ui,-apple-system,"Segoe UI",sans-serif}
+a{color:inherit}
+.page{max-width:72rem;margin:0 auto}
+.card{background:#fff;border:4px solid #111827;border-radius:.5rem;padding:1.5rem;margin-bottom:1.5rem;box-shadow:0 10px 15px -3px rgba(0,0,0,.1)}
+header.card{box-shadow:8px 8px 0 #000}
+h1{margin:0;font-size:2.25rem;font-weight:800;letter-spacing:-.025em}
+h2,h3{margin:0 0 .75rem}
+.number{display:inline-block;margin-right:.75rem;padding:.25rem .75rem;background:#111827;color:#fff;border-radius:2px}
+.chips{display:flex;flex-wrap:wrap;gap:.75rem;margin-top:.75rem;font-size:.875rem}
+.chip{padding:.25rem .5rem;border:2px solid #111827;border-radius:2px;background:#f3f4f6;font-size:.75rem;font-weight:600}
+.easy{color:#15803d;background:#dcfce7;border-color:#15803d}
+.medium{color:#a16207;background:#fef9c3;border-color:#a16207}
+.hard{color:#b91c1c;background:#fee2e2;border-color:#b91c1c}
+.status{display:flex;flex-wrap:wrap;gap:.5rem 1.5rem;margin-top:1rem;padding-top:1rem;border-top:2px solid #111827;font-size:.875rem;font-weight:600;color:#6b7280}
+.done,.pass{color:#15803d}
+.fail{color:#b91c1c}
+.layout{display:grid;grid-template-columns:1fr;gap:1.5rem}
+@media (min-width:768px){.layout{grid-template-columns:2fr 1fr}}
+.text{white-space:pre-line;color:#1f2937}
+.grid2{display:grid;grid-template-columns:1fr 1fr;gap:1rem;margin-top:1rem}
+.box{border:2px solid #111827;border-radius:.25rem;padding:.75rem;background:#f9fafb}
+.box h4{margin:0 0 .5rem;font-size:.875rem}
+hr{border:0;border-top:1px solid #111827;margin:1rem 0}
+details{border:2px solid #111827;border-radius:.25rem;margin-top:.75rem}
+summary{cursor:pointer;padding:.5rem .75rem;font-weight:700}
+details>div{padding:0 .75rem .75rem}
+pre{overflow-x:auto;margin:.5rem 0 0;padding:1rem;background:#f7f7f7;border:2px solid #111827;border-radius:.25rem;font-size:.875rem;line-height:1.45}
+code,.mono{font-family:ui-monospace,SFMono-Regular,Menlo,Consolas,monospace}
+.finding{margin-top:.5rem;padding:.5rem;border:2px solid #ca8a04;border-radius:.25rem;background:#fefce8;font-size:.875rem}
+.finding.info{border-color:#9ca3af;background:#f9fafb}
+.example{margin-top:.75rem;font-size:.875rem}
+.example p{margin:.25rem 0}
+table{width:100%;border-collapse:collapse;font-size:.875rem}
+th,td{padding:.5rem;text-align:left;border-top:2px solid #111827}
+thead th{background:#f3f4f6;border-top:0}
+.card>table{border:2px solid #111827}
+.muted{color:#6b7280;font-size:.75rem}
+aside ul{margin:.75rem 0 0;padding:0;list-style:none;font-size:.875rem}
+aside li{margin-bottom:.5rem}
+aside h5{margin:1rem 0 .5rem;padding-top:1rem;border-top:2px solid #111827;font-size:1rem}
+"""
+
+# --- Code highlighting ---
+
+_lexers: Dict[str, object] = {}
+
+def code_lexer(lang: str, ext: str):
+    """The Pygments lexer for a configured language, by name and then by file extension; None if unknown."""
+    if lang not in _lexers:
+        lexer = None
+        try:
+            lexer = get_lexer_by_name(lang)
+        except ClassNotFound:
+            try:
+                lexer = get_lexer_for_filename(f"solution.{ext}")
+            except ClassNotFound:
+                pass
+        _lexers[lang] = lexer
+    return _lexers[lang]
+
+def highlight_code(source: str, lang: str, ext: str) -> str:
+    """Returns the source as a highlighted <pre> block, or as escaped plain text without Pygments."""
+    lexer = code_lexer(lang, ext) if highlight is not None else None
+    if lexer is None:
+        body = html.escape(source)
+    else:
+        with span("highlight", lang=lang):
+            body = highlight(source, lexer, HtmlFormatter(nowrap=True))
+    return f'<pre class="highlight"><code>{body}</code></pre>'
+
+def stylesheet() -> str:
+    if highlight is None:
+        return BASE_CSS
+    return BASE_CSS + HtmlFormatter(style=CODE_STYLE).get_style_defs(".highlight") + "\n"
+
+# --- Page rendering ---
+
+def esc(value) -> str:
+    return html.escape(str(value), quote=True)
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3g} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3g} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.3g} µs"
+    return f"{seconds * 1e9:.3g} ns"
+
+def format_bytes(size: int) -> str:
+    if size >= 1024 ** 2:
+        return f"{size / 1024 ** 2:.3g} MiB"
+    if size >= 1024:
+        return f"{size / 1024:.3g} KiB"
+    return f"{size} B"
+
+def format_date(timestamp: str) -> str:
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return esc(timestamp or "")
+    return f"{moment:%B} {moment.day}, {moment.year}"
+
+def check(passed: bool) -> str:
+    return "✓" if passed else "✗"
+
+def render_code(final_data: dict, config: dict) -> str:
+    """One collapsible block per language (the first open), each with both solutions."""
+    findings = final_data.get("perflint", {}).get("solutions", {})
+    parts = []
+    for i, (lang, solutions) in enumerate(final_data["code"].items()):
+        ext = config["languages"].get(lang, {}).get("ext", "")
+        parts.append(f'<details{" open" if i == 0 else ""}><summary>{esc(lang.upper())}</summary><div>')
+        for solution_type, label in SOLUTION_LABELS.items():
+            parts.append(f"<h4>{label}</h4>")
+            parts.append(highlight_code(solutions.get(solution_type) or DEFAULT_BOILERPLATE, lang, ext))
+            if lang == "python":
+                for finding in findings.get(solution_type, []):
+                    parts.append(
+                        f'<div class="finding {esc(finding["severity"])}"><strong>Line {esc(finding["line"])}: '
+                        f'{esc(finding["message"])}</strong> <span class="mono muted">[{esc(finding["rule"])}]</span>'
+                        f'<div>{esc(finding["impact"])}</div></div>'
+                    )
+            profile = final_data.get("profiles", {}).get(solution_type) if lang == "python" else None
+            if profile:
+                parts.append(render_profile(profile))
+        parts.append("</div></details>")
+    return "".join(parts)
+
+def render_profile(profile: dict) -> str:
+    rows = "".join(
+        f'<tr><td>{format_seconds(hotspot["self_seconds"])}</td><td>{format_seconds(hotspot["total_seconds"])}</td>'
+        f'<td>{hotspot["calls"]:,}</td><td class="mono">{esc(hotspot["function"])} '
+        f'<span class="muted">({esc(hotspot["location"])})</span></td></tr>'
+        for hotspot in profile["hotspots"][:5]
+    )
+    return (
+        f'<div class="box" style="margin-top:.75rem"><strong>Where time goes at n = {profile["size"]:,} '
+        f'({format_seconds(profile["seconds"] / profile["repeat"])} per call under cProfile)</strong>'
+        f"<table><thead><tr><th>Own time</th><th>Total</th><th>Calls</th><th>Function</th></tr></thead>"
+        f"<tbody>{rows}</tbody></table></div>"
+    )
+
+def render_examples(examples: List[dict]) -> str:
+    if not examples:
+        return ""
+    parts = ['<section class="card"><h3>Examples</h3>']
+    for i, example in enumerate(examples, 1):
+        results = "".join(
+            f' <span class="{"pass" if passed else "fail"}">{check(passed)} '
+            f'{"Yours" if solution == "user_solution" else "LeetCode"}</span>'
+            for solution, passed in example.get("results", {}).items()
+        )
+        parts.append(
+            f'<div class="box example"><h4>Example {i}{results}</h4>'
+            f'<p class="mono"><strong>Input:</strong> {esc(example.get("input", ""))}</p>'
+            f'<p class="mono"><strong>Output:</strong> {esc(example.get("output", ""))}</p>'
+        )
+        if example.get("explanation"):
+            parts.append(f'<p><strong>Explanation:</strong> {esc(example["explanation"])}</p>')
+        parts.append("</div>")
+    parts.append("</section>")
+    return "".join(parts)
+
+def render_performance(performance: Optional[dict]) -> str:
+    """The UI's scaling chart as a table of median times, plus the fitted classes."""
+    if not performance:
+        return ""
+    solutions = performance["solutions"]
+    head = "".join(f"<th>{SOLUTION_LABELS.get(t, esc(t))}</th>" for t in solutions)
+    timings = "".join(
+        f"<tr><td>{size:,}</td>" + "".join(
+            f'<td>{format_seconds(result["seconds"][i]) if result["seconds"][i] is not None else "—"}</td>'
+            for result in solutions.values()
+        ) + "</tr>"
+        for i, size in enumerate(performance["sizes"])
+    )
+    summary = []
+    for solution_type, result in solutions.items():
+        peak = next((size for size in reversed(result["peakBytes"]) if size is not None), None)
+        measured = format_date(result["run"]) + (f' <span class="mono">@ {esc(result["commit"][:7])}</span>'
+                                                 if result.get("commit") else "")
+        summary.append(
+            f'<tr><td><strong>{SOLUTION_LABELS.get(solution_type, esc(solution_type))}</strong></td>'
+            f'<td class="mono">{esc(result.get("timeClass") or "—")}</td>'
+            f'<td class="mono">{esc(result.get("spaceClass") or "—")}</td>'
+            f'<td>{format_bytes(peak) if peak is not None else "—"}</td><td class="muted">{measured}</td></tr>'
+        )
+    return (
+        f'<section class="card"><h3>Performance</h3>'
+        f'<p class="muted">Median time per call of <code>{esc(performance["method"])}</code> (Python) by input size.</p>'
+        f"<table><thead><tr><th>n</th>{head}</tr></thead><tbody>{timings}</tbody></table><br>"
+        f"<table><thead><tr><th>Solution</th><th>Fitted time</th><th>Fitted space</th>"
+        f"<th>Peak memory (largest n)</th><th>Measured</th></tr></thead><tbody>{''.join(summary)}</tbody></table>"
+        f"</section>"
+    )
+
+def render_sidebar(final_data: dict) -> str:
+    solved = final_data.get("solved", False)
+    parts = [
+        '<aside><div class="card"><h3>Metadata</h3><ul>',
+        f'<li><strong>Status:</strong> {"Solved" if solved else "In Progress"}</li>',
+        f'<li><strong>Difficulty:</strong> {esc(final_data.get("difficulty", ""))}</li>',
+        f'<li><strong>Languages:</strong> {esc(", ".join(lang.upper() for lang in final_data["code"]))}</li>',
+        f'<li><strong>Created:</strong> {format_date(final_data.get("created_at"))}</li></ul>',
+    ]
+    tests = final_data.get("tests")
+    if tests:
+        parts.append(f'<h5>Tests ({tests["total"]} cases)</h5>'
+                     f'<p class="muted">Last run {format_date(tests.get("last_run"))}</p><ul>')
+        for solution_type, result in tests["solutions"].items():
+            timing = f' in {result["seconds"] * 1000:.2f} ms' if "seconds" in result else ""
+            parts.append(
+                f'<li class="{"fail" if result["failed"] else "pass"}"><strong>'
+                f'{SOLUTION_LABELS.get(solution_type, esc(solution_type))}:</strong> {result["passed"]}/'
+                f'{result["passed"] + result["failed"]} passed{timing}</li>'
+            )
+        parts.append("</ul>")
+    links = final_data.get("links", {})
+    parts.append("<h5>Quick Links</h5><ul>")
+    for key, label in (("github", "Edit on GitHub"), ("leetcode", "View on LeetCode"), ("discussion", "View Discussion")):
+        if links.get(key):
+            parts.append(f'<li><a href="{esc(links[key])}">{label}</a></li>')
+    parts.append('</ul><h5>All Problems</h5><ul><li><a href="../index.html">Back to the index</a></li></ul>')
+    parts.append("</div></aside>")
+    return "".join(parts)
+
+def render_page(final_data: dict, config: dict, stylesheet_href: str) -> str:
+    """A problem's complete HTML page, laid out like the master template."""
+    number = final_data.get("problem_number", 0)
+    title = final_data.get("title", "")
+    difficulty = final_data.get("difficulty", "")
+    tags = "".join(f'<span class="chip">{esc(tag)}</span>' for tag in final_data.get("tags", []))
+    solved = final_data.get("solved", False)
+    notes_complete = final_data.get("notes_complete", False)
+    leetcode = final_data.get("links", {}).get("leetcode")
+    return (
+        f'<!doctype html><html lang="en"><head><meta charset="utf-8">'
+        f'<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>#{number} {esc(title)}</title>"
+        f'<link rel="stylesheet" href="{stylesheet_href}"></head><body><div class="page">'
+        f'<header class="card"><h1><span class="number">#{int(number):04d}</span>{esc(title)}</h1>'
+        f'<div class="chips"><span class="chip {esc(difficulty.lower())}">{esc(difficulty)}</span>{tags}'
+        + (f' <a class="chip" href="{esc(leetcode)}">View on LeetCode</a>' if leetcode else "")
+        + f'</div><div class="status"><span class="{"done" if solved else ""}">{check(solved)} Problem Solved</span>'
+        f'<span class="{"done" if notes_complete else ""}">{check(notes_complete)} Notes Complete</span>'
+        f'<span>Created: {format_date(final_data.get("created_at"))}</span></div></header>'
+        f'<main class="layout"><section><article class="card"><h2>Problem</h2>'
+        f'<p class="text">{esc(final_data.get("statement") or "Problem statement not available.")}</p><hr>'
+        f'<h3>Approach</h3><p class="text">{esc(final_data.get("approach") or "No approach documented yet.")}</p>'
+        f'<div class="grid2"><div class="box"><h4>Time Complexity</h4>{esc(final_data.get("timeComplexity") or "N/A")}</div>'
+        f'<div class="box"><h4>Space Complexity</h4>{esc(final_data.get("spaceComplexity") or "N/A")}</div></div><hr>'
+        f"{render_code(final_data, config)}</article>"
+        f"{render_examples(final_data.get('examples', []))}"
+        f"{render_performance(final_data.get('performance'))}"
+        f'<section class="card"><h3>Notes</h3><p class="text">'
+        f'{esc(final_data.get("notes") or "Add your implementation notes, edge cases, and insights here.")}</p></section>'
+        f"</section>{render_sidebar(final_data)}</main></div></body></html>\n"
+    )
+
+def render_index(problems: Dict[str, dict], pages: Dict[str, str], stylesheet_href: str) -> str:
+    """The problem list; problems without an exported page are listed without a link."""
+    rows = []
+    for entry in problems.values():
+        page = pages.get(entry["folder"])
+        title = esc(entry["title"])
+        link = f'<a href="{esc(page)}">{title}</a>' if page else title
+        tags = " ".join(f'<span class="chip">{esc(tag)}</span>' for tag in entry.get("tags", []))
+        rows.append(
+            f'<tr><td class="mono">{int(entry["number"]):04d}</td><td>{link}</td>'
+            f'<td><span class="chip {esc(entry["difficulty"].lower())}">{esc(entry["difficulty"])}</span></td>'
+            f'<td>{tags}</td><td class="{"pass" if entry.get("solved") else ""}">{check(entry.get("solved"))}</td></tr>'
+        )
+    solved = sum(1 for entry in problems.values() if entry.get("solved"))
+    return (
+        f'<!doctype html><html lang="en"><head><meta charset="utf-8">'
+        f'<meta name="viewport" content="width=device-width, initial-scale=1"><title>LeetCode Problems</title>'
+        f'<link rel="stylesheet" href="{stylesheet_href}"></head><body><div class="page">'
+        f'<header class="card"><h1>LeetCode Problems</h1>'
+        f'<div class="status">{solved} of {len(problems)} solved</div></header>'
+        f'<section class="card"><table><thead><tr><th>#</th><th>Title</th><th>Difficulty</th><th>Tags</th>'
+        f'<th>Solved</th></tr></thead><tbody>{"".join(rows)}</tbody></table></section></div></body></html>\n'
+    )
+
+# --- Output files ---
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha1(content).hexdigest()[:HASH_LENGTH]
+
+def hashed_name(stem: str, suffix: str, content: bytes) -> str:
+    return f"{stem}.{content_hash(content)}{suffix}"
+
+def with_compressed(relpath: str, content: bytes) -> Dict[str, bytes]:
+    """A file plus its precompressed copies, keyed by path relative to the output folder."""
+    with span("compress"):
+        # mtime=0 keeps the .gz byte-identical across exports of unchanged pages.
+        files = {relpath: content, relpath + ".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            files[relpath + ".br"] = brotli.compress(content)
+    return files
+
+# --- Export manifest ---
+
+def manifest_path(out_dir: str) -> str:
+    return os.path.join(out_dir, MANIFEST_FILE)
+
+def load_manifest(out_dir: str) -> dict:
+    try:
+        with open(manifest_path(out_dir), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"problems": {}}
+
+def export_input_paths(problem_folder: str, meta_data: dict, config: dict) -> List[str]:
+    """
+    The inputs of update_progress.py's build, minus the master template the export
+    does not use, plus the test results, which the pages (not committed) include.
+    """
+    template_path = master_template_path(meta_data.get("template", ""))
+    paths = [path for path in problem_input_paths(problem_folder, meta_data, config) if path != template_path]
+    return paths + [test_results_path(problem_folder)]
+
+def is_up_to_date(entry: Optional[dict], problem_folder: str, out_dir: str, stylesheet_name: str) -> bool:
+    """
+    Like update_progress.is_up_to_date: stats first, re-hashing only files whose
+    stat changed. A page is also stale when the markup or the stylesheet changed.
+    """
+    if not entry or entry.get("version") != EXPORT_VERSION or entry.get("stylesheet") != stylesheet_name:
+        return False
+    if not os.path.isfile(os.path.join(out_dir, entry["page"])):
+        return False
+    if entry.get("results") != results_fingerprint(os.path.basename(problem_folder)):
+        return False
+    for path, previous in entry["inputs"].items():
+        current = file_signature(path, previous)
+        if current is None or previous is None:
+            if current != previous:
+                return False
+        elif current[2] != previous[2]:
+            return False
+        else:
+            entry["inputs"][path] = current
+    return True
+
+# --- Export ---
+
+# Set once per worker process by `_init_worker`, as in update_progress.py.
+_worker_config: dict = {}
+_worker_stylesheet: str = ""
+
+def _init_worker(config: dict, stylesheet_name: str):
+    global _worker_config, _worker_stylesheet
+    _worker_config = config
+    _worker_stylesheet = stylesheet_name
+
+def _export_problem(problem_folder: str) -> Tuple[str, Optional[dict], Dict[str, bytes], str]:
+    """
+    Renders one problem's page. Returns (problem_folder, manifest entry or None
+    on failure, files to write keyed by output-relative path, message).
+    """
+    folder_name = os.path.basename(problem_folder)
+    with span("export_problem", problem=folder_name), problem_lock(problem_folder):
+        try:
+            with open(os.path.join(problem_folder, "meta.json"), "r", encoding="utf-8") as f:
+                meta_data = json.load(f)
+            final_data = aggregate_problem_data(problem_folder, meta_data, _worker_config)
+            final_data = attach_test_results(final_data, load_test_results(problem_folder))
+            with span("render"):
+                page = render_page(final_data, _worker_config, f"../{ASSETS_DIR}/{_worker_stylesheet}").encode("utf-8")
+            entry = {
+                "version": EXPORT_VERSION,
+                "page": f"{PAGES_DIR}/{hashed_name(folder_name, '.html', page)}",
+                "stylesheet": _worker_stylesheet,
+                "inputs": {
+                    path: file_signature(path)
+                    for path in export_input_paths(problem_folder, meta_data, _worker_config)
+                },
+                "results": results_fingerprint(folder_name),
+            }
+        except Exception as e:
+            return problem_folder, None, {}, f"❌ {folder_name}: {type(e).__name__}: {e}"
+    return problem_folder, entry, with_compressed(entry["page"], page), f"   - 📄 Exported {entry['page']}"
+
+def live_files(manifest: dict, stylesheet_name: str) -> set:
+    """Every page in the manifest and the stylesheets they link, which may predate this export's."""
+    files = {"index.html", f"{ASSETS_DIR}/{stylesheet_name}"}
+    for entry in manifest["problems"].values():
+        files.add(entry["page"])
+        files.add(f"{ASSETS_DIR}/{entry['stylesheet']}")
+    return files
+
+def stale_files(out_dir: str, manifest: dict, stylesheet_name: str) -> List[str]:
+    """Superseded pages and stylesheets (and their compressed copies) left in the output folder."""
+    live = live_files(manifest, stylesheet_name)
+    stale = []
+    for folder in (PAGES_DIR, ASSETS_DIR):
+        try:
+            names = os.listdir(os.path.join(out_dir, folder))
+        except FileNotFoundError:
+            continue
+        for name in names:
+            relpath = f"{folder}/{name}"
+            base = relpath[:-3] if relpath.endswith((".gz", ".br")) else relpath
+            if base not in live and not name.startswith("."):
+                stale.append(relpath)
+    return stale
+
+def export(folders: List[str], out_dir: str, force: bool = False, jobs: int = 1, prune: bool = False) -> Dict[str, int]:
+    """
+    Exports the pages of those `folders` whose inputs changed since the last
+    export, rewrites the index and removes superseded files. With `prune`,
+    pages of problems not in `folders` are removed too. Returns the counts of
+    exported, unchanged and failed problems.
+    """
+    css = stylesheet().encode("utf-8")
+    stylesheet_name = hashed_name("style", ".css", css)
+
+    with locked("export"):
+        manifest = load_manifest(out_dir)
+        with span("up_to_date_check", problems=len(folders)):
+            stale = [
+                problem_folder for problem_folder in folders
+                if force or not is_up_to_date(manifest["problems"].get(os.path.basename(problem_folder)),
+                                              problem_folder, out_dir, stylesheet_name)
+            ]
+        counts = {"exported": 0, "skipped": len(folders) - len(stale), "failed": 0}
+
+        config = load_config()
+        if jobs > 1 and len(stale) > 1:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=(config, stylesheet_name)) as pool:
+                chunksize = max(1, len(stale) // (jobs * 4))
+                results = list(pool.map(_export_problem, stale, chunksize=chunksize))
+        else:
+            _init_worker(config, stylesheet_name)
+            results = [_export_problem(problem_folder) for problem_folder in stale]
+
+        with Batch() as batch:
+            for relpath, content in with_compressed(f"{ASSETS_DIR}/{stylesheet_name}", css).items():
+                batch.write(os.path.join(out_dir, relpath), content)
+            for problem_folder, entry, files, message in results:
+                print(message)
+                if entry is None:
+                    counts["failed"] += 1
+                    continue
+                for relpath, content in files.items():
+                    batch.write(os.path.join(out_dir, relpath), content)
+                manifest["problems"][os.path.basename(problem_folder)] = entry
+                counts["exported"] += 1
+
+            if prune:
+                names = {os.path.basename(folder) for folder in folders}
+                manifest["problems"] = {name: entry for name, entry in manifest["problems"].items() if name in names}
+            problems = load_index()
+            pages = {name: entry["page"] for name, entry in manifest["problems"].items()}
+            index = render_index(problems, pages, f"{ASSETS_DIR}/{stylesheet_name}").encode("utf-8")
+            for relpath, content in with_compressed("index.html", index).items():
+                batch.write(os.path.join(out_dir, relpath), content)
+            for relpath in stale_files(out_dir, manifest, stylesheet_name):
+                batch.remove(os.path.join(out_dir, relpath))
+
+        # Written last: an interrupted export just redoes its problems next time.
+        write_json(manifest_path(out_dir), manifest, indent=1, sort_keys=True)
+    return counts
+
+if __name__ == "__main__":
+    # --trace (to stderr) or --trace=FILE writes JSON-lines timings of each phase (see spans.py).
+    sys.argv[1:] = take_trace_option(sys.argv[1:])
+    parser = argparse.ArgumentParser(
+        description="Export problems as static, pre-highlighted HTML pages with an index, "
+                    "content-hashed file names and .gz/.br copies.",
+        epilog="Example: python tools/export_static.py    |    python tools/export_static.py 1 --out public",
+    )
+    parser.add_argument("problems", nargs="*", metavar="problem_number",
+                        help="export only these problems (default: all, removing pages of deleted problems)")
+    parser.add_argument("--out", default=OUTPUT_DIR, help=f"output folder (default: {OUTPUT_DIR})")
+    parser.add_argument("--force", action="store_true", help="re-export problems whose inputs did not change")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS, help="worker processes")
+    options = parser.parse_args()
+
+    if options.problems:
+        folders = []
+        for number in options.problems:
+            problem_folder = find_problem_folder(number)
+            if not problem_folder:
+                print(f"❌ Error: Problem {number} not found.")
+                sys.exit(1)
+            folders.append(problem_folder)
+    else:
+        folders = list_problem_folders()
+
+    if highlight is None:
+        print("⚠️ Pygments is not installed; code is exported without highlighting (pip install pygments).")
+    counts = export(folders, options.out, force=options.force, jobs=max(1, options.jobs), prune=not options.problems)
+    print(f"\n✅ Exported {counts['exported']} problem(s) to {options.out}/, "
+          f"{counts['skipped']} unchanged, {counts['failed']} failed.")
+    sys.exit(1 if counts["failed"] else 0)
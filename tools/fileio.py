@@ -0,0 +1,228 @@
+import os
+import json
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from spans import span
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks become no-ops, writes stay atomic.
+    fcntl = None
+
+# The one way the tools write files they share with each other, the viewer and
+# Vite. Every write goes to a temporary file in the target's folder and is moved
+# into place with os.replace, so readers see the old file or the new one, never
+# a torn one. A write whose content is byte-identical to the file on disk is
+# skipped, leaving its mtime alone (no needless Vite recompiles or manifest
+# re-hashes). Read-modify-write sequences are serialized across processes with
+# advisory locks (see `locked`).
+
+LOCKS_DIR = os.path.join("tools", ".locks")
+
+def _same_content(path: str, content: bytes) -> bool:
+    try:
+        if os.path.getsize(path) != len(content):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == content
+    except OSError:
+        return False
+
+def _stage(path: str, content: bytes) -> str:
+    """Writes `content` to a new temporary file next to `path` and returns its name."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        if os.path.exists(path):
+            os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+        else:
+            # mkstemp creates 0600; give new files the usual permissions.
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return temp_path
+
+def write_bytes(path: str, content: bytes) -> bool:
+    """Atomically replaces `path` with `content`. Returns False if it already had exactly that content."""
+    if _same_content(path, content):
+        return False
+    os.replace(_stage(path, content), path)
+    return True
+
+def _stage_link(path: str, source: str) -> str:
+    """Hardlinks `source` under a new temporary name next to `path` and returns that name."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    temp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if os.path.lexists(temp_path):
+        os.remove(temp_path)
+    os.link(source, temp_path)
+    return temp_path
+
+def write_text(path: str, text: str) -> bool:
+    return write_bytes(path, text.encode("utf-8"))
+
+def write_json(path: str, data, indent: Optional[int] = 4, **options) -> bool:
+    """Atomically writes `data` as JSON, formatted the way the tools always have (indent 4 by default)."""
+    return write_text(path, json.dumps(data, indent=indent, **options))
+
+def append_line(path: str, line: str):
+    """
+    Appends `line` (or several lines joined with newlines) with a single O_APPEND
+    write, so lines from concurrent processes never interleave.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        os.write(fd, (line.rstrip("\n") + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
+
+class Batch:
+    """
+    Stages several writes, links and removals and applies them together:
+
+        with Batch() as batch:
+            batch.write(ui_path, rendered)
+            batch.write(meta_path, meta_bytes)
+
+    Contents are written to temporary files as they are staged. Leaving the
+    block commits them, each with os.replace, in staging order; an exception
+    discards them and leaves every target untouched. Identical contents are
+    dropped at staging time. `changed` lists the paths the commit modified.
+    """
+
+    def __init__(self):
+        self._staged: List[Tuple[str, Optional[str]]] = []
+        self.changed: List[str] = []
+
+    def write(self, path: str, content) -> bool:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if _same_content(path, content):
+            return False
+        self._staged.append((path, _stage(path, content)))
+        return True
+
+    def write_json(self, path: str, data, indent: Optional[int] = 4, **options) -> bool:
+        return self.write(path, json.dumps(data, indent=indent, **options))
+
+    def link(self, path: str, source: str) -> bool:
+        """
+        Stages `path` as a hardlink to `source`, so later edits of `source` show up
+        in `path`. Falls back to a copy where links are not possible (e.g. across
+        filesystems).
+        """
+        try:
+            if os.path.samefile(path, source):
+                return False
+        except OSError:
+            pass
+        try:
+            temp_path = _stage_link(path, source)
+        except OSError:
+            with open(source, "rb") as f:
+                return self.write(path, f.read())
+        self._staged.append((path, temp_path))
+        return True
+
+    def remove(self, path: str):
+        if os.path.lexists(path):
+            self._staged.append((path, None))
+
+    def commit(self) -> List[str]:
+        with span("commit", files=len(self._staged)):
+            for path, temp_path in self._staged:
+                if temp_path is None:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        continue
+                else:
+                    os.replace(temp_path, path)
+                self.changed.append(path)
+        self._staged = []
+        return self.changed
+
+    def discard(self):
+        for _, temp_path in self._staged:
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+        self._staged = []
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+# --- Advisory locks ---
+
+# name -> [file descriptor, depth, owning thread id]; lets a thread re-enter its own lock.
+_held: Dict[str, list] = {}
+_held_guard = threading.Lock()
+
+def _lock_path(name: str) -> str:
+    return os.path.join(LOCKS_DIR, name.replace(os.sep, "_").replace("/", "_") + ".lock")
+
+@contextmanager
+def locked(name: str):
+    """
+    Holds an exclusive advisory lock (flock on tools/.locks/<name>.lock) for the
+    block, waiting for other processes and threads that hold it. Re-entrant
+    within a thread. Only tools that take the lock are serialized; readers that
+    don't (the viewer) still only ever see whole files.
+    """
+    if fcntl is None:
+        yield
+        return
+    me = threading.get_ident()
+    with _held_guard:
+        held = _held.get(name)
+        if held and held[2] == me:
+            held[1] += 1
+            reentered = True
+        else:
+            reentered = False
+    if reentered:
+        try:
+            yield
+        finally:
+            with _held_guard:
+                _held[name][1] -= 1
+        return
+
+    os.makedirs(LOCKS_DIR, exist_ok=True)
+    fd = os.open(_lock_path(name), os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        with _held_guard:
+            _held[name] = [fd, 1, me]
+        try:
+            yield
+        finally:
+            with _held_guard:
+                del _held[name]
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+def problem_lock(problem_folder: str):
+    """The lock every tool holds while it reads-modifies-writes one problem's files."""
+    return locked("problem-" + os.path.basename(os.path.normpath(problem_folder)))
@@ -0,0 +1,243 @@
+import sys
+import json
+import math
+import random
+import inspect
+import argparse
+import typing
+from typing import Dict, List, Optional
+
+try:
+    import numpy
+except ImportError:  # Pure-Python fallbacks are used instead.
+    numpy = None
+
+from solution_loader import (
+    load_meta,
+    load_problem_solutions,
+    node_type,
+    resolve_problem,
+)
+
+# Default value range for generated integers, matching LeetCode's usual -10^9..10^9.
+INT_MIN = -10**9
+INT_MAX = 10**9
+# Length of each string inside a generated List[str].
+WORD_LENGTH = 5
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+# Chance that a generated tree position is left empty (None in LeetCode's array form).
+TREE_NULL_PROBABILITY = 0.1
+
+# Per-problem constraints live in meta.json under "constraints", keyed by parameter:
+#
+#   "constraints": {
+#       "nums": {"min": -1000000000, "max": 1000000000, "min_length": 2},
+#       "target": {"expr": "nums[-2] + nums[-1]"}
+#   }
+#
+# Supported keys: "min"/"max" (element values), "min_length"/"max_length" (clamp
+# the requested size), "unique", "sorted", "alphabet" (strings), "rows"/"cols"
+# (matrices), "value" (a fixed value) and "expr", a Python expression over the
+# parameters generated before it. "expr" is how a problem guarantees a valid
+# answer exists, e.g. a Two Sum target built from two of the generated numbers.
+
+def _is_list(annotation) -> bool:
+    return typing.get_origin(annotation) in (list, List)
+
+def _is_sequence(annotation) -> bool:
+    return annotation is str or _is_list(annotation) or node_type(annotation) is not None
+
+def _element_type(annotation):
+    args = typing.get_args(annotation)
+    return args[0] if args else int
+
+class Generator:
+    """Random values in LeetCode's plain serialization, with bulk fast paths."""
+
+    def __init__(self, seed: int = 0, use_numpy: bool = True):
+        self.rng = random.Random(seed)
+        self.np_rng = numpy.random.default_rng(seed) if (numpy is not None and use_numpy) else None
+
+    def ints(self, count: int, low: int = INT_MIN, high: int = INT_MAX,
+             unique: bool = False, ordered: bool = False) -> List[int]:
+        if unique:
+            if high - low + 1 < count:
+                raise ValueError(f"Cannot draw {count} unique integers from [{low}, {high}]")
+            values = self.rng.sample(range(low, high + 1), count)
+        elif self.np_rng is not None and -2**63 <= low and high < 2**63 - 1:
+            values = self.np_rng.integers(low, high + 1, size=count).tolist()
+        else:
+            # choices() over a range indexes in O(1), far faster than randint() per element.
+            values = self.rng.choices(range(low, high + 1), k=count)
+        if ordered:
+            values.sort()
+        return values
+
+    def floats(self, count: int, low: float = INT_MIN, high: float = INT_MAX) -> List[float]:
+        if self.np_rng is not None:
+            return self.np_rng.uniform(low, high, size=count).tolist()
+        uniform = self.rng.uniform
+        return [uniform(low, high) for _ in range(count)]
+
+    def string(self, length: int, alphabet: str = ALPHABET) -> str:
+        return "".join(self.rng.choices(alphabet, k=length))
+
+    def tree(self, count: int, low: int = INT_MIN, high: int = INT_MAX) -> list:
+        """A LeetCode level-order array with `count` nodes and occasional missing children."""
+        values = self.ints(count, low, high)
+        if count == 0:
+            return []
+        # Like LeetCode's format, only nodes that exist get two child slots.
+        result = [values[0]]
+        open_nodes, index = 1, 1
+        while index < count:
+            open_nodes -= 1
+            for _ in range(2):
+                if index < count and self.rng.random() >= TREE_NULL_PROBABILITY:
+                    result.append(values[index])
+                    index += 1
+                    open_nodes += 1
+                else:
+                    result.append(None)
+            if open_nodes == 0 and index < count:
+                # Never strand the remaining nodes: fill the last empty slot.
+                result[-1] = values[index]
+                index += 1
+                open_nodes += 1
+        while result and result[-1] is None:
+            result.pop()
+        return result
+
+    def value(self, annotation, size: int, rules: Optional[dict] = None):
+        """Generates one value of the annotated type whose total element count is about `size`."""
+        rules = rules or {}
+        low, high = rules.get("min", INT_MIN), rules.get("max", INT_MAX)
+        size = max(rules.get("min_length", 0), min(size, rules.get("max_length", size)))
+
+        if annotation is int:
+            return self.rng.randint(low, high)
+        if annotation is float:
+            return self.rng.uniform(low, high)
+        if annotation is bool:
+            return self.rng.random() < 0.5
+        if annotation is str:
+            return self.string(size, rules.get("alphabet", ALPHABET))
+        if node_type(annotation) is not None:
+            if node_type(annotation).__name__ == "ListNode":
+                return self.ints(size, low, high, rules.get("unique", False), rules.get("sorted", False))
+            return self.tree(size, low, high)
+        if _is_list(annotation):
+            element = _element_type(annotation)
+            if _is_list(element):
+                # A matrix: keep rows * cols close to the requested size.
+                side = max(1, math.isqrt(size))
+                rows, cols = rules.get("rows", side), rules.get("cols", side)
+                row_type = _element_type(element)
+                if row_type is str:
+                    alphabet = rules.get("alphabet", ALPHABET)
+                    return [list(self.string(cols, alphabet)) for _ in range(rows)]
+                if row_type is float:
+                    return [self.floats(cols, low, high) for _ in range(rows)]
+                return [self.ints(cols, low, high) for _ in range(rows)]
+            if element is int:
+                return self.ints(size, low, high, rules.get("unique", False), rules.get("sorted", False))
+            if element is float:
+                values = self.floats(size, low, high)
+                return sorted(values) if rules.get("sorted") else values
+            if element is str:
+                alphabet = rules.get("alphabet", ALPHABET)
+                return [self.string(rules.get("word_length", WORD_LENGTH), alphabet) for _ in range(size)]
+            if element is bool:
+                return [self.rng.random() < 0.5 for _ in range(size)]
+            if node_type(element) is not None:
+                # e.g. mergeKLists(lists: List[Optional[ListNode]]): k lists of about sqrt(size) nodes.
+                side = max(1, math.isqrt(size))
+                return [self.value(element, side, rules) for _ in range(side)]
+        raise TypeError(f"Don't know how to generate a value for {annotation!r}")
+
+def method_parameters(method) -> List[str]:
+    return [p.name for p in inspect.signature(method).parameters.values() if p.name != "self"]
+
+def generate_args(method, size: int, seed: int = 0, constraints: Optional[dict] = None,
+                  generator: Optional[Generator] = None) -> Dict[str, object]:
+    """
+    Builds plain keyword arguments (LeetCode serialization: linked lists and trees
+    as arrays) for a Solution method from its type hints and optional constraints.
+    Sequences get about `size` elements. When the method takes no sequence at all,
+    its unconstrained int parameters are the problem size itself (e.g. `climbStairs(n)`).
+    """
+    constraints = constraints or {}
+    generator = generator or Generator(seed)
+    hints = typing.get_type_hints(method)
+    names = method_parameters(method)
+    size_is_int = not any(_is_sequence(hints.get(name)) for name in names)
+
+    args: Dict[str, object] = {}
+    for name in names:
+        annotation = hints.get(name, int)
+        rules = constraints.get(name, {})
+        if "value" in rules:
+            args[name] = rules["value"]
+        elif "expr" in rules:
+            continue  # Evaluated once every plain parameter exists.
+        elif annotation is int and size_is_int and not ("min" in rules or "max" in rules):
+            args[name] = size
+        else:
+            args[name] = generator.value(annotation, size, rules)
+
+    for name in names:
+        rules = constraints.get(name, {})
+        if "expr" in rules and "value" not in rules:
+            try:
+                args[name] = eval(rules["expr"], {"__builtins__": {}, "len": len, "min": min, "max": max,
+                                                  "sum": sum, "sorted": sorted}, dict(args))
+            except Exception as e:
+                raise ValueError(f"constraint expression for '{name}' failed: {rules['expr']!r}: {e}")
+    # Keep the signature's parameter order.
+    return {name: args[name] for name in names}
+
+def generate_batch(method, size: int, count: int, seed: int = 0,
+                   constraints: Optional[dict] = None) -> List[Dict[str, object]]:
+    """Generates `count` independent cases of one size from a single seeded generator."""
+    generator = Generator(seed)
+    return [generate_args(method, size, constraints=constraints, generator=generator) for _ in range(count)]
+
+def problem_method(problem_folder: str):
+    """The reference Solution method whose signature drives input generation."""
+    solutions = load_problem_solutions(problem_folder)
+    if not solutions:
+        raise ValueError(f"No Python Solution classes found in {problem_folder}")
+    solution_type = "leetcode_solution" if "leetcode_solution" in solutions else next(iter(solutions))
+    solution_class, method_name = solutions[solution_type]
+    return getattr(solution_class, method_name)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate random inputs for a problem from its Solution signature and meta.json constraints.",
+        epilog="Example: python tools/generators.py 1 --size 1000000 --count 3 --out /tmp/cases.jsonl",
+    )
+    parser.add_argument("problem_number")
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write cases as tests.jsonl lines to this file instead of stdout")
+    options = parser.parse_args()
+
+    problem_folder = resolve_problem(options.problem_number)
+    try:
+        method = problem_method(problem_folder)
+        cases = generate_batch(method, options.size, options.count, options.seed,
+                               load_meta(problem_folder).get("constraints"))
+    except (ValueError, TypeError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    lines = (json.dumps({"input": case}) for case in cases)
+    if options.out:
+        with open(options.out, "w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line + "\n")
+        print(f"✅ Wrote {len(cases)} case(s) to {options.out}")
+    else:
+        for line in lines:
+            print(line)
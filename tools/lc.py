@@ -0,0 +1,273 @@
+import os
+import sys
+import json
+import socket
+
+# One entry point for every tool: `python tools/lc.py <command> [args...]` runs
+# the matching script exactly as if it were started directly. Only this file is
+# loaded up front; a command's module is imported when it runs.
+#
+# `python tools/lc.py serve` keeps a process running with modules, config,
+# templates and the problem index already loaded (see core.py). While it is up,
+# later `lc.py` invocations hand their command to it over a Unix socket and only
+# relay its output, instead of starting the tools from scratch.
+
+SOCKET_PATH = os.path.join("tools", ".lc.sock")
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# command -> (module in tools/, summary)
+COMMANDS = {
+    "new": ("create_problem", "scaffold a problem, or bulk-import a CSV/JSONL catalogue"),
+    "update": ("update_progress", "update a problem's meta.json and rebuild UIs (--all)"),
+    "watch": ("watch", "rebuild UIs as files change"),
+    "export": ("export_static", "export problems as static HTML pages"),
+    "template": ("update_template", "install a master template into every problem"),
+    "create-template": ("create_template", "create a new master template"),
+    "language": ("add_language", "register a new solution language"),
+    "index": ("problem_index", "rebuild problems/index.json"),
+    "db": ("db", "query the SQLite mirror of the problems"),
+    "search": ("search", "full-text search over problems and solutions"),
+    "test": ("test_solutions", "run solutions against examples and tests.jsonl"),
+    "run": ("runner", "run solutions in warm worker processes"),
+    "gen": ("generators", "generate random inputs for a problem"),
+    "corpus": ("corpus", "build and run binary stress corpora"),
+    "bench": ("benchmark", "benchmark user_solution against leetcode_solution"),
+    "history": ("bench_history", "show and compare saved benchmark results"),
+    "complexity": ("complexity", "check declared complexity empirically"),
+    "profile": ("profile_solution", "profile a solution's hotspots"),
+    "lint": ("perflint", "lint solutions for performance pitfalls"),
+}
+# Never handed to the server: long-running, or may prompt on stdin.
+LOCAL_ONLY = {"watch", "language", "create-template"}
+
+def print_help():
+    print("Usage: python tools/lc.py [--local] <command> [args...]")
+    print("       python tools/lc.py serve | stop | status\n")
+    width = max(len(name) for name in COMMANDS)
+    for name, (module, summary) in COMMANDS.items():
+        print(f"  {name:<{width}}  {summary} ({module}.py)")
+    print("\nRun `python tools/lc.py <command> -h` for a command's options.")
+
+def run_command(command: str, args: list) -> int:
+    """Runs a tool's command-line entry point in this process and returns its exit code."""
+    import runpy
+    import traceback
+
+    module = COMMANDS[command][0]
+    if TOOLS_DIR not in sys.path:
+        sys.path.insert(0, TOOLS_DIR)
+    saved_argv = sys.argv
+    sys.argv = [os.path.join("tools", f"{module}.py")] + list(args)
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+        # A command run with --trace must not leave tracing on for the next one.
+        spans = sys.modules.get("spans")
+        if spans is not None:
+            spans.disable()
+    return 0
+
+# --- Client ---
+
+def _request(message: dict):
+    """Connects to a running server; returns the socket file, or None if there is none."""
+    if not os.path.exists(SOCKET_PATH):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(SOCKET_PATH)
+    except (ConnectionRefusedError, FileNotFoundError):
+        # Left behind by a server that did not shut down cleanly.
+        client.close()
+        try:
+            os.remove(SOCKET_PATH)
+        except OSError:
+            pass
+        return None
+    client.sendall(json.dumps(message).encode("utf-8") + b"\n")
+    return client.makefile("rb")
+
+def run_remote(command: str, args: list):
+    """Runs a command on the server, relaying its output. Returns the exit code, or None to run locally."""
+    reply = _request({"argv": [command] + list(args)})
+    if reply is None:
+        return None
+    with reply:
+        for line in reply:
+            frame = json.loads(line)
+            if "out" in frame:
+                sys.stdout.write(frame["out"])
+                sys.stdout.flush()
+            elif "err" in frame:
+                sys.stderr.write(frame["err"])
+                sys.stderr.flush()
+            elif "exit" in frame:
+                return frame["exit"]
+            elif "reload" in frame:
+                return None  # The server is restarting on changed tool code.
+    return None  # The server went away mid-command.
+
+# --- Server ---
+
+class _FrameStream:
+    """A text stream that forwards everything written to it as JSON-line frames."""
+
+    encoding = "utf-8"
+    errors = "strict"
+
+    def __init__(self, connection, key: str):
+        self.connection = connection
+        self.key = key
+        self.closed = False
+
+    def write(self, text: str) -> int:
+        if text and not self.closed:
+            try:
+                self.connection.sendall(json.dumps({self.key: text}).encode("utf-8") + b"\n")
+            except OSError:
+                self.closed = True  # The client went away; finish the command quietly.
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+def _code_signature() -> dict:
+    """mtimes of the tools' own source files, to notice when the server runs stale code."""
+    signature = {}
+    for name in os.listdir(TOOLS_DIR):
+        if name.endswith(".py"):
+            try:
+                signature[name] = os.stat(os.path.join(TOOLS_DIR, name)).st_mtime_ns
+            except OSError:
+                pass
+    return signature
+
+def _handle(connection, started_code: dict) -> bool:
+    """Serves one request. Returns False when the server should stop or restart."""
+    import io
+
+    with connection, connection.makefile("rb") as reader:
+        request = json.loads(reader.readline() or b"{}")
+        if request.get("stop"):
+            connection.sendall(b'{"exit": 0}\n')
+            return False
+        if request.get("status"):
+            connection.sendall(json.dumps({"out": f"✅ lc server running (pid {os.getpid()})\n"}).encode() + b"\n")
+            connection.sendall(b'{"exit": 0}\n')
+            return True
+        if _code_signature() != started_code:
+            connection.sendall(b'{"reload": true}\n')
+            return False
+
+        command, args = request["argv"][0], request["argv"][1:]
+        streams = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin = io.StringIO()
+        sys.stdout = _FrameStream(connection, "out")
+        sys.stderr = _FrameStream(connection, "err")
+        try:
+            code = run_command(command, args)
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = streams
+        try:
+            connection.sendall(json.dumps({"exit": code}).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+    return True
+
+def serve():
+    """Serves commands one at a time until `lc.py stop`, restarting itself when tool code changes."""
+    if os.path.exists(SOCKET_PATH):
+        if _request({"status": True}) is not None:
+            print(f"⚠️ A server is already listening on {SOCKET_PATH}.")
+            return
+    started_code = _code_signature()
+    # Warm the caches every command starts from.
+    if TOOLS_DIR not in sys.path:
+        sys.path.insert(0, TOOLS_DIR)
+    import core
+    import update_progress
+    from problem_index import load_index
+    core.load_config()
+    update_progress.load_master_templates()
+    load_index()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(SOCKET_PATH)
+    server.listen(16)
+    print(f"🚀 Serving tools on {SOCKET_PATH} (pid {os.getpid()}). Stop with: python tools/lc.py stop")
+    restart = False
+    try:
+        while True:
+            connection, _ = server.accept()
+            if not _handle(connection, started_code):
+                restart = _code_signature() != started_code
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            os.remove(SOCKET_PATH)
+        except OSError:
+            pass
+    if restart:
+        print("🔁 Tool code changed; restarting.")
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable, os.path.abspath(__file__), "serve"])
+
+def control(action: str) -> int:
+    reply = _request({action: True})
+    if reply is None:
+        print(f"⚠️ No lc server is running (no {SOCKET_PATH}).")
+        return 1
+    with reply:
+        for line in reply:
+            frame = json.loads(line)
+            if "out" in frame:
+                sys.stdout.write(frame["out"])
+    if action == "stop":
+        print("✅ Stopped the lc server.")
+    return 0
+
+def main(argv: list) -> int:
+    local = bool(os.environ.get("LC_LOCAL"))
+    while argv and argv[0] == "--local":
+        local = True
+        argv = argv[1:]
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print_help()
+        return 0 if argv else 1
+
+    command, args = argv[0], argv[1:]
+    if command == "serve":
+        serve()
+        return 0
+    if command in ("stop", "status"):
+        return control(command)
+    if command not in COMMANDS:
+        print(f"❌ Error: Unknown command '{command}'.\n")
+        print_help()
+        return 1
+
+    if not local and command not in LOCAL_ONLY:
+        code = run_remote(command, args)
+        if code is not None:
+            return code
+    return run_command(command, args)
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,342 @@
+import os
+import ast
+import sys
+import argparse
+from typing import Dict, List, Optional, Set
+
+from fileio import problem_lock, write_json
+from problem_index import problem_folders
+from solution_loader import load_meta, python_solution_paths, resolve_problem
+from update_progress import rebuild_problems
+
+# Append this comment to a line to silence every finding on it.
+IGNORE_COMMENT = "perflint: ignore"
+
+# rule -> (severity, estimated impact)
+RULES = {
+    "slice-in-loop": ("warning", "O(k) copy on every iteration: an O(n) loop becomes O(n^2)."),
+    "list-membership-in-loop": ("warning", "O(n) scan on every iteration: O(n^2) overall. A set or dict makes each lookup O(1)."),
+    "index-in-loop": ("warning", "list.index() scans linearly on every iteration: O(n^2) overall."),
+    "pop-front": ("warning", "pop(0) shifts every element: O(n) per call. collections.deque.popleft() is O(1)."),
+    "insert-front": ("warning", "insert(0, x) shifts every element: O(n) per call. collections.deque.appendleft() is O(1)."),
+    "string-concat-in-loop": ("warning", "May copy the whole string each time: O(n^2) overall. Collect parts and ''.join() them."),
+    "sort-in-loop": ("warning", "O(n log n) on every iteration. Sort once outside the loop, or keep order with heapq/bisect."),
+    "unmemoized-recursion": ("warning", "Overlapping subproblems are recomputed: exponential time. @cache (or a memo dict) makes it polynomial."),
+    "len-in-loop": ("info", "Constant factor: len() is re-evaluated on every iteration. Hoist it if the list does not change."),
+    "attribute-in-loop": ("info", "Constant factor: the dotted lookup is repeated in a hot loop. Bind it to a local first."),
+}
+
+MEMO_HINTS = ("memo", "cache", "dp")
+
+def _annotation_kind(annotation: Optional[ast.expr]) -> Optional[str]:
+    if annotation is None:
+        return None
+    name = annotation.value if isinstance(annotation, ast.Subscript) else annotation
+    if isinstance(name, ast.Name):
+        return {"List": "list", "list": "list", "str": "str", "Dict": "dict", "dict": "dict",
+                "Set": "set", "set": "set"}.get(name.id)
+    return None
+
+def _value_kind(value: ast.expr) -> Optional[str]:
+    """The container kind an expression evaluates to, when it is obvious from syntax."""
+    if isinstance(value, (ast.List, ast.ListComp)):
+        return "list"
+    if isinstance(value, (ast.Set, ast.SetComp)):
+        return "set"
+    if isinstance(value, (ast.Dict, ast.DictComp)):
+        return "dict"
+    if isinstance(value, ast.JoinedStr) or (isinstance(value, ast.Constant) and isinstance(value.value, str)):
+        return "str"
+    if isinstance(value, ast.Subscript) and isinstance(value.slice, ast.Slice):
+        return "list"
+    if isinstance(value, ast.Call) and isinstance(value.func, ast.Name):
+        return {"list": "list", "sorted": "list", "str": "str", "set": "set", "dict": "dict"}.get(value.func.id)
+    return None
+
+def _dotted_depth(node: ast.expr) -> int:
+    depth = 0
+    while isinstance(node, ast.Attribute):
+        depth += 1
+        node = node.value
+    return depth
+
+class _FunctionLinter(ast.NodeVisitor):
+    """Walks one function body, tracking loop depth and what each local name holds."""
+
+    def __init__(self, function: ast.FunctionDef, findings: List[dict], source: str):
+        self.function = function
+        self.findings = findings
+        self.source = source
+        self.loop_depth = 0
+        self.kinds: Dict[str, str] = {}
+        for arg in function.args.args + function.args.kwonlyargs:
+            kind = _annotation_kind(arg.annotation)
+            if kind:
+                self.kinds[arg.arg] = kind
+
+    def text(self, node: ast.AST) -> str:
+        # get_source_segment rather than ast.unparse, which needs Python 3.9.
+        return " ".join((ast.get_source_segment(self.source, node) or "...").split())
+
+    def may_be_list(self, node: ast.expr) -> bool:
+        """
+        False only when the expression is known to hold something other than a
+        list (dict.pop(0) is fine, and so is insert(0, x) on a user-defined type).
+        """
+        kind = self.kinds.get(node.id) if isinstance(node, ast.Name) else _value_kind(node)
+        return kind in (None, "list")
+
+    def report(self, rule: str, node: ast.AST, detail: str):
+        severity, impact = RULES[rule]
+        self.findings.append({
+            "rule": rule,
+            "line": node.lineno,
+            "severity": severity,
+            "message": detail,
+            "impact": impact,
+        })
+
+    def run(self):
+        for statement in self.function.body:
+            self.visit(statement)
+
+    # --- Scopes and loops ---
+
+    def visit_FunctionDef(self, node):
+        lint_function(node, self.findings, self.source)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        pass
+
+    def visit_For(self, node):
+        self.visit(node.iter)  # Evaluated once, outside the loop.
+        self.loop_depth += 1
+        self.visit(node.target)
+        for statement in node.body:
+            self.visit(statement)
+        self.loop_depth -= 1
+        for statement in node.orelse:
+            self.visit(statement)
+
+    visit_AsyncFor = visit_For
+
+    def visit_While(self, node):
+        self.loop_depth += 1
+        for call in ast.walk(node.test):
+            if isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "len":
+                self.report("len-in-loop", call, "len() in a while condition")
+        self.generic_visit(node)
+        self.loop_depth -= 1
+
+    def _visit_comprehension(self, node):
+        # The first iterable is evaluated once; everything else runs per element.
+        generators = node.generators
+        self.visit(generators[0].iter)
+        self.loop_depth += 1
+        for index, generator in enumerate(generators):
+            if index:
+                self.visit(generator.iter)
+            for condition in generator.ifs:
+                self.visit(condition)
+        for child in ("elt", "key", "value"):
+            if hasattr(node, child):
+                self.visit(getattr(node, child))
+        self.loop_depth -= 1
+
+    visit_ListComp = visit_SetComp = visit_GeneratorExp = visit_DictComp = _visit_comprehension
+
+    # --- What names hold ---
+
+    def visit_Assign(self, node):
+        kind = _value_kind(node.value)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                if kind:
+                    self.kinds[target.id] = kind
+                else:
+                    self.kinds.pop(target.id, None)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node):
+        if isinstance(node.target, ast.Name):
+            kind = _annotation_kind(node.annotation) or (_value_kind(node.value) if node.value else None)
+            if kind:
+                self.kinds[node.target.id] = kind
+        self.generic_visit(node)
+
+    # --- Patterns ---
+
+    def visit_Subscript(self, node):
+        if self.loop_depth and isinstance(node.slice, ast.Slice) and isinstance(node.ctx, ast.Load):
+            self.report("slice-in-loop", node, f"slice '{self.text(node)}' inside a loop")
+        self.generic_visit(node)
+
+    def visit_Compare(self, node):
+        if self.loop_depth:
+            for operator, comparator in zip(node.ops, node.comparators):
+                if not isinstance(operator, (ast.In, ast.NotIn)):
+                    continue
+                kind = self.kinds.get(comparator.id) if isinstance(comparator, ast.Name) else _value_kind(comparator)
+                if kind == "list":
+                    self.report("list-membership-in-loop", node,
+                                f"'in {self.text(comparator)}' tests a list inside a loop")
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node):
+        if (self.loop_depth and isinstance(node.op, ast.Add) and isinstance(node.target, ast.Name)
+                and (self.kinds.get(node.target.id) == "str" or _value_kind(node.value) == "str")):
+            self.report("string-concat-in-loop", node, f"'{node.target.id} += ...' builds a string inside a loop")
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            method = func.attr
+            first = node.args[0] if node.args else None
+            is_zero = isinstance(first, ast.Constant) and first.value == 0
+            if method == "pop" and is_zero and len(node.args) == 1 and self.may_be_list(func.value):
+                self.report("pop-front", node, f"'{self.text(node)}'")
+            elif method == "insert" and is_zero and len(node.args) == 2 and self.may_be_list(func.value):
+                self.report("insert-front", node, f"'{self.text(node)}'")
+            elif self.loop_depth and method == "index" and self.kinds.get(getattr(func.value, "id", None)) != "str":
+                self.report("index-in-loop", node, f"'{self.text(func)}()' inside a loop")
+            elif self.loop_depth and method == "sort":
+                self.report("sort-in-loop", node, f"'{self.text(func)}()' inside a loop")
+            elif self.loop_depth >= 2 and _dotted_depth(func) >= 2:
+                self.report("attribute-in-loop", node, f"'{self.text(func)}' looked up in a nested loop")
+        elif isinstance(func, ast.Name) and func.id == "sorted" and self.loop_depth:
+            self.report("sort-in-loop", node, "'sorted()' inside a loop")
+        self.generic_visit(node)
+
+def _is_memoized(function: ast.FunctionDef) -> bool:
+    for decorator in function.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", "")
+        if "cache" in name:
+            return True
+    for node in ast.walk(function):
+        if isinstance(node, ast.Name):
+            name = node.id
+        elif isinstance(node, ast.Attribute):
+            name = node.attr
+        else:
+            name = node.arg if isinstance(node, ast.arg) else None
+        if name and any(hint in name.lower() for hint in MEMO_HINTS):
+            return True
+    return False
+
+def _self_calls(function: ast.FunctionDef) -> int:
+    calls = 0
+    for node in ast.walk(function):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if (isinstance(func, ast.Name) and func.id == function.name) or \
+                (isinstance(func, ast.Attribute) and func.attr == function.name
+                 and isinstance(func.value, ast.Name) and func.value.id == "self"):
+            calls += 1
+    return calls
+
+def lint_function(function: ast.FunctionDef, findings: List[dict], source: str):
+    # Two or more recursive calls per invocation is the shape of overlapping subproblems
+    # (fib(n - 1) + fib(n - 2)); a single call is plain linear recursion.
+    if _self_calls(function) >= 2 and not _is_memoized(function):
+        severity, impact = RULES["unmemoized-recursion"]
+        findings.append({"rule": "unmemoized-recursion", "line": function.lineno, "severity": severity,
+                         "message": f"'{function.name}' recurses more than once per call without memoization",
+                         "impact": impact})
+    _FunctionLinter(function, findings, source).run()
+
+def lint_source(source: str, filename: str = "<solution>") -> List[dict]:
+    """Returns the findings for one solution file, ordered by line."""
+    tree = ast.parse(source, filename)
+    findings: List[dict] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    lint_function(item, findings, source)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            lint_function(node, findings, source)
+
+    lines = source.splitlines()
+    ignored: Set[int] = {number for number, line in enumerate(lines, start=1) if IGNORE_COMMENT in line}
+    unique = {(f["rule"], f["line"], f["message"]): f for f in findings if f["line"] not in ignored}
+    return sorted(unique.values(), key=lambda f: (f["line"], f["rule"]))
+
+def lint_problem(problem_folder: str) -> Dict[str, List[dict]]:
+    results = {}
+    for solution_type, path in python_solution_paths(problem_folder).items():
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                results[solution_type] = lint_source(f.read(), path)
+            except SyntaxError as e:
+                results[solution_type] = [{"rule": "syntax-error", "line": e.lineno or 0, "severity": "error",
+                                           "message": str(e.msg), "impact": "The file does not parse."}]
+    return results
+
+def save_findings(problem_folder: str, results: Dict[str, List[dict]]) -> bool:
+    """
+    Stores findings in meta.json so the UI can show them next to each solution.
+    meta.json is only rewritten when the findings changed. Returns True if it was.
+    """
+    meta_path = os.path.join(problem_folder, "meta.json")
+    with problem_lock(problem_folder):
+        meta_data = load_meta(problem_folder)
+        findings = {"solutions": results}
+        if meta_data.get("perflint") == findings:
+            return False
+        meta_data["perflint"] = findings
+        write_json(meta_path, meta_data)
+    return True
+
+def print_findings(problem_folder: str, results: Dict[str, List[dict]]) -> int:
+    meta_data = load_meta(problem_folder)
+    print(f"\n🔬 #{meta_data['problem_number']} {meta_data['title']}")
+    warnings = 0
+    for solution_type, findings in results.items():
+        path = python_solution_paths(problem_folder)[solution_type]
+        if not findings:
+            print(f"   - ✅ {solution_type}: no findings")
+            continue
+        for finding in findings:
+            icon = "ℹ️ " if finding["severity"] == "info" else "⚠️ "
+            warnings += finding["severity"] != "info"
+            print(f"   - {icon} {path}:{finding['line']} [{finding['rule']}] {finding['message']}")
+            print(f"         {finding['impact']}")
+    return warnings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Flag common performance antipatterns in Python solution files.",
+        epilog="Example: python tools/perflint.py 1    |    python tools/perflint.py --all",
+    )
+    parser.add_argument("problem_number", nargs="?")
+    parser.add_argument("--all", action="store_true", help="lint every problem with Python solutions")
+    parser.add_argument("--no-update", action="store_true", help="don't write findings to meta.json or rebuild the UI")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 when any warning is found")
+    options = parser.parse_args()
+    if not options.all and not options.problem_number:
+        parser.error("give a problem number or --all")
+
+    folders = problem_folders() if options.all else [resolve_problem(options.problem_number)]
+    total_warnings = 0
+    linted = 0
+    changed = []
+    for problem_folder in folders:
+        results = lint_problem(problem_folder)
+        if not results:
+            continue
+        linted += 1
+        total_warnings += print_findings(problem_folder, results)
+        if not options.no_update and save_findings(problem_folder, results):
+            changed.append(problem_folder)
+
+    if changed:
+        print()
+        rebuild_problems(changed)
+    print(f"\n{'⚠️' if total_warnings else '✅'} {total_warnings} warning(s) across {linted} problem(s).")
+    sys.exit(1 if options.strict and total_warnings else 0)
@@ -0,0 +1,162 @@
+import os
+import sys
+import json
+import hashlib
+from typing import Optional, Dict, List, Tuple
+
+from core import PROBLEMS_DIR, cached, prime
+from fileio import locked, write_text
+# A small, committed summary of every problem, keyed by problem number.
+# The tools use it for O(1) lookups and the viewer loads it for its home page.
+INDEX_PATH = os.path.join(PROBLEMS_DIR, "index.json")
+# mtime of problems/ when its listing last matched the index, so repeated calls in
+# one process only rescan after a folder was added, removed or renamed.
+_listing_checked_at = None
+
+def file_signature(path: str, previous: Optional[list] = None) -> Optional[list]:
+    """
+    Returns [mtime_ns, size, sha1] for a file, or None if it does not exist.
+    The file is only hashed when its stat differs from the previous signature.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if previous and previous[0] == st.st_mtime_ns and previous[1] == st.st_size:
+        return previous
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    return [st.st_mtime_ns, st.st_size, digest]
+
+def index_entry(folder_name: str, meta_data: dict) -> dict:
+    """Builds the index entry for a problem from its meta.json contents."""
+    return {
+        "number": meta_data.get("problem_number"),
+        "folder": folder_name,
+        "slug": meta_data.get("slug", ""),
+        "title": meta_data.get("title", ""),
+        "difficulty": meta_data.get("difficulty", ""),
+        "tags": meta_data.get("tags", []),
+        "solved": meta_data.get("solved", False),
+        "template": meta_data.get("template", ""),
+        "languages": meta_data.get("languages", []),
+    }
+
+def save_index(problems: Dict[str, dict]) -> Dict[str, dict]:
+    # Keep entries in numeric order so the file diffs cleanly and reads naturally.
+    ordered = dict(sorted(problems.items(), key=lambda item: int(item[0])))
+    write_text(INDEX_PATH, json.dumps({"version": 1, "problems": ordered}, indent=2) + "\n")
+    prime(INDEX_PATH, ordered)
+    return ordered
+
+def rebuild_index() -> Dict[str, dict]:
+    """Scans every problem folder's meta.json and rewrites the index from scratch."""
+    problems = {}
+    if not os.path.isdir(PROBLEMS_DIR):
+        return problems
+    with locked("index"):
+        for folder_name in sorted(os.listdir(PROBLEMS_DIR)):
+            meta_path = os.path.join(PROBLEMS_DIR, folder_name, "meta.json")
+            if not os.path.isfile(meta_path):
+                continue
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta_data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Warning: Could not read {meta_path}: {e}")
+                continue
+            entry = index_entry(folder_name, meta_data)
+            if entry["number"] is None:
+                continue
+            other = problems.get(str(entry["number"]))
+            if other:
+                print(f"⚠️ Warning: {folder_name} is also problem {entry['number']} ({other['folder']}); skipping it")
+                continue
+            problems[str(entry["number"])] = entry
+
+        return save_index(problems)
+
+def _read_index(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["problems"]
+
+def load_index() -> Dict[str, dict]:
+    """Returns the problem index, building it on first use. The result is shared; don't modify it."""
+    try:
+        return cached(INDEX_PATH, _read_index)
+    except (OSError, ValueError, KeyError):
+        return rebuild_index()
+
+def update_index_entries(updates: List[Tuple[str, dict]]):
+    """Inserts or refreshes entries for (problem_folder, meta_data) pairs in one write."""
+    with locked("index"):
+        problems = dict(load_index())
+        changed = False
+        for problem_folder, meta_data in updates:
+            entry = index_entry(os.path.basename(problem_folder), meta_data)
+            if entry["number"] is None or problems.get(str(entry["number"])) == entry:
+                continue
+            problems[str(entry["number"])] = entry
+            changed = True
+        if changed:
+            save_index(problems)
+
+def update_index_entry(problem_folder: str, meta_data: dict):
+    """Inserts or refreshes a single problem's entry after its meta.json changed."""
+    update_index_entries([(problem_folder, meta_data)])
+
+def find_problem_folder(problem_number) -> Optional[str]:
+    """Looks up a problem's folder by number, rebuilding a stale index once."""
+    key = str(int(problem_number))
+    entry = load_index().get(key)
+    if entry and os.path.isdir(os.path.join(PROBLEMS_DIR, entry["folder"])):
+        return os.path.join(PROBLEMS_DIR, entry["folder"])
+
+    # The folder was added, renamed or removed outside the tools: rescan once.
+    entry = rebuild_index().get(key)
+    if entry:
+        return os.path.join(PROBLEMS_DIR, entry["folder"])
+    return None
+
+def listing_matches(problems: Dict[str, dict]) -> bool:
+    """
+    True when the folders in problems/ are the indexed ones. Only folders missing
+    from the index are checked for a meta.json, so this is one directory listing.
+    """
+    global _listing_checked_at
+    try:
+        mtime = os.stat(PROBLEMS_DIR).st_mtime_ns
+        if mtime == _listing_checked_at:
+            return True
+        with os.scandir(PROBLEMS_DIR) as entries:
+            on_disk = {entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")}
+    except OSError:
+        return False
+    indexed = {entry["folder"] for entry in problems.values()}
+    if indexed - on_disk:
+        return False
+    if any(os.path.isfile(os.path.join(PROBLEMS_DIR, name, "meta.json")) for name in on_disk - indexed):
+        return False
+    _listing_checked_at = mtime
+    return True
+
+def problem_folders() -> List[str]:
+    """
+    Returns the path of every indexed problem, in problem-number order. The index
+    is rebuilt first when folders were added, renamed or removed outside the tools.
+    """
+    global _listing_checked_at
+    problems = load_index()
+    if not listing_matches(problems):
+        problems = rebuild_index()
+        # Folders the rescan could not index (a duplicate number) must not trigger another one.
+        _listing_checked_at = os.stat(PROBLEMS_DIR).st_mtime_ns
+    return [os.path.join(PROBLEMS_DIR, entry["folder"]) for entry in problems.values()]
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] != "--rebuild":
+        print("Usage: python tools/problem_index.py [--rebuild]")
+        sys.exit(1)
+
+    problems = rebuild_index()
+    print(f"✅ Indexed {len(problems)} problem(s) in {INDEX_PATH}")
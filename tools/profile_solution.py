@@ -0,0 +1,289 @@
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import argparse
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from benchmark import format_seconds
+from fileio import Batch, problem_lock
+from generators import generate_args, problem_method
+from problem_index import file_signature
+from solution_loader import call_args, copy_plain, load_meta, load_problem_solutions, resolve_problem
+from update_progress import PROFILES_DIR, rebuild_problems
+
+# This is not tools/profile.py on purpose: the scripts run with tools/ first on
+# sys.path, and cProfile imports the standard library's `profile` module.
+
+DEFAULT_SIZE = 10000
+DEFAULT_TOP = 15
+SOLUTION_CHOICES = {"user": "user_solution", "leetcode": "leetcode_solution"}
+# Frames of this script (the loop that calls the solution) are left out of reports.
+_HARNESS_FILE = __file__
+
+# --- Function-level hotspots (cProfile) ---
+
+def _function_label(key: Tuple[str, int, str], problem_folder: str) -> Tuple[str, str]:
+    """(function, location) for a pstats key; builtins have no file."""
+    filename, line, name = key
+    if filename == "~":
+        return name, "built-in"
+    if os.path.abspath(filename).startswith(os.path.abspath(problem_folder)):
+        filename = os.path.relpath(filename, problem_folder)
+    else:
+        filename = os.path.basename(filename)
+    return name, f"{filename}:{line}"
+
+def profile_functions(call: Callable[[], object], problem_folder: str, top: int) -> Tuple[float, List[dict]]:
+    """Runs `call` under cProfile. Returns (seconds, hotspots ranked by own time)."""
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        call()
+    finally:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    stats = pstats.Stats(profiler).stats
+    hotspots = []
+    for key, (primitive_calls, calls, own, cumulative, _) in stats.items():
+        if key[0] == _HARNESS_FILE or key[2] == "<method 'disable' of '_lsprof.Profiler' objects>":
+            continue
+        function, location = _function_label(key, problem_folder)
+        hotspots.append({
+            "function": function,
+            "location": location,
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "self_seconds": own,
+            "total_seconds": cumulative,
+        })
+    hotspots.sort(key=lambda hotspot: (-hotspot["self_seconds"], -hotspot["total_seconds"]))
+    return elapsed, hotspots[:top]
+
+# --- Line-level timing (sys.settrace) ---
+
+class LineTimer:
+    """
+    Per-line hit counts and time for one source file, in the spirit of
+    line_profiler but without the dependency. A line's time runs until the next
+    line event in the same frame, so it includes the calls it makes. Tracing
+    slows everything down several times; read the times as relative weights.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits: Dict[int, int] = defaultdict(int)
+        self.seconds: Dict[int, float] = defaultdict(float)
+        self._last: Dict[object, Tuple[int, float]] = {}
+
+    def _trace_call(self, frame, event, arg):
+        if frame.f_code.co_filename != self.path:
+            return None
+        return self._trace_line
+
+    def _trace_line(self, frame, event, arg):
+        now = time.perf_counter()
+        previous = self._last.get(frame)
+        if previous is not None:
+            self.seconds[previous[0]] += now - previous[1]
+        if event == "line":
+            self.hits[frame.f_lineno] += 1
+            self._last[frame] = (frame.f_lineno, time.perf_counter())
+        elif event == "return":
+            self._last.pop(frame, None)
+        return self._trace_line
+
+    def run(self, call: Callable[[], object]):
+        previous = sys.gettrace()
+        sys.settrace(self._trace_call)
+        try:
+            call()
+        finally:
+            sys.settrace(previous)
+            self._last.clear()
+
+    def report(self) -> List[dict]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            source = f.read().splitlines()
+        return [
+            {"line": line, "hits": self.hits[line], "seconds": self.seconds.get(line, 0.0),
+             "source": source[line - 1].rstrip() if line <= len(source) else ""}
+            for line in sorted(self.hits)
+        ]
+
+# --- Collapsed stacks (sys.setprofile) ---
+
+class StackSampler:
+    """
+    Deterministic "collapsed stack" profile: every function entry and exit
+    attributes the elapsed time to the stack that was running. The output is
+    the `frame;frame;frame weight` format of flamegraph.pl, speedscope and
+    inferno, with weights in microseconds.
+    """
+
+    def __init__(self, problem_folder: str):
+        self.problem_folder = problem_folder
+        self.stack: List[str] = []
+        self.weights: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self._last = 0.0
+
+    def _name(self, frame, event, arg) -> str:
+        if event.startswith("c_"):
+            return getattr(arg, "__qualname__", None) or getattr(arg, "__name__", "built-in")
+        code = frame.f_code
+        if code.co_filename == _HARNESS_FILE:
+            return ""
+        _, location = _function_label((code.co_filename, code.co_firstlineno, code.co_name), self.problem_folder)
+        return f"{code.co_name} ({location})"
+
+    def _profile(self, frame, event, arg):
+        now = time.perf_counter()
+        if self.stack:
+            self.weights[tuple(self.stack)] += now - self._last
+        if event in ("call", "c_call"):
+            self.stack.append(self._name(frame, event, arg))
+        elif event in ("return", "c_return", "c_exception") and self.stack:
+            self.stack.pop()
+        self._last = time.perf_counter()
+
+    def run(self, call: Callable[[], object]):
+        self._last = time.perf_counter()
+        sys.setprofile(self._profile)
+        try:
+            call()
+        finally:
+            sys.setprofile(None)
+            self.stack = []
+
+    def collapsed(self) -> str:
+        lines = []
+        for stack, seconds in sorted(self.weights.items()):
+            weight = round(seconds * 1e6)
+            if weight:
+                # Semicolons separate frames, so they cannot appear inside one.
+                frames = [frame.replace(";", ",") for frame in stack if frame]
+                if frames:
+                    lines.append(";".join(frames) + f" {weight}")
+        return "\n".join(lines) + "\n"
+
+# --- Running and saving ---
+
+def profile_solution(problem_folder: str, solution_type: str, size: int = DEFAULT_SIZE, seed: int = 0,
+                     repeat: int = 1, lines: bool = False, top: int = DEFAULT_TOP) -> Tuple[dict, str]:
+    """
+    Profiles one Python solution on a generated input of `size`. Returns the
+    report (hotspots, optional per-line timing) and its collapsed stacks.
+    """
+    solutions = load_problem_solutions(problem_folder)
+    if solution_type not in solutions:
+        raise ValueError(f"{problem_folder} has no Python {solution_type}")
+    solution_class, method_name = solutions[solution_type]
+    method = getattr(solution_class, method_name)
+    path = os.path.join(problem_folder, "python", f"{solution_type}.py")
+    args = generate_args(problem_method(problem_folder), size, seed=seed,
+                         constraints=load_meta(problem_folder).get("constraints"))
+
+    def calls():
+        # Fresh instances and argument copies, built outside the profiled region.
+        batch = [(getattr(solution_class(), method_name), call_args(method, copy_plain(args)))
+                 for _ in range(repeat)]
+        def call():
+            for bound, kwargs in batch:
+                bound(**kwargs)
+        return call
+
+    seconds, hotspots = profile_functions(calls(), problem_folder, top)
+    sampler = StackSampler(problem_folder)
+    sampler.run(calls())
+    report = {
+        "profiled_at": datetime.now().isoformat(timespec="seconds"),
+        "solution": solution_type,
+        "method": method_name,
+        "size": size,
+        "seed": seed,
+        "repeat": repeat,
+        "file_hash": file_signature(path)[2],
+        "seconds": seconds,
+        "hotspots": hotspots,
+    }
+    if lines:
+        # Solutions are compiled with this same path, so it matches co_filename.
+        timer = LineTimer(path)
+        timer.run(calls())
+        report["lines"] = timer.report()
+    return report, sampler.collapsed()
+
+def save_profile(problem_folder: str, report: dict, collapsed: str) -> Tuple[str, str]:
+    """Writes profiles/<solution>.json and profiles/<solution>.folded next to the problem."""
+    directory = os.path.join(problem_folder, PROFILES_DIR)
+    report_path = os.path.join(directory, f"{report['solution']}.json")
+    stacks_path = os.path.join(directory, f"{report['solution']}.folded")
+    report["stacks"] = os.path.relpath(stacks_path, problem_folder)
+    with problem_lock(problem_folder), Batch() as batch:
+        batch.write(stacks_path, collapsed)
+        batch.write(report_path, json.dumps(report, indent=2) + "\n")
+    return report_path, stacks_path
+
+def print_profile(report: dict):
+    print(f"\n🔥 {report['solution']}.{report['method']} at n={report['size']:,} "
+          f"({report['repeat']} call(s), {format_seconds(report['seconds'])} under cProfile)\n")
+    print(f"{'own time':>10} {'total':>10} {'calls':>9}  function")
+    print("-" * 74)
+    for hotspot in report["hotspots"]:
+        calls = str(hotspot["calls"])
+        if hotspot["primitive_calls"] != hotspot["calls"]:
+            calls += f"/{hotspot['primitive_calls']}"
+        print(f"{format_seconds(hotspot['self_seconds']):>10} {format_seconds(hotspot['total_seconds']):>10} "
+              f"{calls:>9}  {hotspot['function']} ({hotspot['location']})")
+
+    if "lines" in report:
+        total = sum(line["seconds"] for line in report["lines"]) or 1.0
+        print(f"\n{'line':>6} {'hits':>10} {'time':>10} {'%':>6}  source (traced; times are relative)")
+        print("-" * 74)
+        for line in report["lines"]:
+            print(f"{line['line']:>6} {line['hits']:>10,} {format_seconds(line['seconds']):>10} "
+                  f"{line['seconds'] / total * 100:>5.1f}%  {line['source']}")
+    print()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Profile a problem's Python solutions: cProfile hotspots, per-line timing and collapsed stacks.",
+        epilog="Example: python tools/profile_solution.py 1 --solution user --size 5000 --lines",
+    )
+    parser.add_argument("problem_number")
+    parser.add_argument("--solution", choices=sorted(SOLUTION_CHOICES), help="profile only this solution")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="size of the generated input")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the generated input")
+    parser.add_argument("--repeat", type=int, default=1, help="calls to profile (fresh input copy each)")
+    parser.add_argument("--lines", action="store_true", help="also time every line of the solution file")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="hotspots to keep")
+    parser.add_argument("--no-save", action="store_true",
+                        help="only print; don't write profiles/ next to the problem or rebuild the UI")
+    options = parser.parse_args()
+
+    problem_folder = resolve_problem(options.problem_number)
+    solution_types = [SOLUTION_CHOICES[options.solution]] if options.solution else list(SOLUTION_CHOICES.values())
+    saved = 0
+    for solution_type in solution_types:
+        if not os.path.exists(os.path.join(problem_folder, "python", f"{solution_type}.py")):
+            continue
+        try:
+            report, collapsed = profile_solution(problem_folder, solution_type, options.size, options.seed,
+                                                 options.repeat, options.lines, options.top)
+        except (ValueError, TypeError) as e:
+            print(f"❌ Error: {solution_type}: {e}")
+            continue
+        print_profile(report)
+        if not options.no_save:
+            report_path, stacks_path = save_profile(problem_folder, report, collapsed)
+            print(f"💾 Saved {report_path} and {stacks_path}")
+            saved += 1
+
+    if saved:
+        rebuild_problems([problem_folder])
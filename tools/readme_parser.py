@@ -0,0 +1,138 @@
+import os
+import re
+import sys
+import json
+from typing import Dict, Iterable, List, Optional
+
+# Matches "Example 1:", "**Example 1:**", "### Example 1" headings in a README.
+EXAMPLE_HEADING = re.compile(r"^[#*\s]*example\s*(\d+)\b", re.IGNORECASE)
+EXAMPLE_FIELDS = ("input", "output", "explanation")
+# Opening/closing code fences: ``` or ~~~ (three or more), with an optional info string.
+FENCE = re.compile(r"^\s*(`{3,}|~{3,})\s*([^`\s]*)")
+COMPLEXITY_BULLETS = {"- **Time:**": "time", "- **Space:**": "space"}
+
+def parse_markdown(lines: Iterable[str]) -> Dict[str, object]:
+    """
+    Parses a problem README in a single pass over its lines and returns:
+
+        {
+            "title": "1. Two Sum",                       # the "# " heading
+            "sections": {"Problem Description": "...", ...},  # every "## " section
+            "time": "O(n)", "space": "O(n)",             # "- **Time:**" / "- **Space:**" bullets
+            "code_blocks": [{"language", "code", "section"}, ...],
+            "examples": [{"input", "output", "explanation"?}, ...],
+        }
+
+    Headings inside code fences are ignored. When a section title repeats, the first
+    one wins. Example blocks ("**Example 1:**" followed by Input/Output/Explanation
+    lines, bold or inside a fence) may appear anywhere before the next "## " heading.
+    """
+    document: Dict[str, object] = {"title": "", "sections": {}, "time": None, "space": None,
+                                   "code_blocks": [], "examples": []}
+    sections: Dict[str, str] = document["sections"]
+    code_blocks: List[dict] = document["code_blocks"]
+    examples: List[Dict[str, str]] = document["examples"]
+
+    section_title: Optional[str] = None
+    section_lines: List[str] = []
+    fence: Optional[str] = None
+    fence_language = ""
+    code_lines: List[str] = []
+    example: Optional[Dict[str, str]] = None
+    field: Optional[str] = None
+
+    def close_section():
+        if section_title is not None and section_title not in sections:
+            sections[section_title] = "\n".join(section_lines).strip()
+
+    def close_example():
+        if example is not None and "input" in example and "output" in example:
+            examples.append(example)
+
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        # Cheap substring checks gate the regexes; most lines are plain prose.
+        first = line.lstrip()[:1]
+
+        # --- Code fences ---
+        fence_match = FENCE.match(line) if first in ("`", "~") else None
+        if fence is None and fence_match:
+            fence, fence_language, code_lines = fence_match.group(1), fence_match.group(2), []
+        elif fence is not None and fence_match and fence_match.group(1).startswith(fence) and not fence_match.group(2):
+            code_blocks.append({"language": fence_language, "code": "\n".join(code_lines), "section": section_title})
+            fence = None
+        elif fence is not None:
+            code_lines.append(line)
+
+        # --- Headings (outside fences) ---
+        if fence is None and first == "#":
+            if line.startswith("# ") and not document["title"]:
+                document["title"] = line[2:].strip()
+                continue
+            if line.startswith("## "):
+                close_section()
+                close_example()
+                section_title, section_lines = line[3:].strip(), []
+                # "## Example 1" is both a section and the start of an example.
+                example, field = ({} if EXAMPLE_HEADING.match(line) else None), None
+                continue
+
+        if section_title is not None:
+            section_lines.append(line)
+
+        # --- Complexity bullets (the last one wins, as they are usually at the end) ---
+        if fence is None and "- **" in line:
+            for marker, key in COMPLEXITY_BULLETS.items():
+                if marker in line:
+                    document[key] = line.split(marker, 1)[1].strip()
+
+        # --- Examples ---
+        if "xample" in line and EXAMPLE_HEADING.match(line):
+            close_example()
+            example, field = {}, None
+            continue
+        if example is None:
+            continue
+        text = line.strip().strip("`>-").strip()
+        label, _, value = text.partition(":")
+        key = label.replace("*", "").strip().lower()
+        if value and key in EXAMPLE_FIELDS:
+            field = key
+            example[field] = value.lstrip("*").strip()
+        elif field == "explanation" and text:
+            example[field] += " " + text
+        elif not text:
+            field = None
+
+    if fence is not None:
+        # An unterminated fence still counts as a code block.
+        code_blocks.append({"language": fence_language, "code": "\n".join(code_lines), "section": section_title})
+    close_section()
+    close_example()
+    return document
+
+def find_section(sections: Dict[str, str], prefix: str) -> str:
+    """
+    The first section whose title starts with `prefix`, ignoring case, so that
+    "## Approach: Hash Map" and "## Notes & Edge Cases" count as Approach and Notes.
+    Returns "" when there is none.
+    """
+    prefix = prefix.lower()
+    for title, body in sections.items():
+        if title.lower().startswith(prefix):
+            return body
+    return ""
+
+def parse_file(readme_path: str) -> Dict[str, object]:
+    """Parses a README file line by line without reading it into one string."""
+    with open(readme_path, "r", encoding="utf-8") as f:
+        return parse_markdown(f)
+
+def parse_text(content: str) -> Dict[str, object]:
+    return parse_markdown(content.split("\n"))
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or not os.path.isfile(sys.argv[1]):
+        print("Usage: python tools/readme_parser.py <path/to/README.md>")
+        sys.exit(1)
+    print(json.dumps(parse_file(sys.argv[1]), indent=2, ensure_ascii=False))
@@ -0,0 +1,392 @@
+import os
+import sys
+import time
+import hashlib
+import argparse
+import traceback
+import multiprocessing
+from collections import OrderedDict
+from multiprocessing.connection import wait
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no memory limits or RSS checks.
+    resource = None
+
+from corpus import Corpus
+from solution_loader import (
+    call_args,
+    compile_solution,
+    solution_class_from_code,
+    solution_method_name,
+    to_plain,
+)
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_MAX_MEMORY_MB = 1024
+# Workers are replaced after this many jobs to bound slow leaks across solutions.
+DEFAULT_MAX_JOBS_PER_WORKER = 2000
+
+# --- WORKER SIDE ---
+
+class CodeCache:
+    """
+    LRU cache of compiled solution modules keyed by path. An entry is reused while
+    the file's mtime is unchanged; if the mtime moved but the content hash did not
+    (e.g. a `touch` or checkout), the compiled code is kept as well.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str):
+        """Returns (code object, whether it came from the cache)."""
+        mtime_ns = os.stat(path).st_mtime_ns
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == mtime_ns:
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return entry[2], True
+
+        with open(path, "rb") as f:
+            source = f.read()
+        digest = hashlib.sha1(source).hexdigest()
+        if entry is not None and entry[1] == digest:
+            code = entry[2]
+            cached = True
+            self.hits += 1
+        else:
+            code = compile_solution(source.decode("utf-8"), path)
+            cached = False
+            self.misses += 1
+
+        self.entries[path] = (mtime_ns, digest, code)
+        self.entries.move_to_end(path)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return code, cached
+
+def _rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+def _corpus_cases(corpus: Corpus, result: dict):
+    """Decodes corpus cases one at a time, adding the decode time to the result."""
+    for index in range(corpus.start, corpus.stop):
+        begin = time.perf_counter()
+        case = corpus.case(index)["input"]
+        result["decode_seconds"] += time.perf_counter() - begin
+        yield case
+
+def _run_case(solution_class: type, method, method_name: str, path: str, case: dict, keep_outputs: bool) -> dict:
+    try:
+        args = call_args(method, case)
+        start = time.perf_counter()
+        output = getattr(solution_class(), method_name)(**args)
+        elapsed = time.perf_counter() - start
+        return {"ok": True, "output": to_plain(output) if keep_outputs else None, "error": None, "seconds": elapsed}
+    except MemoryError:
+        raise
+    except Exception as e:
+        frames = traceback.extract_tb(e.__traceback__)
+        line = next((frame.lineno for frame in reversed(frames) if frame.filename == path), None)
+        where = f" (line {line})" if line else ""
+        return {"ok": False, "output": None, "error": f"{type(e).__name__}: {e}{where}", "seconds": None}
+
+def run_job(cache: CodeCache, job: dict) -> dict:
+    """
+    Runs one solution file over a list of plain test cases, or over cases
+    start..stop of a memory-mapped corpus file ({"corpus", "start", "stop"}).
+    With "outputs": False only status and timing are sent back.
+    """
+    path = job["path"]
+    result = {"id": job.get("id"), "path": path, "ok": True, "error": None, "cached": False, "results": []}
+    corpus = None
+    try:
+        code, result["cached"] = cache.get(path)
+        # A fresh module namespace per job, like a fresh LeetCode submission.
+        solution_class = solution_class_from_code(code, path)
+        method_name = job.get("method") or solution_method_name(solution_class)
+        method = getattr(solution_class, method_name)
+        if job.get("corpus"):
+            corpus = Corpus(job["corpus"], job.get("start", 0), job.get("stop"))
+            result["decode_seconds"] = 0.0
+            cases = _corpus_cases(corpus, result)
+        else:
+            cases = job["cases"]
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+        return result
+
+    keep_outputs = job.get("outputs", True)
+    try:
+        for case in cases:
+            result["results"].append(_run_case(solution_class, method, method_name, path, case, keep_outputs))
+    except MemoryError:
+        raise
+    except Exception as e:  # A corrupt corpus record; the cases themselves never raise here.
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    finally:
+        if corpus is not None:
+            corpus.close()
+    return result
+
+def _worker_main(conn, cache_size: int, max_memory_mb: int):
+    """Worker loop: receive a job over the pipe, send back its result, repeat."""
+    if resource is not None and max_memory_mb:
+        limit = max_memory_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError):
+            pass
+
+    cache = CodeCache(cache_size)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        try:
+            result = run_job(cache, job)
+        except MemoryError:
+            conn.send({"id": job.get("id"), "path": job["path"], "ok": False,
+                       "error": f"MemoryError: exceeded {max_memory_mb} MB", "recycle": True, "results": []})
+            return
+        result["recycle"] = bool(max_memory_mb) and _rss_mb() > max_memory_mb * 0.9
+        conn.send(result)
+        if result["recycle"]:
+            return
+
+# --- PARENT SIDE ---
+
+class _Worker:
+    def __init__(self, context, cache_size: int, max_memory_mb: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, cache_size, max_memory_mb), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs_done = 0
+        self.job_index: Optional[int] = None
+        self.deadline = 0.0
+
+    def stop(self, kill: bool = False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+class SolutionRunner:
+    """
+    A pool of warm worker processes that run solution files against test cases.
+
+    Workers keep compiled solution modules in an LRU cache, so running the same
+    files again costs a dictionary lookup instead of an interpreter start and a
+    compile. A job that exceeds its timeout gets its worker killed and replaced;
+    workers that crash, run out of memory or hit `max_jobs_per_worker` are recycled.
+    """
+
+    def __init__(self, workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+                 cache_size: int = DEFAULT_CACHE_SIZE, max_memory_mb: int = DEFAULT_MAX_MEMORY_MB,
+                 max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER):
+        self.size = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.max_memory_mb = max_memory_mb
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.context = multiprocessing.get_context()
+        self.workers: List[_Worker] = []
+        self.restarts = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self.context, self.cache_size, self.max_memory_mb)
+
+    def _replace(self, worker: _Worker, kill: bool):
+        worker.stop(kill=kill)
+        self.workers[self.workers.index(worker)] = self._spawn()
+        self.restarts += 1
+
+    def close(self):
+        for worker in self.workers:
+            worker.stop()
+        self.workers = []
+
+    def run(self, path: str, cases: List[dict], method: Optional[str] = None,
+            timeout: Optional[float] = None) -> dict:
+        """Runs one solution file over `cases` and returns its result."""
+        job = {"path": path, "cases": cases, "method": method}
+        if timeout is not None:
+            job["timeout"] = timeout
+        return self.run_many([job])[0]
+
+    def run_corpus(self, path: str, corpus_path: str, method: Optional[str] = None,
+                   shards: Optional[int] = None, outputs: bool = True) -> dict:
+        """
+        Runs one solution file over every case of a corpus file, split into
+        contiguous shards across the pool. Workers map and decode only their own
+        shard; the merged result lists cases in corpus order.
+        """
+        with Corpus(corpus_path, 0, 0) as corpus:  # Reads the header only.
+            count = corpus.count
+        shards = max(1, min(shards or self.size, count))
+        bounds = [count * shard // shards for shard in range(shards + 1)]
+        jobs = [{"path": path, "corpus": corpus_path, "start": start, "stop": stop,
+                 "method": method, "outputs": outputs}
+                for start, stop in zip(bounds, bounds[1:])]
+        merged = {"path": path, "ok": True, "error": None, "cached": False, "results": [], "decode_seconds": 0.0}
+        for result in self.run_many(jobs):
+            if not result["ok"] and merged["ok"]:
+                merged.update(ok=False, error=result["error"])
+            merged["cached"] = merged["cached"] or result.get("cached", False)
+            merged["results"].extend(result["results"])
+            merged["decode_seconds"] += result.get("decode_seconds", 0.0)
+        return merged
+
+    def run_many(self, jobs: List[dict]) -> List[dict]:
+        """
+        Runs jobs ({"path", "cases" or "corpus", optional "method" and "timeout"}) across the pool.
+        Results are returned in the same order as the jobs.
+        """
+        while len(self.workers) < min(self.size, max(1, len(jobs))):
+            self.workers.append(self._spawn())
+
+        results: List[Optional[dict]] = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+        pending.reverse()
+        busy: Dict[object, _Worker] = {}
+
+        while pending or busy:
+            for worker in list(self.workers):
+                if not pending:
+                    break
+                if worker.job_index is not None:
+                    continue
+                index = pending.pop()
+                job = dict(jobs[index], id=index)
+                worker.job_index = index
+                worker.deadline = time.monotonic() + job.get("timeout", self.timeout)
+                try:
+                    worker.conn.send(job)
+                except (BrokenPipeError, OSError):
+                    worker.job_index = None
+                    pending.append(index)
+                    self._replace(worker, kill=True)
+                    continue
+                busy[worker.conn] = worker
+
+            if not busy:
+                continue
+            now = time.monotonic()
+            next_deadline = min(worker.deadline for worker in busy.values())
+            for conn in wait(list(busy), timeout=max(0.0, next_deadline - now)):
+                worker = busy.pop(conn)
+                index, worker.job_index = worker.job_index, None
+                try:
+                    result = conn.recv()
+                except (EOFError, OSError):
+                    results[index] = self._failure(jobs[index], "worker crashed")
+                    self._replace(worker, kill=True)
+                    continue
+                results[index] = result
+                worker.jobs_done += 1
+                if result.pop("recycle", False) or worker.jobs_done >= self.max_jobs_per_worker:
+                    self._replace(worker, kill=False)
+
+            now = time.monotonic()
+            for conn, worker in list(busy.items()):
+                if worker.deadline <= now:
+                    del busy[conn]
+                    index, worker.job_index = worker.job_index, None
+                    limit = jobs[index].get("timeout", self.timeout)
+                    results[index] = self._failure(jobs[index], f"timed out after {limit:g}s")
+                    self._replace(worker, kill=True)
+
+        return results
+
+    @staticmethod
+    def _failure(job: dict, error: str) -> dict:
+        return {"path": job["path"], "ok": False, "error": error, "cached": False, "results": []}
+
+# --- CLI: smoke-run every Python solution on generated inputs ---
+
+if __name__ == "__main__":
+    from generators import generate_args
+    from problem_index import problem_folders
+    from solution_loader import load_meta, load_solution_class, python_solution_paths, resolve_problem
+
+    parser = argparse.ArgumentParser(
+        description="Run Python solutions in a pool of warm worker processes.",
+        epilog="Example: python tools/runner.py --all -j 4",
+    )
+    parser.add_argument("problem_number", nargs="?")
+    parser.add_argument("--all", action="store_true", help="run every problem with Python solutions")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds per solution file")
+    parser.add_argument("--size", type=int, default=100, help="size of the generated inputs")
+    parser.add_argument("--cases", type=int, default=10, help="generated cases per solution")
+    parser.add_argument("--rounds", type=int, default=1,
+                        help="run everything this many times (later rounds hit the warm cache)")
+    options = parser.parse_args()
+    if not options.all and not options.problem_number:
+        parser.error("give a problem number or --all")
+
+    folders = problem_folders() if options.all else [resolve_problem(options.problem_number)]
+    jobs = []
+    failed = False
+    for problem_folder in folders:
+        constraints = load_meta(problem_folder).get("constraints")
+        for solution_type, path in python_solution_paths(problem_folder).items():
+            try:
+                solution_class = load_solution_class(path)
+                method = getattr(solution_class, solution_method_name(solution_class))
+                cases = [generate_args(method, options.size, seed=seed, constraints=constraints)
+                         for seed in range(options.cases)]
+            except Exception as e:
+                print(f"❌ {path}: {type(e).__name__}: {e}")
+                failed = True
+                continue
+            jobs.append({"path": path, "cases": cases})
+
+    with SolutionRunner(workers=options.jobs, timeout=options.timeout) as runner:
+        for round_number in range(1, options.rounds + 1):
+            start = time.perf_counter()
+            results = runner.run_many(jobs)
+            elapsed = time.perf_counter() - start
+            failures = 0
+            for result in results:
+                errors = [case["error"] for case in result["results"] if not case["ok"]]
+                if not result["ok"] or errors:
+                    failures += 1
+                    print(f"❌ {result['path']}: {result['error'] or errors[0]}")
+            failed = failed or failures > 0
+            cached = sum(1 for result in results if result.get("cached"))
+            print(f"🏃 Round {round_number}: {len(jobs)} solution file(s), {failures} failing, "
+                  f"{cached} from warm cache, {elapsed * 1000:.1f} ms total "
+                  f"({elapsed * 1000 / max(1, len(folders)):.2f} ms per problem)")
+        if runner.restarts:
+            print(f"♻️  Recycled {runner.restarts} worker(s).")
+    # A timeout, crash or failing case anywhere fails the run, so scripts and CI can rely on it.
+    sys.exit(1 if failed else 0)
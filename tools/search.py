@@ -0,0 +1,233 @@
+import os
+import re
+import sys
+import json
+import math
+import argparse
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from fileio import write_json
+from problem_index import file_signature, problem_folders
+from update_progress import load_config, parse_readme, solution_paths
+
+# Per-problem term weights and an inverted index over them, kept between runs so
+# only problems whose files changed are re-tokenized. Not committed.
+SEARCH_INDEX_PATH = os.path.join("tools", ".search_index.json")
+# The compact copy the viewer fetches for client-side search.
+EXPORT_PATH = os.path.join("viewer", "public", "search-index.json")
+INDEX_VERSION = 1
+
+# A term found in the title counts three times as much as one in the statement.
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "statement": 1.0, "approach": 1.0, "notes": 1.0, "code": 0.5}
+# BM25 parameters (the usual defaults).
+K1 = 1.2
+B = 0.75
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if", "in", "is", "it", "its",
+    "of", "on", "or", "that", "the", "this", "to", "we", "with", "you", "your", "i", "my", "can",
+    "self", "def", "return", "class", "solution", "none", "true", "false", "int", "str", "list",
+    "public", "var", "new",
+}
+
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+")
+# Splits camelCase, PascalCase and HTTPServer-style identifiers into their parts.
+_IDENTIFIER_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+def stem(term: str) -> str:
+    """A deliberately tiny plural stemmer: pointers -> pointer, queries -> query."""
+    if len(term) > 4 and term.endswith("ies"):
+        return term[:-3] + "y"
+    if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+        return term[:-1]
+    return term
+
+def tokenize(text: str) -> List[str]:
+    """
+    Terms of a piece of prose or code. Identifiers are indexed whole and by their
+    parts, so `twoSum`, `max_heap` and `heapq.heappush` match "two sum", "heap" and
+    "heappush".
+    """
+    terms = []
+    for word in _WORD.findall(text):
+        parts = [part for piece in word.split("_") for part in _IDENTIFIER_PART.findall(piece)]
+        whole = word.lower().strip("_")
+        candidates = [whole] if len(parts) <= 1 else [whole] + [part.lower() for part in parts]
+        for term in candidates:
+            if len(term) > 1 and term not in STOPWORDS:
+                terms.append(stem(term))
+    return terms
+
+def document_terms(problem_folder: str, meta_data: dict, config: dict) -> Counter:
+    """Weighted term frequencies for one problem across all of its fields."""
+    readme = parse_readme(os.path.join(problem_folder, "README.md"))
+    fields = {
+        "title": meta_data.get("title", ""),
+        "tags": " ".join(meta_data.get("tags", [])),
+        "statement": readme["statement"],
+        "approach": readme["approach"],
+        "notes": readme["notes"],
+    }
+    terms: Counter = Counter()
+    for field, text in fields.items():
+        for term in tokenize(text):
+            terms[term] += FIELD_WEIGHTS[field]
+    for files in solution_paths(problem_folder, meta_data, config).values():
+        for path in files.values():
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    for term in tokenize(f.read()):
+                        terms[term] += FIELD_WEIGHTS["code"]
+    return terms
+
+def empty_index() -> dict:
+    return {"version": INDEX_VERSION, "docs": {}, "postings": {}}
+
+def load_search_index() -> dict:
+    if not os.path.exists(SEARCH_INDEX_PATH):
+        return empty_index()
+    try:
+        with open(SEARCH_INDEX_PATH, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return empty_index()
+    return index if index.get("version") == INDEX_VERSION else empty_index()
+
+def save_search_index(index: dict):
+    write_json(SEARCH_INDEX_PATH, index, indent=None, separators=(",", ":"))
+
+def _remove_document(index: dict, folder_name: str):
+    doc = index["docs"].pop(folder_name, None)
+    if not doc:
+        return
+    for term in doc["terms"]:
+        postings = index["postings"].get(term)
+        if postings is not None:
+            postings.pop(folder_name, None)
+            if not postings:
+                del index["postings"][term]
+
+def update_search_index(index: dict, force: bool = False) -> Dict[str, int]:
+    """
+    Re-tokenizes only the problems whose meta.json, README.md or solution files
+    changed (stat first, then sha1), and drops problems that no longer exist.
+    """
+    config = load_config()
+    counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+    seen = set()
+    for problem_folder in problem_folders():
+        folder_name = os.path.basename(problem_folder)
+        meta_path = os.path.join(problem_folder, "meta.json")
+        if not os.path.isfile(meta_path):
+            continue
+        seen.add(folder_name)
+        doc = index["docs"].get(folder_name)
+        previous = doc["inputs"] if doc else {}
+
+        # meta.json is checked first: it decides which solution files exist at all.
+        meta_signature = file_signature(meta_path, previous.get(meta_path))
+        if doc and not force and meta_signature[2] == (previous.get(meta_path) or [None] * 3)[2]:
+            inputs = {path: file_signature(path, signature) for path, signature in previous.items()}
+            if all((inputs[path] or [None] * 3)[2] == (previous[path] or [None] * 3)[2] for path in inputs):
+                doc["inputs"] = inputs
+                counts["unchanged"] += 1
+                continue
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta_data = json.load(f)
+        paths = [meta_path, os.path.join(problem_folder, "README.md")]
+        for files in solution_paths(problem_folder, meta_data, config).values():
+            paths.extend(files.values())
+
+        terms = document_terms(problem_folder, meta_data, config)
+        _remove_document(index, folder_name)
+        index["docs"][folder_name] = {
+            "number": meta_data.get("problem_number"),
+            "title": meta_data.get("title", ""),
+            "difficulty": meta_data.get("difficulty", ""),
+            "length": round(sum(terms.values()), 2),
+            "terms": sorted(terms),
+            "inputs": {path: file_signature(path, previous.get(path)) for path in paths},
+        }
+        for term, frequency in terms.items():
+            index["postings"].setdefault(term, {})[folder_name] = round(frequency, 2)
+        counts["indexed"] += 1
+
+    for folder_name in set(index["docs"]) - seen:
+        _remove_document(index, folder_name)
+        counts["removed"] += 1
+    return counts
+
+def search(index: dict, query: str, limit: int = 10) -> List[Tuple[float, str, dict]]:
+    """Ranks problems against `query` with BM25. Returns (score, folder, doc), best first."""
+    docs = index["docs"]
+    if not docs:
+        return []
+    average_length = sum(doc["length"] for doc in docs.values()) / len(docs) or 1.0
+    scores: Dict[str, float] = {}
+    for term in set(tokenize(query)):
+        postings = index["postings"].get(term)
+        if not postings:
+            continue
+        idf = math.log(1 + (len(docs) - len(postings) + 0.5) / (len(postings) + 0.5))
+        for folder_name, frequency in postings.items():
+            norm = K1 * (1 - B + B * docs[folder_name]["length"] / average_length)
+            scores[folder_name] = scores.get(folder_name, 0.0) + idf * frequency * (K1 + 1) / (frequency + norm)
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], docs[item[0]]["number"] or 0))
+    return [(score, folder_name, docs[folder_name]) for folder_name, score in ranked[:limit]]
+
+def export_search_index(index: dict, path: str = EXPORT_PATH) -> int:
+    """
+    Writes the compact form loaded by the viewer:
+        {"docs": [[folder, number, title, difficulty, length], ...],
+         "terms": {term: [doc position, frequency, doc position, frequency, ...]}}
+    """
+    folders = sorted(index["docs"], key=lambda name: index["docs"][name]["number"] or 0)
+    position = {folder_name: i for i, folder_name in enumerate(folders)}
+    compact = {
+        "version": INDEX_VERSION,
+        "k1": K1,
+        "b": B,
+        "docs": [[name, index["docs"][name]["number"], index["docs"][name]["title"],
+                  index["docs"][name]["difficulty"], index["docs"][name]["length"]] for name in folders],
+        "terms": {
+            term: [value for name, frequency in sorted(postings.items(), key=lambda item: position[item[0]])
+                   for value in (position[name], frequency)]
+            for term, postings in sorted(index["postings"].items())
+        },
+    }
+    write_json(path, compact, indent=None, separators=(",", ":"), ensure_ascii=False)
+    return os.path.getsize(path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Full-text search over problem statements, approaches, notes and solution code.",
+        epilog='Example: python tools/search.py "two pointers sliding window"',
+    )
+    parser.add_argument("query", nargs="?")
+    parser.add_argument("-n", "--limit", type=int, default=10, help="number of results")
+    parser.add_argument("--rebuild", action="store_true", help="re-tokenize every problem")
+    parser.add_argument("--export", nargs="?", const=EXPORT_PATH, metavar="PATH",
+                        help=f"write the compact viewer index (default: {EXPORT_PATH})")
+    options = parser.parse_args()
+    if not options.query and not options.export and not options.rebuild:
+        parser.error("give a query, --export or --rebuild")
+
+    index = empty_index() if options.rebuild else load_search_index()
+    counts = update_search_index(index, force=options.rebuild)
+    if counts["indexed"] or counts["removed"] or options.rebuild:
+        print(f"🔎 Indexed {counts['indexed']} problem(s), {counts['unchanged']} unchanged, "
+              f"{counts['removed']} removed.", file=sys.stderr)
+    save_search_index(index)
+
+    if options.export:
+        size = export_search_index(index, options.export)
+        print(f"✅ Exported search index to {options.export} ({size / 1024:.1f} KiB)")
+
+    if options.query:
+        results = search(index, options.query, options.limit)
+        if not results:
+            print(f"No problems match '{options.query}'.")
+        for score, folder_name, doc in results:
+            print(f"{score:7.2f}  #{doc['number']:<5} {doc['title']}  ({doc['difficulty']})  problems/{folder_name}")
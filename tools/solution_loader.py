@@ -0,0 +1,218 @@
+import os
+import sys
+import json
+import typing
+import inspect
+from types import CodeType
+from typing import Optional, Dict, Tuple
+
+from problem_index import find_problem_folder
+
+PROBLEMS_DIR = "problems"
+SOLUTION_TYPES = ["user_solution", "leetcode_solution"]
+
+# LeetCode runs solutions with these names already in scope, so the solution
+# files in this repo use them without importing anything.
+PRELUDE_SOURCE = """
+from typing import *
+import collections
+import heapq
+import bisect
+import math
+import itertools
+import functools
+import string
+import random
+import re
+from collections import Counter, defaultdict, deque, OrderedDict
+from heapq import heappush, heappop, heapify
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache, reduce
+try:
+    from functools import cache
+except ImportError:
+    cache = lru_cache(maxsize=None)
+from itertools import accumulate, combinations, permutations, product
+
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+"""
+
+_prelude_code = compile(PRELUDE_SOURCE, "<leetcode-prelude>", "exec")
+_prelude: Dict[str, object] = {}
+
+def prelude_namespace() -> dict:
+    """Returns a fresh module namespace with the LeetCode prelude already executed."""
+    if not _prelude:
+        exec(_prelude_code, _prelude)
+    return dict(_prelude)
+
+def load_solution_class(path: str, namespace: Optional[dict] = None) -> type:
+    """Executes a solution file in a prelude namespace and returns its Solution class."""
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    return load_solution_source(source, path, namespace)
+
+def compile_solution(source: str, path: str) -> CodeType:
+    return compile(source, path, "exec")
+
+def solution_class_from_code(code: CodeType, path: str, namespace: Optional[dict] = None) -> type:
+    """Executes a compiled solution module in a prelude namespace and returns its Solution class."""
+    namespace = prelude_namespace() if namespace is None else namespace
+    namespace["__name__"] = "solution"
+    namespace["__file__"] = path
+    exec(code, namespace)
+    solution_class = namespace.get("Solution")
+    if not isinstance(solution_class, type):
+        raise ValueError(f"{path} does not define a Solution class")
+    return solution_class
+
+def load_solution_source(source: str, path: str, namespace: Optional[dict] = None) -> type:
+    return solution_class_from_code(compile_solution(source, path), path, namespace)
+
+def solution_method_name(solution_class: type) -> str:
+    """Returns the name of the single public method LeetCode would call."""
+    names = [
+        name for name, member in vars(solution_class).items()
+        if not name.startswith("_") and inspect.isfunction(member)
+    ]
+    if len(names) != 1:
+        raise ValueError(f"Expected one public method on Solution, found {names or 'none'}")
+    return names[0]
+
+# --- LEETCODE SERIALIZATION ---
+# Test cases and results travel as plain JSON-like data: linked lists as arrays
+# and binary trees as level-order arrays with None for missing children.
+
+def node_type(annotation) -> Optional[type]:
+    """Returns the ListNode/TreeNode class if the annotation is (Optional of) one of them."""
+    if typing.get_origin(annotation) is typing.Union:
+        members = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        annotation = members[0]
+    if isinstance(annotation, type) and annotation.__name__ in ("ListNode", "TreeNode"):
+        return annotation
+    return None
+
+def build_linked_list(node_class: type, values: list):
+    head = None
+    for value in reversed(values):
+        head = node_class(value, head)
+    return head
+
+def build_tree(node_class: type, values: list):
+    if not values or values[0] is None:
+        return None
+    root = node_class(values[0])
+    queue = [root]
+    position, index = 0, 1
+    while index < len(values):
+        node = queue[position]
+        position += 1
+        for side in ("left", "right"):
+            if index < len(values) and values[index] is not None:
+                child = node_class(values[index])
+                setattr(node, side, child)
+                queue.append(child)
+            index += 1
+    return root
+
+def from_plain(annotation, value):
+    """Converts a plain argument value to the type a Solution method expects."""
+    node_class = node_type(annotation)
+    if node_class is not None and isinstance(value, list):
+        if node_class.__name__ == "ListNode":
+            return build_linked_list(node_class, value)
+        return build_tree(node_class, value)
+    if typing.get_origin(annotation) is list and isinstance(value, list):
+        element = (typing.get_args(annotation) or (None,))[0]
+        if node_type(element) is not None:
+            return [from_plain(element, item) for item in value]
+    return value
+
+def to_plain(value):
+    """Converts a Solution result back to plain data (lists, numbers, strings, None)."""
+    if hasattr(value, "val") and hasattr(value, "next"):
+        values, seen = [], set()
+        while value is not None and id(value) not in seen:
+            seen.add(id(value))
+            values.append(value.val)
+            value = value.next
+        return values
+    if hasattr(value, "val") and hasattr(value, "left") and hasattr(value, "right"):
+        values, queue, position = [], [value], 0
+        while position < len(queue):
+            node = queue[position]
+            position += 1
+            if node is None:
+                values.append(None)
+                continue
+            values.append(node.val)
+            queue.append(node.left)
+            queue.append(node.right)
+        while values and values[-1] is None:
+            values.pop()
+        return values
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(to_plain(item) for item in value)
+    return value
+
+def copy_plain(value):
+    """Copies plain case data for one call; much cheaper than deepcopy for flat lists."""
+    if isinstance(value, list):
+        if value and isinstance(value[0], (list, dict)):
+            return [copy_plain(item) for item in value]
+        return value[:]
+    if isinstance(value, dict):
+        return {key: copy_plain(item) for key, item in value.items()}
+    return value
+
+def call_args(method, case: dict) -> dict:
+    """Builds keyword arguments for `method` from a plain test case."""
+    hints = typing.get_type_hints(method)
+    return {name: from_plain(hints.get(name), value) for name, value in case.items()}
+
+def python_solution_paths(problem_folder: str) -> Dict[str, str]:
+    """Maps solution type -> path for the problem's Python solutions that define a Solution class."""
+    paths = {}
+    for solution_type in SOLUTION_TYPES:
+        path = os.path.join(problem_folder, "python", f"{solution_type}.py")
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            if "class Solution" in f.read():
+                paths[solution_type] = path
+    return paths
+
+def load_problem_solutions(problem_folder: str) -> Dict[str, Tuple[type, str]]:
+    """Loads every Python Solution for a problem, as solution type -> (class, method name)."""
+    solutions = {}
+    for solution_type, path in python_solution_paths(problem_folder).items():
+        solution_class = load_solution_class(path)
+        solutions[solution_type] = (solution_class, solution_method_name(solution_class))
+    return solutions
+
+def load_meta(problem_folder: str) -> dict:
+    with open(os.path.join(problem_folder, "meta.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def resolve_problem(problem_number: str) -> str:
+    """Finds a problem folder by number or exits with the tools' usual error."""
+    problem_folder = find_problem_folder(problem_number)
+    if not problem_folder:
+        print(f"❌ Error: Problem {problem_number} not found in '{PROBLEMS_DIR}/'")
+        sys.exit(1)
+    return problem_folder
@@ -0,0 +1,75 @@
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+# Opt-in phase tracing for the tools themselves. When enabled, every `span()`
+# writes one JSON line when it finishes:
+#   {"span": "readme_parse", "ms": 0.412, "ts": 1714557600.123456, "pid": 4242,
+#    "parent": "update_problem", "depth": 1, "problem": "0001_two-sum"}
+# "ts" is the wall-clock start, so spans from worker processes can be merged.
+# Disabled (the default), a span costs one function call.
+#
+# This is not tools/trace.py on purpose: that would shadow the standard library's
+# `trace` module for every script run from tools/.
+
+_sink = None
+_stack: List[str] = []
+
+def enable(target: Optional[str] = None):
+    """Starts tracing to `target` (appended to), or to stderr when it is None or "-"."""
+    global _sink
+    disable()
+    if target in (None, "-"):
+        _sink = sys.stderr
+    else:
+        # Line-buffered, so worker processes forked from here append whole lines.
+        _sink = open(target, "a", encoding="utf-8", buffering=1)
+
+def disable():
+    """Stops tracing and closes the trace file, if one was opened."""
+    global _sink
+    if _sink is not None and _sink is not sys.stderr:
+        _sink.close()
+    _sink = None
+    _stack.clear()
+
+def enabled() -> bool:
+    return _sink is not None
+
+@contextmanager
+def span(name: str, **fields):
+    """Times the enclosed block as a named phase; extra keyword fields are recorded with it."""
+    if _sink is None:
+        yield
+        return
+    record = {"span": name, "ms": 0.0, "ts": round(time.time(), 6), "pid": os.getpid(),
+              "parent": _stack[-1] if _stack else None, "depth": len(_stack)}
+    record.update(fields)
+    _stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["ms"] = round((time.perf_counter() - start) * 1000, 3)
+        _stack.pop()
+        _sink.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+def take_trace_option(argv: List[str]) -> List[str]:
+    """
+    Enables tracing for a `--trace` or `--trace=FILE` argument and returns the
+    other arguments. Without one, tracing left on by an earlier command in the
+    same process (under `lc.py serve`) is turned off.
+    """
+    disable()
+    remaining = []
+    for arg in argv:
+        if arg == "--trace":
+            enable()
+        elif arg.startswith("--trace="):
+            enable(arg.split("=", 1)[1])
+        else:
+            remaining.append(arg)
+    return remaining
@@ -0,0 +1,246 @@
+import os
+import re
+import ast
+import sys
+import json
+import math
+import argparse
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fileio import write_json
+from generators import generate_args, problem_method
+from problem_index import problem_folders
+from runner import DEFAULT_TIMEOUT, SolutionRunner
+from solution_loader import load_meta, python_solution_paths, resolve_problem
+from update_progress import TEST_RESULTS_FILE, parse_readme
+
+# Extra cases for a problem live next to its meta.json, one JSON object per line:
+#   {"input": {"nums": [2, 7, 11, 15], "target": 9}, "output": [0, 1]}
+# "output" is optional; without it the leetcode_solution's answer is the oracle.
+TESTS_FILE = "tests.jsonl"
+ORACLE = "leetcode_solution"
+FLOAT_TOLERANCE = 1e-5
+
+# "nums = [2,7,11,15], target = 9" -> the positions of each "name =".
+_ARGUMENT_NAME = re.compile(r"(?:^|,)\s*([A-Za-z_]\w*)\s*=")
+
+def parse_literal(text: str):
+    """Parses a LeetCode literal (JSON-ish: null/true/false, double quotes) into Python data."""
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+def parse_example_input(text: str) -> Dict[str, object]:
+    """Turns 'nums = [2,7,11,15], target = 9' into {'nums': [2, 7, 11, 15], 'target': 9}."""
+    matches = list(_ARGUMENT_NAME.finditer(text))
+    args = {}
+    for match, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following else len(text)
+        args[match.group(1)] = parse_literal(text[match.end():end])
+    return args
+
+def load_cases(problem_folder: str) -> List[dict]:
+    """README examples first, then tests.jsonl. Each case: {"input", "output"?, "source"}."""
+    cases = []
+    readme = parse_readme(os.path.join(problem_folder, "README.md"))
+    for number, example in enumerate(readme["examples"], start=1):
+        args = parse_example_input(example["input"])
+        if args:
+            cases.append({"input": args, "output": parse_literal(example["output"]),
+                          "source": f"README example {number}", "example": number - 1})
+
+    tests_path = os.path.join(problem_folder, TESTS_FILE)
+    if os.path.exists(tests_path):
+        with open(tests_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                case = json.loads(line)
+                cases.append({"input": case["input"], "output": case.get("output"),
+                              "has_output": "output" in case, "source": f"{TESTS_FILE}:{line_number}"})
+    return cases
+
+def stress_cases(problem_folder: str, count: int, max_size: int, seed: int = 0) -> List[dict]:
+    """
+    Random cases from the Solution signature and meta.json constraints, growing from
+    size 1 to `max_size`. They carry no expected output, so leetcode_solution is the oracle.
+    """
+    if count <= 0:
+        return []
+    method = problem_method(problem_folder)
+    constraints = load_meta(problem_folder).get("constraints")
+    cases = []
+    for number in range(count):
+        size = max(1, max_size * (number + 1) // count)
+        cases.append({"input": generate_args(method, size, seed=seed + number, constraints=constraints),
+                      "has_output": False, "source": f"stress case {number + 1} (n={size}, seed={seed + number})"})
+    return cases
+
+def outputs_match(actual, expected, mode: str = "exact") -> bool:
+    """Compares plain outputs. meta.json's optional "compare" selects "exact" or "unordered"."""
+    if mode == "unordered" and isinstance(actual, list) and isinstance(expected, list):
+        key = lambda item: json.dumps(item, sort_keys=True)
+        return sorted(actual, key=key) == sorted(expected, key=key)
+    if isinstance(actual, float) or isinstance(expected, float):
+        try:
+            return math.isclose(actual, expected, rel_tol=FLOAT_TOLERANCE, abs_tol=FLOAT_TOLERANCE)
+        except TypeError:
+            return False
+    if isinstance(actual, list) and isinstance(expected, list):
+        return len(actual) == len(expected) and all(outputs_match(a, e, mode) for a, e in zip(actual, expected))
+    return actual == expected
+
+def case_size(case: dict) -> int:
+    return len(json.dumps(case["input"]))
+
+def evaluate(problem_folder: str, cases: List[dict], results: Dict[str, dict]) -> dict:
+    """Checks every solution's outputs against the expected ones (or the oracle's)."""
+    compare = load_meta(problem_folder).get("compare", "exact")
+    oracle = results.get(ORACLE)
+    summary = {"total": len(cases), "solutions": {}, "examples": [], "failures": []}
+    example_results: Dict[int, dict] = {}
+
+    for solution_type, result in results.items():
+        passed, failed, seconds = 0, 0, 0.0
+        for index, case in enumerate(cases):
+            outcome = result["results"][index] if result["ok"] and index < len(result["results"]) else None
+            expected = case.get("output")
+            if case.get("has_output") is False:
+                oracle_outcome = oracle["results"][index] if oracle and oracle["ok"] and index < len(oracle["results"]) else None
+                expected = oracle_outcome["output"] if oracle_outcome and oracle_outcome["ok"] else None
+                if oracle_outcome is None or not oracle_outcome["ok"] or solution_type == ORACLE:
+                    # Nothing to judge against: only count crashes.
+                    expected = outcome["output"] if outcome and outcome["ok"] else None
+
+            ok = outcome is not None and outcome["ok"] and outputs_match(outcome["output"], expected, compare)
+            if outcome is not None and outcome["seconds"] is not None:
+                seconds += outcome["seconds"]
+            if ok:
+                passed += 1
+            else:
+                failed += 1
+                summary["failures"].append({
+                    "solution": solution_type,
+                    "source": case["source"],
+                    "input": case["input"],
+                    "expected": expected,
+                    "got": outcome["output"] if outcome and outcome["ok"] else None,
+                    "error": (outcome or {}).get("error") or result["error"],
+                    "size": case_size(case),
+                })
+            if "example" in case:
+                example_results.setdefault(case["example"], {})[solution_type] = ok
+        summary["solutions"][solution_type] = {"passed": passed, "failed": failed, "seconds": round(seconds, 6)}
+
+    examples = [case for case in cases if "example" in case]
+    summary["examples"] = [example_results.get(case["example"], {}) for case in examples]
+    return summary
+
+def run_tests(folders: List[str], runner: SolutionRunner, timeout: float,
+              stress: int = 0, stress_size: int = 100, seed: int = 0) -> Dict[str, dict]:
+    """Runs every problem's Python solutions over its cases in one batch across the pool."""
+    jobs, owners, problem_cases = [], [], {}
+    for problem_folder in folders:
+        paths = python_solution_paths(problem_folder)
+        if not paths:
+            continue
+        cases = load_cases(problem_folder)
+        try:
+            cases += stress_cases(problem_folder, stress, stress_size, seed)
+        except (ValueError, TypeError) as e:
+            print(f"⚠️ {os.path.basename(problem_folder)}: no stress cases ({e})")
+        if not cases:
+            continue
+        problem_cases[problem_folder] = cases
+        for solution_type, path in paths.items():
+            jobs.append({"path": path, "cases": [case["input"] for case in cases], "timeout": timeout})
+            owners.append((problem_folder, solution_type))
+
+    grouped: Dict[str, Dict[str, dict]] = {}
+    for (problem_folder, solution_type), result in zip(owners, runner.run_many(jobs)):
+        grouped.setdefault(problem_folder, {})[solution_type] = result
+
+    return {
+        problem_folder: evaluate(problem_folder, problem_cases[problem_folder], results)
+        for problem_folder, results in grouped.items()
+    }
+
+def smallest_failure(summary: dict, solution_type: str) -> Optional[dict]:
+    """The failing case with the smallest input among those run; inputs are not shrunk further."""
+    failures = [failure for failure in summary["failures"] if failure["solution"] == solution_type]
+    return min(failures, key=lambda failure: failure["size"]) if failures else None
+
+def save_summary(problem_folder: str, summary: dict):
+    """
+    Stores pass/fail counts and timings in the problem's test results file. It is
+    not committed and not built into the UI: the viewer loads it when the problem
+    is opened, so a run never rewrites tracked files or triggers a rebuild.
+    """
+    write_json(os.path.join(problem_folder, TEST_RESULTS_FILE), {
+        "last_run": datetime.now().isoformat(timespec="seconds"),
+        "total": summary["total"],
+        "solutions": summary["solutions"],
+        "examples": summary["examples"],
+    })
+
+def print_summary(problem_folder: str, summary: dict) -> int:
+    meta_data = load_meta(problem_folder)
+    print(f"\n🧪 #{meta_data['problem_number']} {meta_data['title']}: {summary['total']} case(s)")
+    failing = 0
+    for solution_type, counts in summary["solutions"].items():
+        status = "✅" if counts["failed"] == 0 else "❌"
+        print(f"   - {status} {solution_type:<18} {counts['passed']} passed, {counts['failed']} failed "
+              f"({counts['seconds'] * 1000:.2f} ms)")
+        failure = smallest_failure(summary, solution_type)
+        if failure:
+            failing += 1
+            print(f"       smallest failing input found ({failure['source']}): {json.dumps(failure['input'])}")
+            if failure["error"]:
+                print(f"       error:    {failure['error']}")
+            else:
+                print(f"       expected: {json.dumps(failure['expected'])}")
+                print(f"       got:      {json.dumps(failure['got'])}")
+    return failing
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run user_solution and leetcode_solution over README examples and tests.jsonl, "
+                    "using leetcode_solution as the oracle where no output is given.",
+        epilog="Example: python tools/test_solutions.py --all -j 4",
+    )
+    parser.add_argument("problem_number", nargs="?")
+    parser.add_argument("--all", action="store_true", help="test every problem with Python solutions")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds per solution file")
+    parser.add_argument("--stress", type=int, default=0, metavar="COUNT",
+                        help="also run COUNT random cases generated from the signature and meta.json constraints")
+    parser.add_argument("--stress-size", type=int, default=100, help="largest stress input size")
+    parser.add_argument("--seed", type=int, default=0, help="first random seed for stress cases")
+    parser.add_argument("--no-update", action="store_true",
+                        help="don't save the results to test_results.json")
+    options = parser.parse_args()
+    if not options.all and not options.problem_number:
+        parser.error("give a problem number or --all")
+
+    folders = problem_folders() if options.all else [resolve_problem(options.problem_number)]
+    with SolutionRunner(workers=options.jobs) as runner:
+        summaries = run_tests(folders, runner, options.timeout, options.stress, options.stress_size, options.seed)
+
+    failing = 0
+    for problem_folder, summary in summaries.items():
+        failing += print_summary(problem_folder, summary)
+        if not options.no_update:
+            save_summary(problem_folder, summary)
+
+    if not summaries:
+        print("⚠️ No problems with Python solutions and test cases found.")
+
+    print(f"\n{'❌' if failing else '✅'} {failing} failing solution(s) across {len(summaries)} problem(s).")
+    sys.exit(1 if failing else 0)
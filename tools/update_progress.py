@@ -1,16 +1,59 @@
 import os
 import sys
+import gzip
 import json
-from typing import Optional, Dict
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from typing import Optional, Dict, Iterable, List, Tuple
 
-# Define base directories
-PROBLEMS_DIR = "problems"
-TEMPLATES_DIR = "templates"
+try:
+    import brotli
+except ImportError:  # Optional: .br payloads are only written when it is installed.
+    brotli = None
 
-def parse_readme(readme_path: str) -> Dict[str, str]:
+import core
+from bench_history import performance_section, results_fingerprint
+from core import CONFIG_PATH, PROBLEMS_DIR, TEMPLATES_DIR
+from db import update_db_entries, update_db_entry
+from fileio import Batch, problem_lock
+from problem_index import (
+    file_signature,
+    find_problem_folder,
+    problem_folders,
+    update_index_entry,
+    update_index_entries,
+)
+from readme_parser import find_section, parse_file, parse_text
+from spans import span, take_trace_option
+
+# Records the content hash of every input used to render each problem's UI,
+# so bulk rebuilds can skip problems whose inputs did not change. One SQLite row
+# per problem, so rebuilding a single problem reads and writes only its own entry.
+MANIFEST_PATH = os.path.join("tools", ".build_manifest.sqlite3")
+# Bumped whenever the set of recorded inputs changes, forcing one full rebuild.
+MANIFEST_VERSION = 4
+# config.json "ui_output": "tsx" injects the data into a copy of the master template
+# (the default); "data" writes only ui/data.json (plus .gz/.br) for the viewer to
+# fetch and render with the shared master template.
+UI_OUTPUTS = ("tsx", "data")
+UI_TEMPLATE_FILE = "ProblemViewTemplate.tsx"
+UI_DATA_FILE = "data.json"
+# profile_solution.py saves <solution type>.json reports (and .folded stacks) here,
+# inside the problem folder.
+PROFILES_DIR = "profiles"
+# test_solutions.py keeps the latest pass/fail results here, inside the problem
+# folder. Not committed: results depend on the machine and the last run.
+TEST_RESULTS_FILE = "test_results.json"
+
+def parse_examples(content: str) -> List[Dict[str, str]]:
+    """Extracts LeetCode-style "Example N" Input/Output/Explanation blocks from README text."""
+    return parse_text(content)["examples"]
+
+def parse_readme(readme_path: str) -> Dict[str, object]:
     """
     Parses the README.md file to extract content.
-    Uses robust string splitting to handle variable whitespace.
+    The file is read in a single streaming pass (see readme_parser.py).
     """
     # Default values if parsing fails or file doesn't exist
     data = {
@@ -18,102 +61,112 @@ def parse_readme(readme_path: str) -> Dict[str, str]:
         "approach": "Approach not found in README.md.",
         "timeComplexity": "O(?)",
         "spaceComplexity": "O(?)",
-        "notes": ""
+        "notes": "",
+        "examples": []
     }
 
     if not os.path.exists(readme_path):
         return data
 
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Helper to extract text between two markers
-    def get_section(text, start_marker, end_marker=None):
-        try:
-            if start_marker not in text:
-                return ""
-            # Split after the start marker
-            part = text.split(start_marker)[1]
-            # If there's an end marker, split before it
-            if end_marker and end_marker in part:
-                return part.split(end_marker)[0].strip()
-            # Otherwise, take everything until the next standard header or end of string
-            # This logic handles cases where "Notes" might be the last section
-            return part.split('\n## ')[0].strip()
-        except Exception:
-            return ""
+    document = parse_file(readme_path)
+    sections = document["sections"]
 
     # Extract Main Sections
-    data["statement"] = get_section(content, "## Problem Description")
-    data["approach"] = get_section(content, "## Approach")
+    data["statement"] = find_section(sections, "Problem Description")
+    data["approach"] = find_section(sections, "Approach")
     
     # Extract Notes (Looking for a generic Notes header, or defaulting to empty)
-    data["notes"] = get_section(content, "## Notes")
+    data["notes"] = find_section(sections, "Notes")
 
-    # Extract Complexity (Line by line parsing for precision)
-    for line in content.split('\n'):
-        if "- **Time:**" in line:
-            data["timeComplexity"] = line.split("- **Time:**")[1].strip()
-        elif "- **Space:**" in line:
-            data["spaceComplexity"] = line.split("- **Space:**")[1].strip()
+    # Extract Complexity bullets
+    data["timeComplexity"] = document["time"] or data["timeComplexity"]
+    data["spaceComplexity"] = document["space"] or data["spaceComplexity"]
 
+    data["examples"] = document["examples"]
     return data
 
-def find_problem_folder(problem_number: str) -> Optional[str]:
-    padded_number = f"{int(problem_number):04d}"
-    for folder_name in os.listdir(PROBLEMS_DIR):
-        if folder_name.startswith(padded_number):
-            return os.path.join(PROBLEMS_DIR, folder_name)
-    return None
-
 def read_file_content(file_path: str, default_content: str = "") -> str:
     if not os.path.exists(file_path):
         return default_content
     with open(file_path, "r", encoding="utf-8") as f:
         return f.read()
 
-def update_problem(problem_number: str, updates: dict):
-    """
-    The main function to update a problem's metadata and rebuild its UI template.
-    """
-    problem_folder = find_problem_folder(problem_number)
-    if not problem_folder:
-        print(f"❌ Error: Problem {problem_number} not found in '{PROBLEMS_DIR}/'")
-        return
+def load_config() -> dict:
+    """Loads the language configuration from config.json."""
+    return core.load_config()
 
-    meta_path = os.path.join(problem_folder, "meta.json")
-    if not os.path.exists(meta_path):
-        print(f"❌ Error: meta.json not found for problem {problem_number}.")
-        return
+def master_template_path(template_name: str) -> str:
+    return os.path.join(TEMPLATES_DIR, template_name, UI_TEMPLATE_FILE)
+
+def solution_paths(problem_folder: str, meta_data: dict, config: dict) -> Dict[str, Dict[str, str]]:
+    """Maps language -> solution type -> solution file path for a problem."""
+    paths = {}
+    for lang in meta_data.get("languages", []):
+        lang_details = config["languages"].get(lang)
+        if not lang_details:
+            continue
 
-    # --- 1. Update Metadata ---
-    with open(meta_path, "r", encoding="utf-8") as f:
-        meta_data = json.load(f)
+        ext = lang_details["ext"]
+        lang_folder = os.path.join(problem_folder, lang)
+        paths[lang] = {
+            "user_solution": os.path.join(lang_folder, f"user_solution.{ext}"),
+            "leetcode_solution": os.path.join(lang_folder, f"leetcode_solution.{ext}")
+        }
+    return paths
 
-    for key, value in updates.items():
-        # Handle nested keys like 'links.leetcode'
-        if '.' in key:
-            parent_key, child_key = key.split('.', 1)
-            
-            # Robust Logic: Create parent dictionary if it doesn't exist
-            if parent_key not in meta_data or not isinstance(meta_data.get(parent_key), dict):
-                meta_data[parent_key] = {}
-            
-            meta_data[parent_key][child_key] = value
-            print(f"   - Updated '{key}' to '{value}'")
-            
-        elif key in meta_data:
-            meta_data[key] = value
-            print(f"   - Updated '{key}' to '{value}'")
-        else:
-            print(f"   - ⚠️  Warning: Key '{key}' not found in meta.json. Skipping.")
+def profile_paths(problem_folder: str) -> Dict[str, str]:
+    return {
+        solution_type: os.path.join(problem_folder, PROFILES_DIR, f"{solution_type}.json")
+        for solution_type in ("user_solution", "leetcode_solution")
+    }
 
-    # --- 2. Aggregate All Problem Data ---
-    
-    # Parse the README content
-    readme_path = os.path.join(problem_folder, "README.md")
-    readme_data = parse_readme(readme_path)
-    print("   - 📝 Parsed README.md content.")
+def test_results_path(problem_folder: str) -> str:
+    return os.path.join(problem_folder, TEST_RESULTS_FILE)
+
+def load_test_results(problem_folder: str) -> Optional[dict]:
+    path = test_results_path(problem_folder)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def attach_test_results(final_data: dict, tests: Optional[dict]) -> dict:
+    """
+    Adds test_solutions.py results to aggregated data for outputs that are not
+    committed (the static export): the summary as "tests", and each example's
+    pass/fail as its "results" when the run covered the current examples.
+    """
+    if not tests:
+        return final_data
+    final_data = dict(final_data, tests=tests)
+    example_results = tests.get("examples", [])
+    if len(example_results) == len(final_data["examples"]):
+        final_data["examples"] = [
+            dict(example, results=results) for example, results in zip(final_data["examples"], example_results)
+        ]
+    return final_data
+
+def load_profiles(problem_folder: str, python_paths: Dict[str, str]) -> Dict[str, dict]:
+    """
+    Saved profile_solution.py reports of the Python solutions. A report is dropped
+    when its solution file changed since it was profiled.
+    """
+    profiles = {}
+    for solution_type, report_path in profile_paths(problem_folder).items():
+        solution_path = python_paths.get(solution_type)
+        if not solution_path or not os.path.exists(report_path):
+            continue
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        signature = file_signature(solution_path)
+        if signature and report.get("file_hash") == signature[2]:
+            profiles[solution_type] = report
+    return profiles
+
+def aggregate_problem_data(problem_folder: str, meta_data: dict, config: dict) -> dict:
+    """Merges meta.json, the parsed README and all solution files into one dict."""
+    with span("readme_parse"):
+        readme_data = parse_readme(os.path.join(problem_folder, "README.md"))
 
     # Start with metadata and merge in README data
     final_data = meta_data.copy()
@@ -122,57 +175,393 @@ def update_problem(problem_number: str, updates: dict):
     final_data["timeComplexity"] = readme_data["timeComplexity"]
     final_data["spaceComplexity"] = readme_data["spaceComplexity"]
     final_data["notes"] = readme_data["notes"]
-    final_data["examples"] = [] # Placeholder for future example parsing
-    
+    final_data["examples"] = readme_data["examples"]
+
+    # Test results are machine-local: the viewer loads test_results.json itself, so
+    # they never end up in the committed UI. Older versions stored them in meta.json.
+    final_data.pop("tests", None)
+
     # Load code solutions
     final_data["code"] = {}
-    config_path = os.path.join("tools", "config.json")
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    paths = solution_paths(problem_folder, meta_data, config)
+    with span("code_read"):
+        for lang, files in paths.items():
+            final_data["code"][lang] = {
+                solution_type: read_file_content(path) for solution_type, path in files.items()
+            }
 
-    for lang in meta_data.get("languages", []):
-        lang_details = config["languages"].get(lang)
-        if not lang_details:
-            continue
-        
-        ext = lang_details["ext"]
-        lang_folder = os.path.join(problem_folder, lang)
+    # Latest stored benchmark results (benchmark.py --save) of the Python solutions.
+    with span("results_load"):
+        try:
+            performance = performance_section(problem_folder, paths.get("python", {}))
+        except Exception as e:
+            # Optional section: a bad record must not stop the problem from rendering.
+            print(f"⚠️ Warning: No performance section for {os.path.basename(problem_folder)}: "
+                  f"{type(e).__name__}: {e}")
+            performance = None
+        if performance:
+            final_data["performance"] = performance
+        profiles = load_profiles(problem_folder, paths.get("python", {}))
+        if profiles:
+            final_data["profiles"] = profiles
+    return final_data
 
-        final_data["code"][lang] = {
-            "user_solution": read_file_content(os.path.join(lang_folder, f"user_solution.{ext}")),
-            "leetcode_solution": read_file_content(os.path.join(lang_folder, f"leetcode_solution.{ext}"))
-        }
+def ui_output(config: dict) -> str:
+    mode = config.get("ui_output", "tsx")
+    if mode not in UI_OUTPUTS:
+        raise ValueError(f"config.json 'ui_output' must be one of {', '.join(UI_OUTPUTS)}, not '{mode}'")
+    return mode
 
-    # --- 3. Inject Data into the UI Template ---
-    master_template_path = os.path.join(TEMPLATES_DIR, meta_data["template"], "ProblemViewTemplate.tsx")
-    if not os.path.exists(master_template_path):
-        print(f"❌ Error: Master template not found at {master_template_path}")
-        return
+def ui_output_path(problem_folder: str, config: dict) -> str:
+    """The generated file the viewer loads for a problem in the configured output mode."""
+    file_name = UI_DATA_FILE if ui_output(config) == "data" else UI_TEMPLATE_FILE
+    return os.path.join(problem_folder, "ui", file_name)
 
-    template_content = read_file_content(master_template_path)
-    
+def write_payload(path: str, final_data: dict, batch: Batch):
+    """Stages the problem data as compact JSON, plus precompressed copies for static hosting."""
+    with span("json_serialize"):
+        payload = json.dumps(final_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with span("compress"):
+        # mtime=0 keeps the .gz byte-identical across rebuilds of unchanged data.
+        compressed = {".gz": gzip.compress(payload, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed[".br"] = brotli.compress(payload)
+    with span("write"):
+        batch.write(path, payload)
+        for suffix, content in compressed.items():
+            batch.write(path + suffix, content)
+
+def write_ui(problem_folder: str, template_content: str, final_data: dict, config: dict,
+             batch: Optional[Batch] = None) -> str:
+    """
+    Writes the problem's UI output (rendered TSX or data payload) and returns its path.
+    Pass a `batch` to commit it together with other files; unchanged files are never rewritten.
+    """
+    if batch is None:
+        with Batch() as batch:
+            return write_ui(problem_folder, template_content, final_data, config, batch)
+
+    output_path = ui_output_path(problem_folder, config)
+    if ui_output(config) == "data":
+        write_payload(output_path, final_data, batch)
+    else:
+        rendered = render_template(template_content, final_data)
+        with span("write"):
+            batch.write(output_path, rendered)
+        # The viewer prefers a data payload, so drop one left over from data mode.
+        data_path = os.path.join(problem_folder, "ui", UI_DATA_FILE)
+        for stale in (data_path, data_path + ".gz", data_path + ".br"):
+            batch.remove(stale)
+    return output_path
+
+def render_template(template_content: str, final_data: dict) -> str:
+    """Injects the aggregated problem data into a master template."""
     # Convert data to JSON and Escape for JavaScript
-    injected_json = json.dumps(final_data, indent=2)
-    js_safe_json = injected_json.replace('\\', '\\\\').replace('`', '\\`').replace('$', '\\$')
+    with span("json_serialize"):
+        injected_json = json.dumps(final_data, indent=2)
+        js_safe_json = injected_json.replace('\\', '\\\\').replace('`', '\\`').replace('$', '\\$')
 
     # Replace the placeholder
-    final_template_content = template_content.replace("`__PROBLEM_DATA__`", f"`{js_safe_json}`")
+    with span("template_inject"):
+        return template_content.replace("`__PROBLEM_DATA__`", f"`{js_safe_json}`")
 
-    # --- 4. Write the Updated Files ---
-    
-    # Write the UI file
-    problem_ui_path = os.path.join(problem_folder, "ui", "ProblemViewTemplate.tsx")
-    with open(problem_ui_path, "w", encoding="utf-8") as f:
-        f.write(final_template_content)
-    print(f"   - 🎨 Rebuilt UI template at: {problem_ui_path}")
-    
-    # Save the updated metadata
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta_data, f, indent=4)
-    print(f"   - 🗂️  Saved updates to meta.json")
+# --- BUILD MANIFEST ---
+
+def connect_manifest() -> sqlite3.Connection:
+    conn = sqlite3.connect(MANIFEST_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode = WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != MANIFEST_VERSION:
+        # Entries recorded under another version are simply dropped (one full rebuild).
+        conn.execute("DROP TABLE IF EXISTS builds")
+        conn.execute(f"PRAGMA user_version = {MANIFEST_VERSION}")
+    conn.execute("CREATE TABLE IF NOT EXISTS builds (folder TEXT PRIMARY KEY, entry TEXT NOT NULL)")
+    return conn
+
+def load_manifest(names: Optional[List[str]] = None) -> Dict[str, dict]:
+    """
+    Returns the manifest entries keyed by problem folder name: every entry, or
+    only those of `names`, which are looked up one row at a time.
+    """
+    entries = {}
+    try:
+        with closing(connect_manifest()) as conn:
+            if names is None:
+                rows = conn.execute("SELECT folder, entry FROM builds").fetchall()
+            else:
+                rows = [row for name in names
+                        for row in conn.execute("SELECT folder, entry FROM builds WHERE folder = ?", (name,))]
+    except sqlite3.Error as e:
+        print(f"⚠️ Warning: Could not read {MANIFEST_PATH}: {e}")
+        return entries
+    for name, entry in rows:
+        try:
+            entries[name] = json.loads(entry)
+        except ValueError:
+            continue
+    return entries
+
+def save_manifest(entries: Dict[str, dict], removed: Iterable[str] = ()):
+    """
+    Writes `entries` (rows whose content did not change are left alone) and
+    deletes the rows of `removed`. Other problems' rows are never touched, so
+    concurrent runs don't drop each other's entries.
+    """
+    try:
+        with closing(connect_manifest()) as conn, conn:
+            conn.executemany(
+                "INSERT INTO builds (folder, entry) VALUES (?, ?) "
+                "ON CONFLICT(folder) DO UPDATE SET entry = excluded.entry WHERE entry != excluded.entry",
+                [(name, json.dumps(entry, sort_keys=True)) for name, entry in entries.items()],
+            )
+            conn.executemany("DELETE FROM builds WHERE folder = ?", [(name,) for name in removed])
+    except sqlite3.Error as e:
+        print(f"⚠️ Warning: Could not update {MANIFEST_PATH}: {e} (the next --all run rebuilds more than it needs)")
+
+def problem_input_paths(problem_folder: str, meta_data: dict, config: dict) -> List[str]:
+    """Every file whose content ends up in the problem's rendered UI."""
+    paths = [
+        os.path.join(problem_folder, "meta.json"),
+        os.path.join(problem_folder, "README.md"),
+        CONFIG_PATH,
+        master_template_path(meta_data.get("template", "")),
+    ]
+    for files in solution_paths(problem_folder, meta_data, config).values():
+        paths.extend(files.values())
+    paths.extend(profile_paths(problem_folder).values())
+    return paths
+
+def is_up_to_date(entry: Optional[dict], problem_folder: str) -> bool:
+    """
+    Checks a manifest entry against the filesystem. Only stats are compared here;
+    files whose stat changed are re-hashed so a bare `touch` does not force a rebuild.
+    """
+    if not entry:
+        return False
+    output = entry.get("output_path", os.path.join(problem_folder, "ui", UI_TEMPLATE_FILE))
+    if file_signature(output, entry.get("output")) != entry.get("output"):
+        return False
+    if entry.get("results") != results_fingerprint(os.path.basename(problem_folder)):
+        return False
+    for path, previous in entry["inputs"].items():
+        current = file_signature(path, previous)
+        if current is None or previous is None:
+            if current != previous:
+                return False
+        elif current[2] != previous[2]:
+            return False
+        else:
+            # Content is unchanged; remember the new stat to keep the fast path fast.
+            entry["inputs"][path] = current
+    return True
+
+def record_build(manifest: Dict[str, dict], problem_folder: str, meta_data: dict, config: dict):
+    """Stores the signatures of a freshly rendered problem's inputs and output."""
+    previous = manifest.get(os.path.basename(problem_folder), {})
+    previous_inputs = previous.get("inputs", {})
+    inputs = {
+        path: file_signature(path, previous_inputs.get(path))
+        for path in problem_input_paths(problem_folder, meta_data, config)
+    }
+    output = ui_output_path(problem_folder, config)
+    manifest[os.path.basename(problem_folder)] = {
+        "inputs": inputs,
+        "output_path": output,
+        "output": file_signature(output),
+        "results": results_fingerprint(os.path.basename(problem_folder)),
+    }
+
+def list_problem_folders() -> List[str]:
+    """Returns every problem folder that has a meta.json, in problem-number order."""
+    return [folder for folder in problem_folders() if os.path.isfile(os.path.join(folder, "meta.json"))]
+
+def update_problem(problem_number: str, updates: dict):
+    """
+    The main function to update a problem's metadata and rebuild its UI template.
+    """
+    with span("update_problem", problem=str(problem_number)):
+        _update_problem(problem_number, updates)
+
+def _update_problem(problem_number: str, updates: dict):
+    with span("problem_lookup"):
+        problem_folder = find_problem_folder(problem_number)
+    if not problem_folder:
+        print(f"❌ Error: Problem {problem_number} not found in '{PROBLEMS_DIR}/'")
+        return
+
+    # Held until meta.json and the UI are both written, so concurrent runs can't interleave.
+    with problem_lock(problem_folder):
+        meta_path = os.path.join(problem_folder, "meta.json")
+        if not os.path.exists(meta_path):
+            print(f"❌ Error: meta.json not found for problem {problem_number}.")
+            return
+
+        # --- 1. Update Metadata ---
+        with span("meta_load"), open(meta_path, "r", encoding="utf-8") as f:
+            meta_data = json.load(f)
+
+        for key, value in updates.items():
+            # Handle nested keys like 'links.leetcode'
+            if '.' in key:
+                parent_key, child_key = key.split('.', 1)
+            
+                # Robust Logic: Create parent dictionary if it doesn't exist
+                if parent_key not in meta_data or not isinstance(meta_data.get(parent_key), dict):
+                    meta_data[parent_key] = {}
+            
+                meta_data[parent_key][child_key] = value
+                print(f"   - Updated '{key}' to '{value}'")
+            
+            elif key in meta_data:
+                meta_data[key] = value
+                print(f"   - Updated '{key}' to '{value}'")
+            else:
+                print(f"   - ⚠️  Warning: Key '{key}' not found in meta.json. Skipping.")
+
+        # --- 2. Aggregate All Problem Data ---
+        with span("config_load"):
+            config = load_config()
+        final_data = aggregate_problem_data(problem_folder, meta_data, config)
+        print("   - 📝 Parsed README.md content.")
+
+        # --- 3. Inject Data into the UI Template ---
+        template_path = master_template_path(meta_data["template"])
+        if not os.path.exists(template_path):
+            print(f"❌ Error: Master template not found at {template_path}")
+            return
+
+        # --- 4. Write the Updated Files ---
+        with span("template_load"):
+            template_content = read_file_content(template_path)
+        with Batch() as batch:
+            # Write the UI file (or its data payload, see UI_OUTPUTS)
+            problem_ui_path = write_ui(problem_folder, template_content, final_data, config, batch)
+            # Save the updated metadata
+            with span("meta_write"):
+                batch.write_json(meta_path, meta_data)
+        print(f"   - 🎨 Rebuilt UI at: {problem_ui_path}")
+        print(f"   - 🗂️  Saved updates to meta.json")
+        with span("index_update"):
+            update_index_entry(problem_folder, meta_data)
+            update_db_entry(problem_folder, meta_data)
+
+        # Keep the build manifest in sync so a later `--all` run can skip this problem.
+        with span("manifest"):
+            manifest = load_manifest([os.path.basename(problem_folder)])
+            record_build(manifest, problem_folder, meta_data, config)
+            save_manifest(manifest)
 
     print(f"\n✅ Successfully updated Problem #{problem_number}: {meta_data['title']}")
 
+def load_master_templates() -> Dict[str, str]:
+    """Reads every master template once, keyed by template folder name."""
+    return core.master_templates(UI_TEMPLATE_FILE)
+
+# Shared state for rebuild workers. Set once per process by `_init_worker` so the
+# config and master templates are not re-read (or re-pickled) for every problem.
+_worker_config: dict = {}
+_worker_templates: Dict[str, str] = {}
+
+def _init_worker(config: dict, templates: Dict[str, str]):
+    global _worker_config, _worker_templates
+    _worker_config = config
+    _worker_templates = templates
+
+def _render_problem(problem_folder: str) -> Tuple[str, Optional[dict], str]:
+    """
+    Rebuilds a single problem's UI using the shared config and templates.
+    Returns (problem_folder, meta_data or None on failure, message).
+    """
+    folder_name = os.path.basename(problem_folder)
+    with span("render_problem", problem=folder_name), problem_lock(problem_folder):
+        return _render_one(problem_folder, folder_name)
+
+def _render_one(problem_folder: str, folder_name: str) -> Tuple[str, Optional[dict], str]:
+    try:
+        with span("meta_load"), open(os.path.join(problem_folder, "meta.json"), "r", encoding="utf-8") as f:
+            meta_data = json.load(f)
+
+        template_name = meta_data.get("template", "")
+        template_content = _worker_templates.get(template_name)
+        if template_content is None:
+            return problem_folder, None, f"❌ {folder_name}: master template '{template_name}' not found."
+
+        final_data = aggregate_problem_data(problem_folder, meta_data, _worker_config)
+        problem_ui_path = write_ui(problem_folder, template_content, final_data, _worker_config)
+    except Exception as e:
+        return problem_folder, None, f"❌ {folder_name}: {type(e).__name__}: {e}"
+    return problem_folder, meta_data, f"   - 🎨 Rebuilt {problem_ui_path}"
+
+def rebuild_problems(folders: List[str], force: bool = False, jobs: int = 1, prune: bool = False) -> Dict[str, int]:
+    """
+    Re-renders the UI of those `folders` whose inputs changed since the last build.
+    Config and master templates are loaded a single time and shared with `jobs`
+    worker processes. Results are reported in folder order. Returns the counts
+    of rebuilt, unchanged and failed problems. `prune` drops manifest entries of
+    problems not in `folders`.
+    """
+    names = [os.path.basename(problem_folder) for problem_folder in folders]
+    with span("manifest"):
+        # Bulk runs read the whole table in one query; a few problems look up their own rows.
+        manifest = load_manifest(None if prune or len(names) > 64 else names)
+
+    with span("up_to_date_check", problems=len(folders)):
+        stale = [
+            problem_folder for problem_folder in folders
+            if force or not is_up_to_date(manifest.get(os.path.basename(problem_folder)), problem_folder)
+        ]
+    counts = {"rebuilt": 0, "skipped": len(folders) - len(stale), "failed": 0}
+    index_updates = []
+
+    if stale:
+        with span("config_load"):
+            config = load_config()
+            templates = load_master_templates()
+
+        if jobs > 1 and len(stale) > 1:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(config, templates)) as pool:
+                # map() yields in submission order, keeping the output deterministic.
+                chunksize = max(1, len(stale) // (jobs * 4))
+                results = list(pool.map(_render_problem, stale, chunksize=chunksize))
+        else:
+            _init_worker(config, templates)
+            results = [_render_problem(problem_folder) for problem_folder in stale]
+
+        for problem_folder, meta_data, message in results:
+            print(message)
+            if meta_data is None:
+                counts["failed"] += 1
+                continue
+            with span("manifest"):
+                record_build(manifest, problem_folder, meta_data, config)
+            index_updates.append((problem_folder, meta_data))
+            counts["rebuilt"] += 1
+
+    with span("manifest"):
+        wanted = set(names)
+        save_manifest({name: entry for name, entry in manifest.items() if name in wanted},
+                      removed=[name for name in manifest if name not in wanted] if prune else ())
+    with span("index_update"):
+        update_index_entries(index_updates)
+        update_db_entries(index_updates)
+    return counts
+
+def rebuild_all(force: bool = False, jobs: int = 1) -> Dict[str, int]:
+    """
+    Walks every problem once and rebuilds the ones whose inputs changed (see
+    rebuild_problems). Returns the counts of rebuilt, unchanged and failed problems.
+    """
+    with span("rebuild_all"):
+        return _rebuild_all(force, jobs)
+
+def _rebuild_all(force: bool, jobs: int) -> Dict[str, int]:
+    with span("problem_listing"):
+        all_folders = list_problem_folders()
+
+    # Also drops entries for problems that no longer exist.
+    counts = rebuild_problems(all_folders, force=force, jobs=jobs, prune=True)
+    print(f"\n✅ Rebuilt {counts['rebuilt']} problem(s), {counts['skipped']} unchanged, {counts['failed']} failed.")
+    return counts
+
 def parse_value(value: str):
     """Converts string command-line arguments into Python types."""
     if value.lower() == "true": return True
@@ -181,11 +570,26 @@ def parse_value(value: str):
     return value
 
 if __name__ == "__main__":
+    # --trace (to stderr) or --trace=FILE writes JSON-lines timings of each phase (see spans.py).
+    sys.argv[1:] = take_trace_option(sys.argv[1:])
     if len(sys.argv) < 2: # Changed check to 2 to allow running without extra args just to rebuild
-        print("\nUsage: python tools/update_progress.py <problem_number> [<key>=<value>...]")
+        print("\nUsage: python tools/update_progress.py <problem_number> [<key>=<value>...] [--trace[=FILE]]")
+        print("       python tools/update_progress.py --all [--force] [-j N] [--trace[=FILE]]")
         print("Example: python tools/update_progress.py 1 solved=true")
         sys.exit(1)
 
+    if sys.argv[1] in ("--all", "--changed"):
+        options = sys.argv[2:]
+        jobs = 1
+        if "-j" in options:
+            try:
+                jobs = int(options[options.index("-j") + 1])
+            except (IndexError, ValueError):
+                print("❌ Error: -j expects a number of worker processes, e.g. -j 8")
+                sys.exit(1)
+        counts = rebuild_all(force="--force" in options, jobs=max(1, jobs))
+        sys.exit(1 if counts["failed"] else 0)
+
     problem_number_arg = sys.argv[1]
     
     updates_dict = {}
@@ -1,73 +1,205 @@
 import os
 import shutil
 import sys
+import json
 import filecmp
+import hashlib
 from datetime import datetime
 
-TEMPLATES_DIR = "templates"
-PROBLEMS_DIR = "problems"
+from core import PLACEHOLDER, PROBLEMS_DIR, TEMPLATES_DIR
+from fileio import append_line, locked, problem_lock, write_json
+from problem_index import file_signature, load_index, problem_folders
+
 LOG_FILE = os.path.join("tools", "update_template.log")
+# Remembers the content hash of every template file and what was last installed
+# into each problem, so unchanged problems are skipped without reading any file.
+MANIFEST_PATH = os.path.join("tools", ".template_manifest.json")
+MANIFEST_VERSION = 2
+# Files containing core.PLACEHOLDER are filled in per problem and are always copied.
+LINK_MODES = ("copy", "hard", "sym")
+# The static files in the ui/ folder of each problem using the template are always
+# hardlinked: a symlink would make their relative imports resolve inside templates/.
+UI_FOLDER = "ui"
+UI_LINK = "hard"
 
 def log(message):
     """Append logs with timestamp."""
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(f"[{datetime.now().isoformat(sep=' ', timespec='seconds')}] {message}\n")
+    append_line(LOG_FILE, f"[{datetime.now().isoformat(sep=' ', timespec='seconds')}] {message}")
+
+def load_manifest() -> dict:
+    empty = {"version": MANIFEST_VERSION, "templates": {}, "problems": {}}
+    if not os.path.exists(MANIFEST_PATH):
+        return empty
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    return manifest if manifest.get("version") == MANIFEST_VERSION else empty
+
+def save_manifest(manifest: dict):
+    write_json(MANIFEST_PATH, manifest, indent=1, sort_keys=True)
+
+def scan_template(template_name, previous):
+    """
+    Returns ({relative path: signature}, tree hash, set of static relative paths)
+    for a master template. Files are only re-hashed when their stat changed.
+    """
+    src_dir = os.path.join(TEMPLATES_DIR, template_name)
+    files = {}
+    for root, _, names in os.walk(src_dir):
+        for name in names:
+            rel_path = os.path.relpath(os.path.join(root, name), src_dir)
+            files[rel_path] = file_signature(os.path.join(src_dir, rel_path), previous.get(rel_path))
+
+    tree = hashlib.sha1("".join(f"{rel}\0{sig[2]}\n" for rel, sig in sorted(files.items())).encode()).hexdigest()
+    static = set()
+    for rel_path in files:
+        with open(os.path.join(src_dir, rel_path), "rb") as f:
+            if PLACEHOLDER.encode() not in f.read():
+                static.add(rel_path)
+    return files, tree, static
+
+def install_file(src_file, dest_file, mode):
+    """Copies, hardlinks or symlinks `src_file` to `dest_file`. Returns the mode actually used."""
+    # Built under a temporary name and renamed over the destination, so readers never see a
+    # missing or half-copied file. Renaming also replaces an existing hardlink instead of
+    # writing through it, which would modify the master template.
+    temp_file = os.path.join(os.path.dirname(dest_file), f".{os.path.basename(dest_file)}.{os.getpid()}.tmp")
+    if os.path.lexists(temp_file):
+        os.remove(temp_file)
+    used = "copy"
+    if mode == "hard":
+        try:
+            os.link(src_file, temp_file)
+            used = "hard"
+        except OSError:
+            pass  # e.g. a different filesystem; fall back to a copy.
+    elif mode == "sym":
+        try:
+            os.symlink(os.path.relpath(src_file, os.path.dirname(dest_file)), temp_file)
+            used = "sym"
+        except OSError:
+            pass
+    if used == "copy":
+        shutil.copy2(src_file, temp_file)
+    os.replace(temp_file, dest_file)
+    return used
+
+def install_files(src_dir, dest_dir, files, modes, previous_files, adopt):
+    """
+    Installs `files` from `src_dir` into `dest_dir`, each with its mode in `modes`,
+    and removes the previously installed files the template no longer has.
+    Returns ({relative path: [sha1, requested mode]}, whether anything changed).
+    """
+    recorded = {}
+    updated = False
+    for rel_path, signature in sorted(files.items()):
+        src_file = os.path.join(src_dir, rel_path)
+        dest_file = os.path.join(dest_dir, rel_path)
+        mode = modes[rel_path]
+
+        # Recorded as [sha1, requested mode]; a link that fell back to a copy is not retried every run.
+        if previous_files.get(rel_path) == [signature[2], mode] and os.path.lexists(dest_file):
+            recorded[rel_path] = previous_files[rel_path]
+            continue
+        if adopt and mode == "copy" and os.path.isfile(dest_file) and not os.path.islink(dest_file) \
+                and filecmp.cmp(src_file, dest_file, shallow=False):
+            # Copied before the manifest existed; adopt it instead of rewriting it.
+            recorded[rel_path] = [signature[2], "copy"]
+            continue
 
-def copy_template_to_problem(template_name, problem_path):
-    """Copy updated template into a problem folder."""
+        os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+        used = install_file(src_file, dest_file, mode)
+        recorded[rel_path] = [signature[2], mode]
+        updated = True
+        log(f"Updated {dest_file} ({used})")
+
+    # Files removed from the master template are removed from the problem too.
+    for rel_path in set(previous_files) - set(files):
+        dest_file = os.path.join(dest_dir, rel_path)
+        if os.path.lexists(dest_file):
+            os.remove(dest_file)
+            updated = True
+            log(f"Removed {dest_file}")
+    return recorded, updated
+
+def copy_template_to_problem(template_name, problem_path, files, tree, static, manifest, link="copy", uses_template=False):
+    """
+    Copy updated template into a problem folder. When the problem renders with
+    this template (`uses_template`), the static files of its ui/ folder are also
+    hardlinked to the master template.
+    """
     src_dir = os.path.join(TEMPLATES_DIR, template_name)
     dest_dir = os.path.join(problem_path, "templates", template_name)
+    installed = manifest["problems"].setdefault(os.path.basename(problem_path), {})
+    entry = installed.get(template_name)
 
-    if not os.path.exists(src_dir):
-        print(f"❌ Template '{template_name}' not found in {TEMPLATES_DIR}/")
+    # Fast path: same template tree, same link mode, destination still there.
+    if entry and entry["tree"] == tree and entry["link"] == link and os.path.isdir(dest_dir) \
+            and bool(entry["ui"]) == (uses_template and bool(static)):
         return False
 
-    os.makedirs(dest_dir, exist_ok=True)
+    recorded, updated = install_files(
+        src_dir, dest_dir, files, {rel_path: link if rel_path in static else "copy" for rel_path in files},
+        entry["files"] if entry else {}, adopt=not entry,
+    )
+    ui_files = {rel_path: files[rel_path] for rel_path in static} if uses_template else {}
+    ui_recorded, ui_updated = install_files(
+        src_dir, os.path.join(problem_path, UI_FOLDER), ui_files, {rel_path: UI_LINK for rel_path in ui_files},
+        entry["ui"] if entry else {}, adopt=False,
+    )
 
-    updated = False
-    for root, _, files in os.walk(src_dir):
-        rel_root = os.path.relpath(root, src_dir)
-        for file in files:
-            src_file = os.path.join(root, file)
-            dest_file = os.path.join(dest_dir, rel_root, file) if rel_root != "." else os.path.join(dest_dir, file)
-
-            os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-
-            # Only replace if changed
-            if not os.path.exists(dest_file) or not filecmp.cmp(src_file, dest_file, shallow=False):
-                shutil.copy2(src_file, dest_file)
-                updated = True
-                log(f"Updated {dest_file}")
-    return updated
-
-def update_template_in_all_problems(template_name):
+    installed[template_name] = {"tree": tree, "link": link, "files": recorded, "ui": ui_recorded}
+    return updated or ui_updated
+
+def update_template_in_all_problems(template_name, link="copy", force=False):
     """Iterate through all problem folders and update templates."""
     if not os.path.exists(PROBLEMS_DIR):
         print("⚠️ No problems directory found. Nothing to update.")
         return
+    if not os.path.exists(os.path.join(TEMPLATES_DIR, template_name)):
+        print(f"❌ Template '{template_name}' not found in {TEMPLATES_DIR}/")
+        return
 
     print(f"🔁 Updating template '{template_name}' across all problems...")
-    updated_count = 0
-
-    for folder in os.listdir(PROBLEMS_DIR):
-        problem_path = os.path.join(PROBLEMS_DIR, folder)
-        if not os.path.isdir(problem_path):
-            continue
-
-        if copy_template_to_problem(template_name, problem_path):
-            updated_count += 1
+    with locked("template-manifest"):
+        manifest = load_manifest()
+        if force:
+            manifest["problems"] = {}
+        files, tree, static = scan_template(template_name, manifest["templates"].get(template_name, {}))
+        manifest["templates"][template_name] = files
+
+        users = {entry["folder"] for entry in load_index().values() if entry.get("template") == template_name}
+        updated_count = 0
+        for problem_path in problem_folders():
+            uses_template = os.path.basename(problem_path) in users
+            with problem_lock(problem_path):
+                if copy_template_to_problem(template_name, problem_path, files, tree, static, manifest, link, uses_template):
+                    updated_count += 1
+        save_manifest(manifest)
 
     print(f"✅ Template '{template_name}' updated in {updated_count} problem(s).")
     log(f"Template '{template_name}' updated in {updated_count} problem(s).")
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python tools/update_template.py <template_name>")
+        print("Usage: python tools/update_template.py <template_name> [--link hard|sym] [--force]")
         print("Example: python tools/update_template.py problem-view")
         sys.exit(1)
 
     template_name = sys.argv[1]
-    update_template_in_all_problems(template_name)
+    options = sys.argv[2:]
+    link = "copy"
+    if "--link" in options:
+        try:
+            link = options[options.index("--link") + 1]
+        except IndexError:
+            link = None
+        if link not in LINK_MODES:
+            print(f"❌ Error: --link expects one of: {', '.join(LINK_MODES)}")
+            sys.exit(1)
+    update_template_in_all_problems(template_name, link=link, force="--force" in options)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,244 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import argparse
+import ctypes
+import ctypes.util
+from typing import Dict, List, Set, Tuple
+
+from problem_index import load_index
+from update_progress import CONFIG_PATH, PROBLEMS_DIR, TEMPLATES_DIR, rebuild_problems
+
+# A burst of saves (an editor writing a temp file and renaming it, a `git checkout`)
+# is collected until the tree has been quiet for DEBOUNCE seconds, but never
+# held back for longer than MAX_DELAY.
+DEBOUNCE = 0.1
+MAX_DELAY = 1.0
+POLL_INTERVAL = 0.5
+
+# Folders inside a problem that hold generated output, never inputs.
+OUTPUT_DIRS = {"ui", "templates", "__pycache__", "node_modules"}
+
+# --- inotify (Linux), through ctypes so no extra package is needed ---
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+def _watched_dirs(root: str):
+    """Every directory under `root` that can hold rendering inputs."""
+    for dirpath, dirnames, _ in os.walk(root):
+        in_problem_folder = os.path.dirname(os.path.normpath(dirpath)) == PROBLEMS_DIR
+        skip = OUTPUT_DIRS if in_problem_folder else {"__pycache__", "node_modules"}
+        dirnames[:] = [d for d in dirnames if d not in skip and not d.startswith(".")]
+        yield dirpath
+
+class InotifyWatcher:
+    """Watches directory trees with one inotify watch per directory."""
+
+    def __init__(self, roots: List[str]):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths: Dict[int, str] = {}
+        self.overflowed = False
+        for root in roots:
+            for directory in _watched_dirs(root):
+                self._add_watch(directory)
+
+    def _add_watch(self, directory: str):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC:
+                raise OSError(error, "inotify watch limit reached (see fs.inotify.max_user_watches)")
+            return  # The directory vanished before it could be watched.
+        self.paths[wd] = directory
+
+    def poll(self, timeout: float) -> List[str]:
+        """Waits up to `timeout` seconds and returns the paths that changed."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        changed = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; the caller falls back to checking everything.
+                self.overflowed = True
+                continue
+            if mask & IN_IGNORED:
+                self.paths.pop(wd, None)
+                continue
+            directory = self.paths.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # A new problem folder (or language folder): watch it and report what is already inside.
+                for new_directory in _watched_dirs(path):
+                    self._add_watch(new_directory)
+                    changed.extend(os.path.join(new_directory, entry) for entry in os.listdir(new_directory))
+            changed.append(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Fallback for platforms without inotify: compares (mtime, size) snapshots."""
+
+    def __init__(self, roots: List[str], interval: float = POLL_INTERVAL):
+        self.roots = roots
+        self.interval = interval
+        self.overflowed = False
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.roots:
+            for directory in _watched_dirs(root):
+                try:
+                    entries = list(os.scandir(directory))
+                except OSError:
+                    continue
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            st = entry.stat()
+                            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        return snapshot
+
+    def poll(self, timeout: float) -> List[str]:
+        time.sleep(min(timeout, self.interval))
+        current = self._scan()
+        changed = [path for path, signature in current.items() if self.snapshot.get(path) != signature]
+        changed.extend(path for path in self.snapshot if path not in current)
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+def make_watcher(roots: List[str], force_polling: bool = False):
+    if not force_polling:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️ inotify unavailable ({e}); polling every {POLL_INTERVAL}s instead.")
+    return PollingWatcher(roots)
+
+# --- MAPPING CHANGES TO PROBLEMS ---
+
+def affected_problems(paths: List[str], index: Dict[str, dict]) -> Tuple[Set[str], bool]:
+    """
+    Maps changed paths to the problem folders whose UI depends on them.
+    Returns (folders, everything) where `everything` means every problem is affected.
+    """
+    folders: Set[str] = set()
+    for path in paths:
+        name = os.path.basename(path)
+        if name.startswith(".") and name.endswith(".tmp"):
+            continue  # A staged write (see fileio.py); its rename reports the real file.
+        parts = os.path.normpath(path).split(os.sep)
+        if os.path.normpath(path) == os.path.normpath(CONFIG_PATH):
+            return set(), True
+        if parts[0] == PROBLEMS_DIR and len(parts) >= 3:
+            if parts[2] in OUTPUT_DIRS:
+                continue
+            folders.add(os.path.join(PROBLEMS_DIR, parts[1]))
+        elif parts[0] == TEMPLATES_DIR and len(parts) >= 3:
+            # A master template edit fans out to every problem that uses it.
+            folders.update(
+                os.path.join(PROBLEMS_DIR, entry["folder"])
+                for entry in index.values() if entry.get("template") == parts[1]
+            )
+    return {folder for folder in folders if os.path.isfile(os.path.join(folder, "meta.json"))}, False
+
+def collect_changes(watcher) -> List[str]:
+    """Blocks until something changes, then keeps collecting until the burst settles."""
+    changed = []
+    while not changed:
+        changed = watcher.poll(3600)
+    deadline = time.monotonic() + MAX_DELAY
+    while time.monotonic() < deadline:
+        more = watcher.poll(DEBOUNCE)
+        if not more:
+            break
+        changed.extend(more)
+    return changed
+
+def watch(force_polling: bool = False, jobs: int = 1):
+    roots = [PROBLEMS_DIR, TEMPLATES_DIR, os.path.dirname(CONFIG_PATH)]
+    watcher = make_watcher([root for root in roots if os.path.isdir(root)], force_polling)
+    backend = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+    print(f"👀 Watching {', '.join(roots)} ({backend}). Press Ctrl+C to stop.")
+
+    # Bring everything up to date once, so later events only touch what changed.
+    counts = rebuild_problems(sorted(os.path.join(PROBLEMS_DIR, entry["folder"]) for entry in load_index().values()),
+                              jobs=jobs)
+    print(f"✅ Ready: {counts['rebuilt']} rebuilt, {counts['skipped']} up to date.")
+
+    try:
+        while True:
+            changed = collect_changes(watcher)
+            start = time.perf_counter()
+            index = load_index()
+            folders, everything = affected_problems(changed, index)
+            if everything or watcher.overflowed:
+                watcher.overflowed = False
+                folders = {os.path.join(PROBLEMS_DIR, entry["folder"]) for entry in index.values()}
+            if not folders:
+                continue
+
+            counts = rebuild_problems(sorted(folders), jobs=jobs)
+            if counts["rebuilt"] or counts["failed"]:
+                elapsed = (time.perf_counter() - start) * 1000
+                status = "❌" if counts["failed"] else "✅"
+                print(f"{status} {time.strftime('%H:%M:%S')} rebuilt {counts['rebuilt']}, "
+                      f"failed {counts['failed']} in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching.")
+    finally:
+        watcher.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild a problem's UI whenever its README, solutions, meta.json, template or the config change.",
+        epilog="Example: python tools/watch.py",
+    )
+    parser.add_argument("--poll", action="store_true", help="poll for changes instead of using inotify")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="worker processes for large fan-outs such as template edits")
+    options = parser.parse_args()
+    watch(force_polling=options.poll, jobs=max(1, options.jobs))
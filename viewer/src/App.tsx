@@ -3,31 +3,89 @@
 import React from 'react';
 import { BrowserRouter as Router, Routes, Route, Link } from 'react-router-dom';
 import ProblemViewer from './ProblemViewer';
+import { loadSearchIndex, search, type SearchHit } from './search';
+// Maintained by the tools/ scripts (create_problem.py, update_progress.py).
+import problemIndex from '../../problems/index.json';
+
+// One entry per problem in problems/index.json.
+type IndexEntry = {
+  number: number;
+  folder: string;
+  title: string;
+  difficulty: string;
+  tags: string[];
+  solved: boolean;
+};
+
+const problems: IndexEntry[] = Object.values(problemIndex.problems as Record<string, IndexEntry>)
+  .sort((a, b) => a.number - b.number);
+
+// Ranked full-text search when `tools/search.py --export` has been run, title match otherwise.
+function useSearch(query: string): IndexEntry[] {
+  const [hits, setHits] = React.useState<SearchHit[] | null>(null);
+  React.useEffect(() => {
+    if (!query.trim()) {
+      setHits(null);
+      return;
+    }
+    let cancelled = false;
+    loadSearchIndex().then((index) => {
+      if (!cancelled) setHits(index ? search(index, query) : null);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [query]);
+
+  if (!query.trim()) return problems;
+  if (hits === null) {
+    const needle = query.toLowerCase();
+    return problems.filter((problem) => problem.title.toLowerCase().includes(needle));
+  }
+  const byFolder = new Map(problems.map((problem) => [problem.folder, problem]));
+  return hits.map((hit) => byFolder.get(hit.folder)).filter((problem): problem is IndexEntry => !!problem);
+}
 
 // We'll create a simple component for the home page.
-const HomePage = () => (
-  <div style={{ padding: '2rem 4rem', fontFamily: 'sans-serif', lineHeight: '1.6' }}>
-    <h1>Coding Problem Viewer</h1>
-    <p>This is the central application for viewing your dynamically generated problem UIs.</p>
-    <p>
-      To view a problem, construct a URL with its folder name (slug). For example, to view the "Two Sum" problem, you would navigate to:
-      <br />
-      <code style={{ background: '#eee', padding: '2px 6px', borderRadius: '4px' }}>
-        /view/0001_two-sum
-      </code>
-    </p>
-    <hr style={{ margin: '2rem 0' }} />
-    <h3>Quick Links (Examples)</h3>
-    <ul style={{ listStyle: 'none', padding: 0 }}>
-      <li>
-        <Link to="/view/0001_two-sum" style={{ color: '#007bff' }}>
-          View Problem #1: Two Sum
-        </Link>
-      </li>
-      {/* You could add more links here as you solve more problems */}
-    </ul>
-  </div>
-);
+const HomePage = () => {
+  const [query, setQuery] = React.useState('');
+  const matches = useSearch(query);
+
+  return (
+    <div style={{ padding: '2rem 4rem', fontFamily: 'sans-serif', lineHeight: '1.6' }}>
+      <h1>Coding Problem Viewer</h1>
+      <p>This is the central application for viewing your dynamically generated problem UIs.</p>
+      <p>
+        To view a problem, construct a URL with its folder name (slug). For example, to view the "Two Sum" problem, you would navigate to:
+        <br />
+        <code style={{ background: '#eee', padding: '2px 6px', borderRadius: '4px' }}>
+          /view/0001_two-sum
+        </code>
+      </p>
+      <hr style={{ margin: '2rem 0' }} />
+      <h3>Problems ({problems.length})</h3>
+      <input
+        type="search"
+        value={query}
+        onChange={(event) => setQuery(event.target.value)}
+        placeholder="Search statements, approaches, notes and code..."
+        style={{ width: '100%', maxWidth: '32rem', padding: '6px 10px', marginBottom: '1rem' }}
+      />
+      <ul style={{ listStyle: 'none', padding: 0 }}>
+        {matches.map((problem) => (
+          <li key={problem.folder}>
+            <Link to={`/view/${problem.folder}`} style={{ color: '#007bff' }}>
+              #{problem.number}: {problem.title}
+            </Link>{' '}
+            <span style={{ color: '#666', fontSize: '0.9em' }}>
+              ({problem.difficulty}{problem.solved ? ', solved' : ''})
+            </span>
+          </li>
+        ))}
+      </ul>
+    </div>
+  );
+};
 
 // This is the main App component that defines the routes.
 const App: React.FC = () => {
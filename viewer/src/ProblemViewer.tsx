@@ -7,25 +7,80 @@ import { useParams } from 'react-router-dom';
 // what a dynamically imported React component looks like.
 type LazyComponent = React.LazyExoticComponent<React.ComponentType<any>>;
 
+// A master template module; its `ProblemView` renders a problem from plain data.
+type TemplateModule = { ProblemView: React.ComponentType<{ data: any; tests?: any }> };
+
+// Problems built with `"ui_output": "data"` only ship a ui/data.json payload.
+// These globs resolve to URLs at build time; nothing is fetched until a problem is opened.
+const dataUrls = import.meta.glob('../../problems/*/ui/data.json', {
+  query: '?url',
+  import: 'default',
+  eager: true,
+}) as Record<string, string>;
+const templates = import.meta.glob('../../templates/*/ProblemViewTemplate.tsx') as Record<string, () => Promise<TemplateModule>>;
+// Problems built in the default mode carry their own generated component.
+const generatedViews = import.meta.glob('../../problems/*/ui/ProblemViewTemplate.tsx');
+// Latest `test_solutions.py` results. Machine-local and not committed, so they are
+// fetched when a problem is opened instead of being built into its UI.
+const testResultUrls = import.meta.glob('../../problems/*/test_results.json', {
+  query: '?url',
+  import: 'default',
+  eager: true,
+}) as Record<string, string>;
+
+async function loadTestResults(slug: string): Promise<any> {
+  const url = testResultUrls[`../../problems/${slug}/test_results.json`];
+  if (!url) {
+    return undefined;
+  }
+  try {
+    const response = await fetch(url);
+    return response.ok ? await response.json() : undefined;
+  } catch {
+    return undefined;
+  }
+}
+
+function loadProblem(slug: string): LazyComponent {
+  const dataUrl = dataUrls[`../../problems/${slug}/ui/data.json`];
+  if (!dataUrl) {
+    const generated = generatedViews[`../../problems/${slug}/ui/ProblemViewTemplate.tsx`];
+    return React.lazy(async () => {
+      if (!generated) {
+        return { default: () => <div>Error: Problem "{slug}" has not been built yet.</div> };
+      }
+      const [{ default: View }, tests] = await Promise.all([
+        generated() as Promise<{ default: React.ComponentType<{ tests?: any }> }>,
+        loadTestResults(slug),
+      ]);
+      return { default: () => <View tests={tests} /> };
+    });
+  }
+
+  return React.lazy(async () => {
+    const [data, tests] = await Promise.all([fetch(dataUrl).then((response) => response.json()), loadTestResults(slug)]);
+    const loadTemplate = templates[`../../templates/${data.template}/ProblemViewTemplate.tsx`];
+    if (!loadTemplate) {
+      return { default: () => <div>Error: Template "{data.template}" not found.</div> };
+    }
+    const { ProblemView } = await loadTemplate();
+    return { default: () => <ProblemView data={data} tests={tests} /> };
+  });
+}
+
 const ProblemViewer: React.FC = () => {
   // This hook from react-router-dom reads the dynamic parts of the URL.
   // If the URL is "/view/0001_two-sum", the 'slug' will be "0001_two-sum".
   const { slug } = useParams<{ slug: string }>();
 
-  if (!slug) {
+  // `React.lazy` only loads the problem when it is first rendered. Memoised per
+  // slug so re-renders don't restart the load.
+  const ProblemComponent = React.useMemo(() => (slug ? loadProblem(slug) : null), [slug]);
+
+  if (!slug || !ProblemComponent) {
     return <div>Error: No problem slug was found in the URL.</div>;
   }
 
-  // This is the magic!
-  // `React.lazy` combined with a dynamic import() tells React to only load this file
-  // when it's needed. The `@problems` alias we created in the Vite config is used here
-  // to construct the correct path to the problem's UI file.
-
-
-  const ProblemComponent = React.lazy(() => 
-  import(`../../problems/${slug}/ui/ProblemViewTemplate.tsx`)
-  ) as LazyComponent;
-
   return (
     <div>
       {/* A <Suspense> boundary is required when using React.lazy. */}
@@ -49,4 +104,4 @@ const ProblemViewer: React.FC = () => {
   );
 };
 
-export default ProblemViewer;
\ No newline at end of file
+export default ProblemViewer;
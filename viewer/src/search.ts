@@ -0,0 +1,84 @@
+// viewer/src/search.ts
+//
+// Client-side ranked search over the index written by `python tools/search.py --export`.
+// The tokenizer and BM25 scoring mirror tools/search.py so results match the CLI.
+
+type CompactIndex = {
+  version: number;
+  k1: number;
+  b: number;
+  // [folder, number, title, difficulty, weighted length]
+  docs: [string, number, string, string, number][];
+  // term -> [doc position, frequency, doc position, frequency, ...]
+  terms: Record<string, number[]>;
+};
+
+export type SearchHit = { folder: string; number: number; title: string; score: number };
+
+const STOPWORDS = new Set([
+  "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if", "in", "is", "it", "its",
+  "of", "on", "or", "that", "the", "this", "to", "we", "with", "you", "your", "i", "my", "can",
+  "self", "def", "return", "class", "solution", "none", "true", "false", "int", "str", "list",
+  "public", "var", "new",
+]);
+
+const WORD = /[A-Za-z_][A-Za-z0-9_]*|\d+/g;
+const IDENTIFIER_PART = /[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+/g;
+
+function stem(term: string): string {
+  if (term.length > 4 && term.endsWith("ies")) return term.slice(0, -3) + "y";
+  if (term.length > 3 && term.endsWith("s") && !term.endsWith("ss")) return term.slice(0, -1);
+  return term;
+}
+
+export function tokenize(text: string): string[] {
+  const terms: string[] = [];
+  for (const word of text.match(WORD) ?? []) {
+    const parts = word.split("_").flatMap((piece) => piece.match(IDENTIFIER_PART) ?? []);
+    const whole = word.toLowerCase().replace(/^_+|_+$/g, "");
+    const candidates = parts.length <= 1 ? [whole] : [whole, ...parts.map((part) => part.toLowerCase())];
+    for (const term of candidates) {
+      if (term.length > 1 && !STOPWORDS.has(term)) terms.push(stem(term));
+    }
+  }
+  return terms;
+}
+
+let indexPromise: Promise<CompactIndex | null> | null = null;
+
+// Fetched once, on the first search. Resolves to null when no index was exported.
+export function loadSearchIndex(): Promise<CompactIndex | null> {
+  indexPromise ??= fetch("/search-index.json")
+    .then((response) => (response.ok ? response.json() : null))
+    .catch(() => null);
+  return indexPromise;
+}
+
+export function search(index: CompactIndex, query: string, limit = 20): SearchHit[] {
+  const docCount = index.docs.length;
+  if (!docCount) return [];
+  const averageLength = index.docs.reduce((total, doc) => total + doc[4], 0) / docCount || 1;
+  const scores = new Map<number, number>();
+
+  for (const term of new Set(tokenize(query))) {
+    const postings = index.terms[term];
+    if (!postings) continue;
+    const frequencyCount = postings.length / 2;
+    const idf = Math.log(1 + (docCount - frequencyCount + 0.5) / (frequencyCount + 0.5));
+    for (let i = 0; i < postings.length; i += 2) {
+      const position = postings[i];
+      const frequency = postings[i + 1];
+      const norm = index.k1 * (1 - index.b + (index.b * index.docs[position][4]) / averageLength);
+      const score = (idf * frequency * (index.k1 + 1)) / (frequency + norm);
+      scores.set(position, (scores.get(position) ?? 0) + score);
+    }
+  }
+
+  return [...scores.entries()]
+    .sort((a, b) => b[1] - a[1] || index.docs[a[0]][1] - index.docs[b[0]][1])
+    .slice(0, limit)
+    .map(([position, score]) => {
+      const [folder, number, title] = index.docs[position];
+      return { folder, number, title, score };
+    });
+}